@@ -0,0 +1,13 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+WarmupState = Literal["pending", "running", "done", "timeout", "failed", "disabled"]
+
+
+class CacheWarmupStatusDTO(BaseModel):
+    status: WarmupState
+    ready: bool
+    products_warmed: int
+    pages_warmed: int
+    duration_seconds: float
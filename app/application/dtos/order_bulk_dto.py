@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field, field_validator
+
+from app.application.dtos.order_dto import OrderInputDTO, OrderResponseDTO
+
+MAX_ORDERS_PER_BULK_REQUEST = 5000
+
+
+class OrderBulkInputDTO(BaseModel):
+    orders: list[OrderInputDTO] = Field(..., max_length=MAX_ORDERS_PER_BULK_REQUEST)
+
+    @field_validator("orders")
+    @classmethod
+    def validate_orders(cls, v):
+        if not v:
+            raise ValueError("A lista de pedidos não pode estar vazia")
+        return v
+
+
+class OrderBulkResultDTO(BaseModel):
+    # Posição do pedido em `orders` na requisição
+    index: int
+    created: bool
+    order: OrderResponseDTO | None = None
+    reason: str | None = None
+
+
+class OrderBulkResponseDTO(BaseModel):
+    created: int
+    failed: int
+    results: list[OrderBulkResultDTO]
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class OrderQueueStatsDTO(BaseModel):
+    queued: int
+    processing: int
+    done: int
+    dead: int
+    workers: int
+    running: bool
+    processed: int
+    retried: int
+    dead_lettered: int
+    uptime_seconds: float
+    throughput_per_second: float
@@ -0,0 +1,47 @@
+from pydantic import BaseModel, Field, field_validator
+
+from app.domain.enums.order_status import OrderStatus
+
+MAX_STATUS_TRANSITIONS_PER_REQUEST = 5000
+
+
+class OrderStatusTransitionInputDTO(BaseModel):
+    order_id: int
+    status: OrderStatus
+
+    @field_validator("order_id")
+    @classmethod
+    def validate_order_id(cls, v):
+        if v <= 0:
+            raise ValueError("order_id deve ser maior que zero")
+        return v
+
+
+class OrderStatusBatchInputDTO(BaseModel):
+    transitions: list[OrderStatusTransitionInputDTO] = Field(
+        ..., max_length=MAX_STATUS_TRANSITIONS_PER_REQUEST
+    )
+
+    @field_validator("transitions")
+    @classmethod
+    def validate_transitions(cls, v):
+        if not v:
+            raise ValueError("A lista de transições não pode estar vazia")
+        order_ids = [transition.order_id for transition in v]
+        if len(order_ids) != len(set(order_ids)):
+            raise ValueError("Cada pedido pode aparecer apenas uma vez por requisição")
+        return v
+
+
+class OrderStatusTransitionResultDTO(BaseModel):
+    order_id: int
+    from_status: str | None = None
+    to_status: str
+    applied: bool
+    reason: str | None = None
+
+
+class OrderStatusBatchResponseDTO(BaseModel):
+    applied: int
+    rejected: int
+    results: list[OrderStatusTransitionResultDTO]
@@ -3,6 +3,8 @@ from decimal import Decimal
 
 
 class CreateProductDTO:
+    __slots__ = ("name", "description", "price", "quantity")
+
     def __init__(
         self,
         name: str,
@@ -17,6 +19,8 @@ class CreateProductDTO:
 
 
 class ProductResponseDTO:
+    __slots__ = ("id", "name", "description", "price", "quantity", "created_at", "updated_at")
+
     def __init__(
         self,
         id: int,
@@ -45,3 +49,11 @@ class ProductResponseDTO:
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+class ProductBatchResponseDTO:
+    __slots__ = ("products", "missing_ids")
+
+    def __init__(self, products: list[ProductResponseDTO], missing_ids: list[int]):
+        self.products = products
+        self.missing_ids = missing_ids
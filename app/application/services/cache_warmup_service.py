@@ -0,0 +1,141 @@
+import asyncio
+import functools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from app.application.dtos.cache_warmup_dto import CacheWarmupStatusDTO, WarmupState
+from app.core.cache.access_tracker import AccessTracker
+from app.core.utils import chunked
+from app.domain.repositories.order_item_repository import OrderItemRepository
+from app.domain.repositories.product_repository import ProductRepository
+
+logger = logging.getLogger(__name__)
+
+PageLoader = Callable[[], Awaitable[object]]
+
+
+class CacheWarmupService:
+    """Service class for preloading caches at startup."""
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        order_item_repository: OrderItemRepository,
+        access_tracker: AccessTracker,
+        product_limit: int = 500,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        timeout_seconds: float = 10.0,
+        snapshot_path: str | None = None,
+    ):
+        self.product_repository = product_repository
+        self.order_item_repository = order_item_repository
+        self.access_tracker = access_tracker
+        self.product_limit = product_limit
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.timeout_seconds = timeout_seconds
+        self.snapshot_path = snapshot_path
+
+        self._status: WarmupState = "pending"
+        self._products_warmed = 0
+        self._pages_warmed = 0
+        self._duration = 0.0
+
+    def load_snapshot(self) -> None:
+        """Carrega as frequências de acesso gravadas no último desligamento."""
+        if self.snapshot_path:
+            loaded = self.access_tracker.load(self.snapshot_path)
+            logger.info(f"Snapshot de acessos carregado: {loaded} produtos")
+
+    def save_snapshot(self) -> None:
+        """Grava as frequências de acesso deste processo para o próximo warm-up."""
+        if not self.snapshot_path or len(self.access_tracker) == 0:
+            return
+        try:
+            self.access_tracker.save(self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar snapshot de acessos: {str(e)}")
+
+    async def hot_product_ids(self) -> list[int]:
+        """Produtos mais acessados (snapshot) seguidos dos mais vendidos, sem repetição."""
+        recent = self.access_tracker.top(self.product_limit)
+        try:
+            top_sellers = await self.order_item_repository.get_top_product_ids(self.product_limit)
+        except Exception as e:
+            logger.warning(f"Falha ao obter mais vendidos para warm-up: {str(e)}")
+            top_sellers = []
+        return list(dict.fromkeys([*recent, *top_sellers]))[: self.product_limit]
+
+    async def _warm_products(self, product_ids: list[int]) -> None:
+        products = await self.product_repository.get_bulk_by_ids(product_ids)
+        self._products_warmed += len(products)
+
+    async def _warm_page(self, loader: PageLoader) -> None:
+        await loader()
+        self._pages_warmed += 1
+
+    async def run(self, page_loaders: list[PageLoader] | None = None) -> CacheWarmupStatusDTO:
+        """
+        Pré-carrega produtos quentes e páginas de listagem concorrentemente.
+
+        Limitado a `timeout_seconds`: ao estourar, o que já foi carregado permanece em cache
+        e o serviço é considerado pronto do mesmo jeito.
+        """
+        self._status = "running"
+        self._products_warmed = 0
+        self._pages_warmed = 0
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(step: Callable[[], Awaitable[None]]) -> None:
+            # A coroutine só é criada com a vaga: etapas que não chegaram a começar não deixam
+            # coroutines nunca aguardadas quando o warm-up é cancelado ou estoura o prazo
+            async with semaphore:
+                await step()
+
+        async def warm() -> None:
+            product_ids = await self.hot_product_ids()
+            steps = [
+                functools.partial(self._warm_products, list(batch))
+                for batch in chunked(product_ids, self.batch_size)
+            ]
+            steps += [functools.partial(self._warm_page, loader) for loader in page_loaders or []]
+            results = await asyncio.gather(
+                *(bounded(step) for step in steps), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Etapa de warm-up falhou: {str(result)}")
+
+        try:
+            await asyncio.wait_for(warm(), timeout=self.timeout_seconds)
+            self._status = "done"
+        except asyncio.TimeoutError:
+            logger.warning(f"Warm-up interrompido após {self.timeout_seconds}s")
+            self._status = "timeout"
+        except Exception as e:
+            logger.error(f"Erro no warm-up de caches: {str(e)}", exc_info=True)
+            self._status = "failed"
+        self._duration = time.monotonic() - started
+        logger.info(
+            f"Warm-up {self._status}: {self._products_warmed} produtos, "
+            f"{self._pages_warmed} páginas em {self._duration:.3f}s"
+        )
+        return self.get_status()
+
+    def mark_disabled(self) -> None:
+        self._status = "disabled"
+
+    def is_ready(self) -> bool:
+        return self._status not in ("pending", "running")
+
+    def get_status(self) -> CacheWarmupStatusDTO:
+        return CacheWarmupStatusDTO(
+            status=self._status,
+            ready=self.is_ready(),
+            products_warmed=self._products_warmed,
+            pages_warmed=self._pages_warmed,
+            duration_seconds=round(self._duration, 3),
+        )
@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from app.application.dtos.order_queue_dto import OrderQueueStatsDTO
+from app.domain.entities.order_job_entity import OrderJobEntity
+from app.domain.enums.order_job_status import OrderJobStatus
+from app.domain.enums.order_status import FULFILLMENT_FLOW, OrderStatus
+from app.domain.repositories.order_job_repository import OrderJobRepository
+from app.domain.repositories.order_repository import OrderRepository
+
+logger = logging.getLogger(__name__)
+
+_PREVIOUS_STATUS: dict[OrderStatus, OrderStatus] = {
+    target: source for source, target in FULFILLMENT_FLOW.items()
+}
+
+
+class OrderQueueService:
+    """Service class for the background order processing queue."""
+
+    def __init__(
+        self,
+        order_job_repository: OrderJobRepository,
+        order_repository: OrderRepository,
+        workers: int = 2,
+        batch_size: int = 50,
+        poll_interval_seconds: float = 1.0,
+        lease_seconds: int = 30,
+        max_attempts: int = 5,
+        retry_backoff_seconds: float = 2.0,
+        retry_backoff_max_seconds: float = 300.0,
+    ):
+        self.order_job_repository = order_job_repository
+        self.order_repository = order_repository
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.retry_backoff_max_seconds = retry_backoff_max_seconds
+
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+        self._started_at: float | None = None
+        self._processed = 0
+        self._retried = 0
+        self._dead_lettered = 0
+
+    async def enqueue_order(self, order_id: int) -> OrderJobEntity:
+        """Enfileira a primeira etapa de fulfilment de um pedido recém-criado."""
+        return await self.order_job_repository.enqueue(
+            OrderJobEntity(
+                order_id=order_id,
+                target_status=FULFILLMENT_FLOW[OrderStatus.PENDING].value,
+            )
+        )
+
+    async def enqueue_orders(self, order_ids: list[int]) -> int:
+        """Enfileira a primeira etapa de vários pedidos em uma única transação."""
+        target_status = FULFILLMENT_FLOW[OrderStatus.PENDING].value
+        return await self.order_job_repository.enqueue_bulk(
+            [
+                OrderJobEntity(order_id=order_id, target_status=target_status)
+                for order_id in order_ids
+            ]
+        )
+
+    async def run_once(self) -> int:
+        """Reivindica e processa um lote de jobs. Retorna a quantidade de jobs reivindicados."""
+        jobs = await self.order_job_repository.claim_batch(self.batch_size, self.lease_seconds)
+        if not jobs:
+            return 0
+
+        try:
+            errors, skipped = await self._apply_transitions(jobs)
+        except Exception as e:
+            logger.warning(f"Falha ao aplicar transições do lote: {str(e)}")
+            for job in jobs:
+                await self._fail(job, str(e))
+            return len(jobs)
+
+        for job in jobs:
+            try:
+                if job.id in errors:
+                    await self.order_job_repository.dead_letter(job.id, errors[job.id])
+                    self._dead_lettered += 1
+                else:
+                    next_job = None if job.id in skipped else self._next_job(job)
+                    await self.order_job_repository.complete(job.id, next_job)
+                    self._processed += 1
+            except Exception as e:
+                logger.warning(f"Falha ao finalizar job {job.id}: {str(e)}")
+                await self._fail(job, str(e))
+        return len(jobs)
+
+    async def _apply_transitions(
+        self, jobs: list[OrderJobEntity]
+    ) -> tuple[dict[int, str], set[int]]:
+        """
+        Aplica as transições do lote com UPDATEs agrupados por (status atual, status alvo).
+
+        Retorna o motivo, por id de job, das falhas que não se resolvem com novas tentativas e
+        os ids dos jobs encerrados sem próxima etapa (pedido cancelado no meio do fulfilment).
+        """
+        groups: dict[tuple[str, str], list[int]] = defaultdict(list)
+        errors: dict[int, str] = {}
+        skipped: set[int] = set()
+        for job in jobs:
+            source = _PREVIOUS_STATUS.get(OrderStatus(job.target_status))
+            if source is None:
+                errors[job.id] = f"Status alvo sem etapa de fulfilment: {job.target_status}"
+                continue
+            groups[(source.value, job.target_status)].append(job.order_id)
+
+        moved = await self.order_repository.bulk_update_status(dict(groups)) if groups else set()
+
+        not_moved = [job for job in jobs if job.id not in errors and job.order_id not in moved]
+        if not_moved:
+            current = await self.order_repository.get_statuses([job.order_id for job in not_moved])
+            for job in not_moved:
+                order_status = current.get(job.order_id)
+                if order_status is None:
+                    errors[job.id] = f"Pedido {job.order_id} não encontrado"
+                elif order_status == OrderStatus.CANCELLED.value:
+                    skipped.add(job.id)
+                # Lease expirado e job reexecutado: a transição já foi aplicada antes
+                elif order_status != job.target_status:
+                    errors[job.id] = (
+                        f"Pedido {job.order_id} em {order_status}, "
+                        f"esperado {_PREVIOUS_STATUS[OrderStatus(job.target_status)].value}"
+                    )
+        return errors, skipped
+
+    @staticmethod
+    def _next_job(job: OrderJobEntity) -> OrderJobEntity | None:
+        next_status = FULFILLMENT_FLOW.get(OrderStatus(job.target_status))
+        if next_status is None:
+            return None
+        return OrderJobEntity(order_id=job.order_id, target_status=next_status.value)
+
+    async def _fail(self, job: OrderJobEntity, error: str) -> None:
+        if job.attempts >= self.max_attempts:
+            await self.order_job_repository.dead_letter(job.id, error)
+            self._dead_lettered += 1
+            return
+
+        delay = min(
+            self.retry_backoff_seconds * 2 ** max(job.attempts - 1, 0),
+            self.retry_backoff_max_seconds,
+        )
+        await self.order_job_repository.schedule_retry(
+            job.id, error, datetime.utcnow() + timedelta(seconds=delay)
+        )
+        self._retried += 1
+
+    async def _worker(self, worker_id: int) -> None:
+        logger.info(f"Worker da fila de pedidos {worker_id} iniciado")
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Erro no worker {worker_id}: {str(e)}", exc_info=True)
+                claimed = 0
+
+            if claimed == 0:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        logger.info(f"Worker da fila de pedidos {worker_id} finalizado")
+
+    def is_running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Inicia o pool de workers assíncronos."""
+        if self.is_running():
+            return
+        self._stopping = asyncio.Event()
+        self._started_at = time.monotonic()
+        self._tasks = [
+            asyncio.create_task(self._worker(worker_id), name=f"order-queue-worker-{worker_id}")
+            for worker_id in range(self.workers)
+        ]
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """
+        Sinaliza parada e aguarda os workers concluírem o lote em andamento. Com `timeout`,
+        os workers que não terminarem no prazo são cancelados: seus jobs continuam com lease
+        e voltam à fila quando ele expirar.
+        """
+        self._stopping.set()
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+            if pending:
+                logger.warning(
+                    f"Fila de pedidos: {len(pending)} worker(s) não terminaram em {timeout}s; "
+                    "cancelando"
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+
+    async def get_stats(self) -> OrderQueueStatsDTO:
+        """Retorna profundidade da fila por status e vazão dos workers deste processo."""
+        counts = await self.order_job_repository.count_by_status()
+        uptime = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return OrderQueueStatsDTO(
+            queued=counts.get(OrderJobStatus.QUEUED.value, 0),
+            processing=counts.get(OrderJobStatus.PROCESSING.value, 0),
+            done=counts.get(OrderJobStatus.DONE.value, 0),
+            dead=counts.get(OrderJobStatus.DEAD.value, 0),
+            workers=self.workers,
+            running=self.is_running(),
+            processed=self._processed,
+            retried=self._retried,
+            dead_lettered=self._dead_lettered,
+            uptime_seconds=round(uptime, 3),
+            throughput_per_second=round(self._processed / uptime, 3) if uptime > 0 else 0.0,
+        )
@@ -1,19 +1,35 @@
+import logging
+from collections import Counter, defaultdict
 from datetime import datetime
 
 from fastapi import status
 from fastapi.exceptions import ValidationException
 
+from app.application.dtos.order_bulk_dto import (
+    OrderBulkInputDTO,
+    OrderBulkResponseDTO,
+    OrderBulkResultDTO,
+)
 from app.application.dtos.order_dto import OrderDTO, OrderInputDTO, OrderResponseDTO
 from app.application.dtos.order_item_dto import OrderItemResponseDTO
+from app.application.dtos.order_status_dto import (
+    OrderStatusBatchInputDTO,
+    OrderStatusBatchResponseDTO,
+    OrderStatusTransitionResultDTO,
+)
+from app.application.services.order_queue_service import OrderQueueService
 from app.core.exceptions import ApplicationException
+from app.core.single_flight import SingleFlight
 from app.domain.entities.order_entity import OrderCompleteEntity, OrderEntity
 from app.domain.entities.order_item_entity import OrderItemEntity
 from app.domain.entities.product_entity import ProductEntity
-from app.domain.enums.order_status import OrderStatus
+from app.domain.enums.order_status import OrderStatus, can_transition
 from app.domain.repositories.order_item_repository import OrderItemRepository
 from app.domain.repositories.order_repository import OrderRepository
 from app.domain.repositories.product_repository import ProductRepository
 
+logger = logging.getLogger(__name__)
+
 
 class OrderService:
     """Service class for managing orders."""
@@ -23,10 +39,14 @@ class OrderService:
         order_repository: OrderRepository,
         order_item_repository: OrderItemRepository,
         product_repository: ProductRepository,
+        order_queue_service: OrderQueueService | None = None,
+        single_flight: SingleFlight | None = None,
     ):
         self.order_repository = order_repository
         self.order_item_repository = order_item_repository
         self.product_repository = product_repository
+        self.order_queue_service = order_queue_service
+        self.single_flight = single_flight or SingleFlight(enabled=False)
 
     def _prepare_order_calculated(
         self, products_entity: list[ProductEntity], order_data: OrderDTO
@@ -77,6 +97,13 @@ class OrderService:
                 items_entities
             )
 
+            if self.order_queue_service is not None:
+                try:
+                    await self.order_queue_service.enqueue_order(response_order.id)
+                except Exception as e:
+                    # O pedido já foi gravado: falhar aqui levaria o cliente a repeti-lo
+                    logger.error(f"Falha ao enfileirar pedido {response_order.id} criado: {str(e)}")
+
             items_dtos = [
                 OrderItemResponseDTO(
                     id=item_entity.id,
@@ -103,10 +130,147 @@ class OrderService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, message=str(e)
             )
 
+    @staticmethod
+    def _to_response_dto(order: OrderCompleteEntity) -> OrderResponseDTO:
+        return OrderResponseDTO(
+            id=order.id,
+            order_date=order.order_date,
+            status=order.status,
+            total_amount=order.total_amount,
+            items=[
+                OrderItemResponseDTO(
+                    id=item.id,
+                    order_id=item.order_id,
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    price=item.price,
+                )
+                for item in order.items
+            ],
+        )
+
+    async def create_orders_bulk(self, batch: OrderBulkInputDTO) -> OrderBulkResponseDTO:
+        """
+        Create many orders at once.
+
+        Every referenced product is read with one deduplicated `get_bulk_by_ids`; orders are
+        checked in request order against the stock still available after the ones before
+        them. The accepted orders reserve stock with one aggregate reservation and are
+        inserted, with their items, in a single transaction. Each order gets its own result.
+        """
+        try:
+            product_ids = list(
+                dict.fromkeys(item.product_id for order in batch.orders for item in order.items)
+            )
+            products = {
+                product.id: product
+                for product in await self.product_repository.get_bulk_by_ids(product_ids)
+            }
+
+            available = {product_id: product.quantity for product_id, product in products.items()}
+            reasons: dict[int, str] = {}
+            accepted: dict[int, Counter[int]] = {}
+            for index, order in enumerate(batch.orders):
+                quantities: Counter[int] = Counter()
+                for item in order.items:
+                    quantities[item.product_id] += item.quantity
+                missing = [product_id for product_id in quantities if product_id not in products]
+                short = [
+                    product_id
+                    for product_id, quantity in quantities.items()
+                    if product_id in products and quantity > available[product_id]
+                ]
+                if missing:
+                    reasons[index] = f"Produto(s) não encontrado(s): {missing}"
+                elif short:
+                    reasons[index] = f"Quantidade insuficiente para o(s) produto(s) ID {short}"
+                else:
+                    accepted[index] = quantities
+                    for product_id, quantity in quantities.items():
+                        available[product_id] -= quantity
+
+            reserved_quantities = sum(accepted.values(), Counter())
+            if reserved_quantities:
+                reserved = await self.product_repository.reserve_stock(dict(reserved_quantities))
+                # Estoque consumido por outra requisição entre a leitura e a reserva
+                lost = set(reserved_quantities).difference(reserved)
+                if lost:
+                    for index, quantities in list(accepted.items()):
+                        if lost.intersection(quantities):
+                            reasons[index] = (
+                                "Estoque alterado concorrentemente para o(s) produto(s) ID "
+                                f"{sorted(lost.intersection(quantities))}"
+                            )
+                            del accepted[index]
+                    needed = sum(accepted.values(), Counter())
+                    excess = {
+                        product_id: reserved_quantities[product_id] - needed[product_id]
+                        for product_id in reserved
+                        if reserved_quantities[product_id] > needed[product_id]
+                    }
+                    if excess:
+                        await self.product_repository.release_stock(excess)
+                    reserved_quantities = needed
+
+            now = datetime.now()
+            orders = []
+            for index, quantities in accepted.items():
+                items = [
+                    OrderItemEntity(
+                        product_id=product_id,
+                        quantity=quantity,
+                        price=products[product_id].price,
+                    )
+                    for product_id, quantity in quantities.items()
+                ]
+                orders.append(
+                    OrderCompleteEntity(
+                        order_date=now,
+                        status=OrderStatus.PENDING.value,
+                        total_amount=sum(item.quantity * float(item.price) for item in items),
+                        items=items,
+                    )
+                )
+
+            if orders:
+                try:
+                    orders = await self.order_repository.create_bulk(orders)
+                except Exception:
+                    await self.product_repository.release_stock(dict(reserved_quantities))
+                    raise
+                if self.order_queue_service is not None:
+                    try:
+                        await self.order_queue_service.enqueue_orders([o.id for o in orders])
+                    except Exception as e:
+                        # Os pedidos já foram gravados: falhar aqui levaria o cliente a repeti-los
+                        logger.error(f"Falha ao enfileirar pedidos criados em lote: {str(e)}")
+
+            created = dict(zip(accepted, orders))
+            results = [
+                OrderBulkResultDTO(
+                    index=index,
+                    created=index in created,
+                    order=self._to_response_dto(created[index]) if index in created else None,
+                    reason=reasons.get(index),
+                )
+                for index in range(len(batch.orders))
+            ]
+            return OrderBulkResponseDTO(
+                created=len(created),
+                failed=len(results) - len(created),
+                results=results,
+            )
+        except ApplicationException as e:
+            raise ApplicationException(status_code=e.status_code, message=e.message)
+        except Exception as e:
+            raise ApplicationException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, message=str(e)
+            )
+
     async def get_all_orders(self) -> list[OrderResponseDTO]:
         """Retrieve all orders."""
+        orders_entities = await self.get_order_rows()
         try:
-            orders_entities: list[OrderCompleteEntity] = await self.order_repository.get_all()
             orders_dtos = []
             for order_entity in orders_entities:
                 items_dtos = [
@@ -128,6 +292,25 @@ class OrderService:
                 )
                 orders_dtos.append(order_dto)
             return orders_dtos
+        except Exception as e:
+            raise ApplicationException(
+                message=str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    async def get_order_rows(
+        self, fields: tuple[str, ...] | None = None, include_items: bool = True
+    ) -> list[OrderCompleteEntity]:
+        """
+        Retrieve all orders as entities, for direct serialization.
+        The list may be shared between concurrent callers and must not be mutated.
+
+        `fields` and `include_items` are pushed down to the repository query.
+        """
+        try:
+            return await self.single_flight.do(
+                ("order_list", fields, include_items),
+                lambda: self.order_repository.get_all(fields=fields, include_items=include_items),
+            )
         except ApplicationException as e:
             raise ApplicationException(message=e.message, status_code=e.status_code)
         except Exception as e:
@@ -149,3 +332,68 @@ class OrderService:
             raise ApplicationException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, message=str(e)
             )
+
+    @staticmethod
+    def _is_transition_allowed(from_status: str, to_status: OrderStatus) -> bool:
+        try:
+            return can_transition(OrderStatus(from_status), to_status)
+        except ValueError:
+            return False
+
+    async def transition_order_statuses(
+        self, batch: OrderStatusBatchInputDTO
+    ) -> OrderStatusBatchResponseDTO:
+        """
+        Apply a batch of status transitions.
+
+        Current statuses are read with one query, each pair is validated against the
+        transition table and the valid ones are applied as grouped guarded UPDATEs in a
+        single transaction.
+        """
+        try:
+            order_ids = [transition.order_id for transition in batch.transitions]
+            current_statuses = await self.order_repository.get_statuses(order_ids)
+
+            groups: dict[tuple[str, str], list[int]] = defaultdict(list)
+            reasons: dict[int, str] = {}
+            for transition in batch.transitions:
+                from_status = current_statuses.get(transition.order_id)
+                if from_status is None:
+                    reasons[transition.order_id] = "Pedido não encontrado"
+                elif not self._is_transition_allowed(from_status, transition.status):
+                    reasons[transition.order_id] = (
+                        f"Transição de {from_status} para {transition.status.value} não permitida"
+                    )
+                else:
+                    groups[(from_status, transition.status.value)].append(transition.order_id)
+
+            moved = (
+                await self.order_repository.bulk_update_status(dict(groups)) if groups else set()
+            )
+
+            results = []
+            for transition in batch.transitions:
+                applied = transition.order_id in moved
+                reason = reasons.get(transition.order_id)
+                if not applied and reason is None:
+                    reason = "Status do pedido alterado concorrentemente"
+                results.append(
+                    OrderStatusTransitionResultDTO(
+                        order_id=transition.order_id,
+                        from_status=current_statuses.get(transition.order_id),
+                        to_status=transition.status.value,
+                        applied=applied,
+                        reason=reason,
+                    )
+                )
+            return OrderStatusBatchResponseDTO(
+                applied=len(moved),
+                rejected=len(results) - len(moved),
+                results=results,
+            )
+        except ApplicationException as e:
+            raise ApplicationException(status_code=e.status_code, message=e.message)
+        except Exception as e:
+            raise ApplicationException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, message=str(e)
+            )
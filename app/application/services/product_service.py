@@ -1,7 +1,14 @@
+from datetime import datetime
 from decimal import Decimal
 
-from app.application.dtos.product_dto import CreateProductDTO, ProductResponseDTO
+from app.application.dtos.product_dto import (
+    CreateProductDTO,
+    ProductBatchResponseDTO,
+    ProductResponseDTO,
+)
+from app.core.cache.access_tracker import AccessTracker
 from app.core.exceptions import ApplicationException, ValidationException
+from app.core.single_flight import SingleFlight
 from app.core.utils import update_columns_obj
 from app.domain.entities.product_entity import ProductEntity
 from app.domain.repositories.product_repository import ProductRepository
@@ -11,8 +18,17 @@ from app.presentation.schemas.product_schema import CreateProductInput
 class ProductService:
     """Serviço de aplicação para produtos"""
 
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        single_flight: SingleFlight | None = None,
+        access_tracker: AccessTracker | None = None,
+        max_batch_ids: int = 100,
+    ):
         self.product_repository = product_repository
+        self.single_flight = single_flight or SingleFlight(enabled=False)
+        self.access_tracker = access_tracker
+        self.max_batch_ids = max_batch_ids
 
     async def create_product(self, dto: CreateProductDTO) -> ProductResponseDTO:
         """
@@ -66,20 +82,66 @@ class ProductService:
 
     async def get_all_products(self, skip: int = 0, limit: int = 10) -> list[ProductResponseDTO]:
         """Recupera todos os produtos com paginação"""
-        products = await self.product_repository.get_all(skip=skip, limit=limit)
+        products = await self.get_product_rows(skip=skip, limit=limit)
         return [self._to_response_dto(p) for p in products]
 
+    async def get_product_rows(
+        self, skip: int = 0, limit: int = 10, fields: tuple[str, ...] | None = None
+    ) -> list[ProductEntity]:
+        """
+        Recupera a página de produtos como entidades, para serialização direta.
+        A lista pode ser compartilhada entre chamadas concorrentes: não deve ser alterada.
+
+        Com `fields`, só essas colunas são lidas do banco; as demais ficam None.
+        """
+        return await self.single_flight.do(
+            ("product_list", skip, limit, fields),
+            lambda: self.product_repository.get_all(skip=skip, limit=limit, fields=fields),
+        )
+
+    async def get_products_by_ids(self, product_ids: list[int]) -> ProductBatchResponseDTO:
+        """
+        Recupera vários produtos em uma consulta (ou do cache), na ordem pedida.
+        IDs repetidos são considerados uma vez; os inexistentes voltam em `missing_ids`.
+        """
+        unique_ids = list(dict.fromkeys(product_ids))
+        if not unique_ids:
+            raise ValidationException("Informe ao menos um ID de produto")
+        if len(unique_ids) > self.max_batch_ids:
+            raise ValidationException(
+                f"Máximo de {self.max_batch_ids} IDs por requisição ({len(unique_ids)} informados)"
+            )
+        try:
+            found = {
+                product.id: product
+                for product in await self.product_repository.get_bulk_by_ids(unique_ids)
+            }
+        except ApplicationException:
+            raise
+        except Exception as e:
+            raise ApplicationException(f"Erro ao recuperar produtos em lote: {str(e)}")
+        if self.access_tracker is not None:
+            for product_id in found:
+                self.access_tracker.record(product_id)
+        return ProductBatchResponseDTO(
+            products=[self._to_response_dto(found[i]) for i in unique_ids if i in found],
+            missing_ids=[i for i in unique_ids if i not in found],
+        )
+
     async def get_product_by_id(self, product_id: int) -> ProductResponseDTO:
         """Recupera um produto por ID"""
         try:
-            product = await self.product_repository.get_by_id(product_id)
+            product = await self.single_flight.do(
+                ("product_by_id", product_id),
+                lambda: self.product_repository.get_by_id(product_id),
+            )
             if not product:
                 raise ValidationException(f"Produto com ID {product_id} não encontrado")
+            if self.access_tracker is not None:
+                self.access_tracker.record(product_id)
             return self._to_response_dto(product)
-        except ValidationException:
+        except ApplicationException:
             raise
-        except ApplicationException as e:
-            raise ApplicationException(status_code=e.status_code, detail=e.message)
         except Exception as e:
             raise ValidationException(f"Erro ao recuperar produto com ID {product_id}: {str(e)}")
 
@@ -99,13 +161,12 @@ class ProductService:
                 price=body.price,
                 quantity=body.quantity,
             )
+            product.updated_at = datetime.utcnow()
 
             updated_product = await self.product_repository.update(product)
             return self._to_response_dto(updated_product)
-        except ValidationException:
+        except ApplicationException:
             raise
-        except ApplicationException as e:
-            raise ApplicationException(status_code=e.status_code, detail=e.message)
         except Exception as e:
             raise ValidationException(f"Erro ao atualizar produto com ID {product_id}: {str(e)}")
 
@@ -117,9 +178,7 @@ class ProductService:
                 raise ValidationException(f"Produto com ID {product_id} não encontrado")
 
             await self.product_repository.delete_by_id(product_id)
-        except ValidationException:
+        except ApplicationException:
             raise
-        except ApplicationException as e:
-            raise ApplicationException(status_code=e.status_code, detail=e.message)
         except Exception as e:
             raise ValidationException(f"Erro ao deletar produto com ID {product_id}: {str(e)}")
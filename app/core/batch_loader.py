@@ -0,0 +1,108 @@
+"""
+Micro-batching de carregamentos por chave (estilo DataLoader).
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+from app.core.deadline import detached_context
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Batch:
+    def __init__(self):
+        self.futures: dict[Any, asyncio.Future] = {}
+        self.dispatched = False
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Agrupa as chaves pedidas por coroutines concorrentes dentro de uma janela curta (ou até
+    `max_batch_size` chaves) e as resolve com uma única chamada a `batch_fn`.
+
+    `batch_fn` recebe a lista de chaves distintas e retorna um dicionário chave -> valor;
+    chaves ausentes resolvem para None. Uma exceção em `batch_fn` é propagada a todos os
+    chamadores do lote.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        window_seconds: float = 0.002,
+        max_batch_size: int = 100,
+    ):
+        self.batch_fn = batch_fn
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._current: _Batch | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.loads = 0
+        self.batches = 0
+        self.keys_dispatched = 0
+
+    async def load(self, key: K) -> V | None:
+        self.loads += 1
+        future = self._enqueue(key)
+        # shield: cancelar um chamador não cancela o resultado compartilhado pelo lote
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        keys = list(keys)
+        self.loads += len(keys)
+        futures = [self._enqueue(key) for key in keys]
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def _enqueue(self, key: K) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        batch = self._current
+        if batch is None or batch.dispatched:
+            batch = self._current = _Batch()
+            loop.call_later(self.window_seconds, self._dispatch, batch)
+
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+            if len(batch.futures) >= self.max_batch_size:
+                self._dispatch(batch)
+        return future
+
+    def _dispatch(self, batch: _Batch) -> None:
+        if batch.dispatched:
+            return
+        batch.dispatched = True
+        if self._current is batch:
+            self._current = None
+        # O lote atende vários chamadores: roda sem o prazo de quem o disparou
+        task = detached_context().run(asyncio.get_running_loop().create_task, self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        keys = list(batch.futures)
+        self.batches += 1
+        self.keys_dispatched += len(keys)
+        try:
+            results = await self.batch_fn(keys)
+        except Exception as e:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.futures.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "window_ms": round(self.window_seconds * 1000, 3),
+            "max_batch_size": self.max_batch_size,
+            "loads": self.loads,
+            "batches": self.batches,
+            "keys_dispatched": self.keys_dispatched,
+            "avg_batch_size": (
+                round(self.keys_dispatched / self.batches, 2) if self.batches else 0.0
+            ),
+        }
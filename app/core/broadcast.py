@@ -0,0 +1,136 @@
+"""
+Hub de difusão em processo para fluxos Server-Sent Events.
+
+Cada assinante tem uma fila limitada: quando um cliente lento deixa a fila encher, o evento
+mais antigo é descartado (drop-oldest) e o assinante é marcado para receber um aviso de
+`reset`, em vez de a publicação bloquear ou a memória crescer sem limite. Os últimos eventos
+ficam num buffer de replay para que um cliente reconectado com `Last-Event-ID` receba o que
+perdeu. Os ids têm o formato `<stream>-<seq>`: `stream` identifica este processo, então um id
+emitido por outro worker (ou antes de um restart) é reconhecido como não retomável.
+"""
+
+import asyncio
+import uuid
+from collections import deque
+from typing import Any
+
+
+class BroadcastEvent:
+    __slots__ = ("id", "seq", "data")
+
+    def __init__(self, id: str, seq: int, data: Any):
+        self.id = id
+        self.seq = seq
+        self.data = data
+
+
+class Subscription:
+    def __init__(self, max_queue_size: int):
+        self._queue: deque[BroadcastEvent] = deque(maxlen=max_queue_size)
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+        # Motivo do próximo aviso de reset ("gap" ou "overflow"); None quando não há eventos perdidos
+        self.reset_reason: str | None = None
+
+    def push(self, event: BroadcastEvent) -> None:
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+            self.reset_reason = "overflow"
+        self._queue.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    def take_reset(self) -> str | None:
+        reason, self.reset_reason = self.reset_reason, None
+        return reason
+
+    async def get(self) -> BroadcastEvent | None:
+        """Próximo evento; None quando o hub foi fechado"""
+        while not self._queue:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._queue.popleft()
+
+
+class BroadcastHub:
+    def __init__(self, max_queue_size: int = 256, replay_size: int = 1024):
+        self.max_queue_size = max_queue_size
+        self.stream_id = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._replay: deque[BroadcastEvent] = deque(maxlen=replay_size)
+        self._subscribers: set[Subscription] = set()
+        self._published = 0
+        self._dropped = 0
+        self._closed = False
+
+    def publish(self, data: Any) -> BroadcastEvent:
+        self._seq += 1
+        event = BroadcastEvent(f"{self.stream_id}-{self._seq}", self._seq, data)
+        self._replay.append(event)
+        self._published += 1
+        for subscription in self._subscribers:
+            dropped = subscription.dropped
+            subscription.push(event)
+            self._dropped += subscription.dropped - dropped
+        return event
+
+    def _parse_event_id(self, event_id: str) -> int | None:
+        stream_id, _, seq = event_id.partition("-")
+        if stream_id != self.stream_id or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def subscribe(self, last_event_id: str | None = None) -> Subscription:
+        """
+        Nova assinatura. Com `last_event_id`, os eventos posteriores a ele ainda no buffer são
+        enfileirados primeiro; se o id não puder ser retomado, a assinatura começa com um
+        reset ("gap") para o cliente recarregar o estado completo.
+        """
+        subscription = Subscription(self.max_queue_size)
+        if self._closed:
+            # Hub em desligamento: o fluxo termina de imediato e o cliente reconecta em outra
+            # instância, em vez de ficar preso até o prazo do graceful shutdown
+            subscription.close()
+            return subscription
+        if last_event_id:
+            seq = self._parse_event_id(last_event_id)
+            oldest = self._replay[0].seq if self._replay else self._seq + 1
+            if seq is None or seq > self._seq or seq < oldest - 1:
+                subscription.reset_reason = "gap"
+            else:
+                for event in self._replay:
+                    if event.seq > seq:
+                        subscription.push(event)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def close(self) -> None:
+        """
+        Encerra todas as assinaturas (desligamento); os fluxos terminam após esvaziar a fila.
+        Assinaturas feitas depois disso já nascem encerradas.
+        """
+        self._closed = True
+        for subscription in self._subscribers:
+            subscription.close()
+        self._subscribers.clear()
+
+    def reopen(self) -> None:
+        """Volta a aceitar assinaturas (novo ciclo de startup no mesmo processo, como nos testes)"""
+        self._closed = False
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self._published,
+            "dropped": self._dropped,
+            "last_event_id": f"{self.stream_id}-{self._seq}" if self._seq else None,
+        }
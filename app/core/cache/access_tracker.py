@@ -0,0 +1,58 @@
+"""
+Contagem de acessos por chave, persistida entre reinícios para guiar o warm-up de caches.
+"""
+
+import json
+import logging
+import os
+from collections import Counter
+from collections.abc import Hashable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class AccessTracker:
+    """
+    Conta acessos por chave mantendo no máximo `max_keys` chaves.
+
+    Ao ultrapassar o limite, somente as chaves mais acessadas são mantidas. Contagens
+    carregadas de um snapshot são reduzidas à metade, para que o histórico antigo perca peso
+    frente ao tráfego recente.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._counts: Counter = Counter()
+
+    def record(self, key: Hashable) -> None:
+        self._counts[key] += 1
+        if len(self._counts) > self.max_keys * 2:
+            self._counts = Counter(dict(self._counts.most_common(self.max_keys)))
+
+    def top(self, limit: int) -> list[Hashable]:
+        return [key for key, _ in self._counts.most_common(limit)]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def save(self, path: str) -> None:
+        """Grava o snapshot de forma atômica (arquivo temporário + rename)"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self._counts.most_common(self.max_keys)))
+        os.replace(tmp, target)
+
+    def load(self, path: str) -> int:
+        """Carrega um snapshot, se existir. Retorna a quantidade de chaves carregadas"""
+        try:
+            entries = json.loads(Path(path).read_text())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"Snapshot de acessos ignorado ({path}): {str(e)}")
+            return 0
+        for key, count in entries:
+            self._counts[key] += max(count // 2, 1)
+        return len(entries)
@@ -0,0 +1,218 @@
+"""
+Backends de cache compartilháveis entre workers.
+
+`InMemoryCacheBackend` vale para um único processo (e serve de dublê local em testes);
+`RedisCacheBackend` fala o protocolo Redis e permite que vários workers uvicorn compartilhem
+o mesmo cache e recebam invalidações por pub/sub.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - dependência opcional
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str], Awaitable[None] | None]
+
+
+async def _dispatch(handler: MessageHandler, message: str) -> None:
+    try:
+        result = handler(message)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.error(f"Erro ao tratar mensagem de invalidação: {str(e)}", exc_info=True)
+
+
+class CacheBackend(ABC):
+    # Indica se os valores são visíveis para outros processos
+    shared: bool = False
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl_seconds: float | None = None) -> bool:
+        """Grava só se a chave não existir (SET NX); devolve se gravou"""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        pass
+
+    @abstractmethod
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Backend em memória do processo, com TTL e pub/sub local."""
+
+    def __init__(self):
+        self._values: dict[str, tuple[float | None, bytes]] = {}
+        self._handlers: dict[str, list[MessageHandler]] = defaultdict(list)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._values[key] = (expires_at, value)
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float | None = None) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for handler in list(self._handlers[channel]):
+            await _dispatch(handler, message)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self._handlers[channel].append(handler)
+
+    async def close(self) -> None:
+        self._handlers.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend sobre qualquer servidor que fale o protocolo Redis (redis.asyncio)."""
+
+    shared = True
+
+    def __init__(self, client: Any, key_prefix: str = "ecommerce:"):
+        self.client = client
+        self.key_prefix = key_prefix
+        self._pubsub = None
+        self._handlers: dict[str, list[MessageHandler]] = defaultdict(list)
+        self._listener: asyncio.Task | None = None
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "ecommerce:") -> "RedisCacheBackend":
+        if redis_asyncio is None:
+            raise RuntimeError("O pacote 'redis' é necessário para CACHE_BACKEND_URL redis://")
+        return cls(redis_asyncio.from_url(url), key_prefix=key_prefix)
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(self._key(key))
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self.client.mget([self._key(key) for key in keys])
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        px = int(ttl_seconds * 1000) if ttl_seconds else None
+        await self.client.set(self._key(key), value, px=px)
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float | None = None) -> bool:
+        px = int(ttl_seconds * 1000) if ttl_seconds else None
+        return bool(await self.client.set(self._key(key), value, px=px, nx=True))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self._key(key) for key in keys))
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self.client.publish(self._key(channel), message)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        if self._pubsub is None:
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._handlers[self._key(channel)].append(handler)
+        await self._pubsub.subscribe(self._key(channel))
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(), name="cache-backend-pubsub")
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Erro no listener pub/sub do cache: {str(e)}", exc_info=True)
+                await asyncio.sleep(1.0)
+                continue
+            if message is None or message.get("type") != "message":
+                continue
+            channel = message["channel"]
+            channel = channel.decode() if isinstance(channel, bytes) else channel
+            data = message["data"]
+            data = data.decode() if isinstance(data, bytes) else data
+            for handler in list(self._handlers.get(channel, [])):
+                await _dispatch(handler, data)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        await self.client.aclose()
+
+
+def create_cache_backend(url: str) -> CacheBackend:
+    """
+    Cria o backend a partir de CACHE_BACKEND_URL.
+
+    - `memory://`: em memória, por processo
+    - `redis://` / `rediss://`: servidor Redis (ou compatível)
+    - `fakeredis://`: dublê local do protocolo Redis, para testes
+    """
+    if url.startswith("memory://"):
+        return InMemoryCacheBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend.from_url(url)
+    if url.startswith("fakeredis://"):
+        import fakeredis.aioredis
+
+        return RedisCacheBackend(fakeredis.aioredis.FakeRedis())
+    raise ValueError(f"CACHE_BACKEND_URL não suportada: {url}")
@@ -0,0 +1,101 @@
+"""
+Filtro de Bloom para consultas de pertinência sem acesso ao banco.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom em memória.
+
+    `key in filter` é False apenas quando a chave certamente nunca foi adicionada; True
+    pode ser falso positivo, com probabilidade próxima de `error_rate` até `capacity` chaves.
+    Não há remoção: chaves removidas continuam "presentes" até a reconstrução do filtro.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        if capacity <= 0:
+            raise ValueError("capacity deve ser maior que zero")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate deve estar entre 0 e 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: object):
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: object) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: object) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key)
+        )
+
+    def __len__(self) -> int:
+        """Quantidade de inserções (inclui repetidas)"""
+        return self._count
+
+
+class KnownIdFilter:
+    """
+    Rejeita IDs inteiros que certamente não existem.
+
+    A carga inicial (até `mark_ready()`) é um retrato completo dos IDs existentes; só são
+    rejeitados IDs ausentes desse retrato e menores ou iguais ao maior ID carregado. IDs
+    criados depois, por este ou por outro worker, são sempre maiores que esse limite (IDs
+    crescentes), então nunca são rejeitados, mesmo que a notificação da criação se perca.
+    A exceção é o SQLite reaproveitar IDs (o próximo ID é o maior existente + 1) quando o maior
+    é removido: a partir daí o filtro deixa de rejeitar. Até `mark_ready()` nenhum ID é
+    rejeitado.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self.max_known_id = 0
+        self.ready = False
+        self.rejected = 0
+
+    def add(self, key: int) -> None:
+        self.bloom.add(key)
+        # Depois da carga o limite não sobe: um ID novo visto aqui não prova que os IDs
+        # entre o limite e ele (criados em outro worker) não existem
+        if not self.ready and key > self.max_known_id:
+            self.max_known_id = key
+
+    def mark_ready(self) -> None:
+        self.ready = True
+
+    def remove(self, key: int) -> None:
+        # Enquanto o maior ID do retrato existir, nenhum ID abaixo dele é reatribuído; sem ele,
+        # o próximo ID pode ser qualquer um acima do maior restante, que o filtro não conhece
+        if key == self.max_known_id:
+            self.max_known_id = 0
+
+    def might_exist(self, key: int) -> bool:
+        if not self.ready or key > self.max_known_id or key in self.bloom:
+            return True
+        self.rejected += 1
+        return False
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "size": len(self.bloom),
+            "capacity": self.bloom.capacity,
+            "error_rate": self.bloom.error_rate,
+            "max_known_id": self.max_known_id,
+            "rejected": self.rejected,
+        }
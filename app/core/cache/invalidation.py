@@ -0,0 +1,77 @@
+"""
+Ponte entre o barramento de eventos local e o pub/sub do backend de cache.
+
+Eventos PRODUCT_CHANGED gerados neste processo são publicados no canal compartilhado;
+mensagens vindas de outros workers são republicadas no barramento local com `origin`
+preenchido, para que os caches locais as tratem sem reenviá-las ao canal.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+
+from app.core.cache.backends import CacheBackend
+from app.core.events import PRODUCT_CHANGED, EventBus, ProductChangedEvent
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationBridge:
+    def __init__(self, backend: CacheBackend, event_bus: EventBus, channel: str):
+        self.backend = backend
+        self.event_bus = event_bus
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._pending: set[asyncio.Task] = set()
+        self._started = False
+
+    async def start(self) -> None:
+        if self._started:
+            return
+        await self.backend.subscribe(self.channel, self._on_remote)
+        self.event_bus.subscribe(PRODUCT_CHANGED, self._on_local)
+        self._started = True
+
+    async def stop(self) -> None:
+        if not self._started:
+            return
+        self.event_bus.unsubscribe(PRODUCT_CHANGED, self._on_local)
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        self._started = False
+
+    def _on_local(self, event: ProductChangedEvent) -> None:
+        if event.origin is not None:
+            return
+        message = json.dumps(
+            {
+                "origin": self.instance_id,
+                "product_id": event.product_id,
+                "action": event.action,
+                "stock": event.stock,
+            }
+        )
+        task = asyncio.get_running_loop().create_task(self._publish(message))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _publish(self, message: str) -> None:
+        try:
+            await self.backend.publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"Falha ao publicar invalidação de cache: {str(e)}")
+
+    def _on_remote(self, message: str) -> None:
+        payload = json.loads(message)
+        if payload["origin"] == self.instance_id:
+            return
+        self.event_bus.publish(
+            PRODUCT_CHANGED,
+            ProductChangedEvent(
+                payload["product_id"],
+                payload["action"],
+                origin=payload["origin"],
+                stock=payload.get("stock"),
+            ),
+        )
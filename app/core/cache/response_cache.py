@@ -0,0 +1,75 @@
+from collections.abc import Callable, Hashable
+from datetime import datetime
+
+from app.core.cache.lru_ttl_cache import LRUTTLCache
+
+
+class CachedResponse:
+    def __init__(
+        self,
+        body: bytes,
+        etag: str,
+        generation: int,
+        last_modified: datetime | None = None,
+        media_type: str = "application/json",
+    ):
+        self.body = body
+        self.etag = etag
+        self.generation = generation
+        self.last_modified = last_modified
+        self.media_type = media_type
+        # Outras representações do corpo, por (media type, Content-Encoding), sob demanda
+        self.variants: dict[tuple[str, str | None], bytes] = {}
+
+    def variant(self, key: tuple[str, str | None], build: Callable[[], bytes]) -> bytes:
+        body = self.variants.get(key)
+        if body is None:
+            body = self.variants[key] = build()
+        return body
+
+
+class ResponseCache:
+    """
+    Cache de respostas já codificadas, marcado com um contador de geração.
+
+    Qualquer escrita no catálogo incrementa a geração; entradas de gerações anteriores
+    deixam de ser servidas sem precisar enumerar ou apagar chaves.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        self._entries = LRUTTLCache(max_size=max_entries, ttl_seconds=ttl_seconds)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        entry: CachedResponse | None = self._entries.get(key)
+        if entry is not None and entry.generation != self.generation:
+            self.stale += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def set(self, key: Hashable, entry: CachedResponse) -> bool:
+        """Armazena a resposta, exceto se ela foi gerada antes da última escrita."""
+        if entry.generation != self.generation:
+            return False
+        return self._entries.set(key, entry)
+
+    def bump_generation(self, *_: object) -> None:
+        self.generation += 1
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            **self._entries.stats(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "generation": self.generation,
+            "stale": self.stale,
+        }
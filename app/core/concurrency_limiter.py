@@ -0,0 +1,127 @@
+"""
+Limite de concorrência adaptativo (AIMD) com fila de espera limitada.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Admite no máximo `limit` execuções simultâneas e ajusta o limite pela latência observada.
+
+    Cada execução concluída abaixo da latência alvo, com o limite saturado, aumenta o limite
+    em 1 (aumento aditivo); uma execução acima do alvo, ou com falha, o multiplica por
+    `backoff_ratio` (redução multiplicativa), no máximo uma vez por janela de latência alvo
+    para que uma rajada de respostas lentas não derrube o limite de uma vez. Acima do limite,
+    até `max_queue` chamadores esperam por uma vaga por até `queue_timeout_seconds`; os
+    demais são recusados imediatamente.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        target_latency_seconds: float = 0.25,
+        backoff_ratio: float = 0.9,
+        max_queue: int = 64,
+        queue_timeout_seconds: float = 0.5,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency_seconds = target_latency_seconds
+        self.backoff_ratio = backoff_ratio
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._latency_ewma: float | None = None
+        self._admitted = 0
+        self._queued = 0
+        self._rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> bool:
+        """Reserva uma vaga; False quando a fila está cheia ou a espera passou do prazo"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queued += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # A vaga foi concedida junto com o fim do prazo: devolve para o próximo
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                waiter.cancel()
+            self._rejected += 1
+            return False
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                waiter.cancel()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self._admitted += 1
+        return True
+
+    def release(self, latency_seconds: float, failed: bool = False) -> None:
+        self._in_flight -= 1
+        self._latency_ewma = (
+            latency_seconds
+            if self._latency_ewma is None
+            else 0.9 * self._latency_ewma + 0.1 * latency_seconds
+        )
+        if failed or latency_seconds > self.target_latency_seconds:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.target_latency_seconds:
+                self._last_decrease = now
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        elif self._in_flight + 1 >= self.limit:
+            self._limit = min(float(self.max_limit), self._limit + 1)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "admitted": self._admitted,
+            "queued": self._queued,
+            "rejected": self._rejected,
+            "latency_ewma_ms": (
+                round(self._latency_ewma * 1000, 3) if self._latency_ewma is not None else None
+            ),
+        }
@@ -19,6 +19,128 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./ecommerce.db"
+    # False quando o schema já foi criado antes de iniciar os workers (ver app.launcher)
+    DATABASE_INIT_ON_STARTUP: bool = True
+
+    # Fila de processamento de pedidos
+    ORDER_QUEUE_ENABLED: bool = True
+    ORDER_QUEUE_WORKERS: int = 2
+    ORDER_QUEUE_BATCH_SIZE: int = 50
+    ORDER_QUEUE_POLL_INTERVAL_SECONDS: float = 1.0
+    ORDER_QUEUE_LEASE_SECONDS: int = 30
+    ORDER_QUEUE_MAX_ATTEMPTS: int = 5
+    ORDER_QUEUE_RETRY_BACKOFF_SECONDS: float = 2.0
+    ORDER_QUEUE_RETRY_BACKOFF_MAX_SECONDS: float = 300.0
+
+    # Cache de produtos
+    PRODUCT_CACHE_ENABLED: bool = True
+    PRODUCT_CACHE_MAX_SIZE: int = 10000
+    PRODUCT_CACHE_TTL_SECONDS: float = 60.0
+    # Por quanto tempo uma invalidação impede que leituras concorrentes repovoem o cache
+    # compartilhado com a versão anterior do produto
+    PRODUCT_CACHE_TOMBSTONE_SECONDS: float = 5.0
+
+    # Rejeição de IDs de produtos inexistentes (cache negativo + filtro de Bloom)
+    PRODUCT_NEGATIVE_CACHE_MAX_SIZE: int = 10000
+    PRODUCT_NEGATIVE_CACHE_TTL_SECONDS: float = 5.0
+    PRODUCT_ID_FILTER_ENABLED: bool = True
+    PRODUCT_ID_FILTER_CAPACITY: int = 1_000_000
+    PRODUCT_ID_FILTER_ERROR_RATE: float = 0.01
+
+    # Micro-batching de buscas de produtos por ID
+    PRODUCT_BATCH_LOADER_ENABLED: bool = True
+    PRODUCT_BATCH_LOADER_WINDOW_MS: float = 2.0
+    PRODUCT_BATCH_LOADER_MAX_BATCH_SIZE: int = 100
+
+    # Multi-get público de produtos (GET /products/batch)
+    PRODUCT_BATCH_GET_MAX_IDS: int = 100
+
+    # Sub-requisições em lote (POST /batch)
+    BATCH_MAX_OPERATIONS: int = 20
+    BATCH_MAX_CONCURRENCY: int = 8
+
+    # Fluxo SSE de mudanças de estoque e preço (GET /products/stream)
+    PRODUCT_STREAM_QUEUE_SIZE: int = 256
+    PRODUCT_STREAM_REPLAY_SIZE: int = 1024
+    PRODUCT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    PRODUCT_STREAM_RETRY_MS: int = 3000
+
+    # Cache de respostas das páginas de produtos
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0
+
+    # Coalescência de leituras concorrentes idênticas
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    # Warm-up de caches na inicialização
+    CACHE_WARMUP_ENABLED: bool = True
+    CACHE_WARMUP_PRODUCT_LIMIT: int = 500
+    CACHE_WARMUP_LIST_PAGES: int = 5
+    CACHE_WARMUP_LIST_PAGE_SIZE: int = 10
+    CACHE_WARMUP_CONCURRENCY: int = 4
+    CACHE_WARMUP_TIMEOUT_SECONDS: float = 10.0
+    CACHE_WARMUP_SNAPSHOT_PATH: str | None = "./product_access_snapshot.json"
+
+    # Compressão de respostas (gzip; br/zstd quando os pacotes estiverem instalados)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_ENABLED: bool = True
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_ENABLED: bool = True
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Backend de cache compartilhado entre workers (memory://, redis://host:6379/0, fakeredis://)
+    CACHE_BACKEND_URL: str = "memory://"
+    CACHE_INVALIDATION_CHANNEL: str = "product.changed"
+
+    # Controle de admissão: limites de concorrência adaptativos (AIMD) por grupo de rotas
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MIN_LIMIT: int = 1
+    ADMISSION_READ_INITIAL_LIMIT: int = 32
+    ADMISSION_READ_MAX_LIMIT: int = 256
+    ADMISSION_READ_TARGET_LATENCY_MS: float = 250.0
+    ADMISSION_WRITE_INITIAL_LIMIT: int = 8
+    ADMISSION_WRITE_MAX_LIMIT: int = 64
+    ADMISSION_WRITE_TARGET_LATENCY_MS: float = 500.0
+    ADMISSION_QUEUE_SIZE: int = 64
+    ADMISSION_QUEUE_TIMEOUT_MS: float = 500.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+
+    # Rate limiting por cliente (chave de API ou IP): token bucket por regra de rota.
+    # Regras: {"GET /orders": "120/minute"}; rotas sem regra usam RATE_LIMIT_DEFAULT
+    # (vazio: sem limite). Com CACHE_BACKEND_URL compartilhado, os buckets também são.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_DEFAULT: str = "1200/minute"
+    RATE_LIMIT_RULES: dict[str, str] = {"GET /orders": "300/minute", "POST /orders": "120/minute"}
+    RATE_LIMIT_API_KEY_HEADER: str = "X-API-Key"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+
+    # Prazos por requisição: o cliente pode encurtar com o header (em ms), nunca estender.
+    # Rotas: {"GET /orders": 5000}; None desativa o prazo (fluxo SSE, health checks)
+    REQUEST_DEADLINE_ENABLED: bool = True
+    REQUEST_DEADLINE_HEADER: str = "X-Request-Timeout-Ms"
+    REQUEST_DEADLINE_DEFAULT_MS: int | None = 30_000
+    REQUEST_DEADLINE_ROUTES_MS: dict[str, int | None] = {
+        "GET /orders": 10_000,
+        "GET /products/stream": None,
+        "GET /ping": None,
+        "GET /ready": None,
+    }
+    # Instruções da VM do SQLite entre verificações do prazo durante um statement
+    DATABASE_DEADLINE_CHECK_OPCODES: int = 1000
+
+    # Servidor de produção (python -m app.launcher)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8080
+    # None: um worker por CPU disponível
+    SERVER_WORKERS: int | None = None
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: int = 30
+
+    # Desligamento: prazos para drenar requisições em andamento e os workers da fila
+    SHUTDOWN_DRAIN_TIMEOUT_SECONDS: float = 20.0
+    SHUTDOWN_QUEUE_TIMEOUT_SECONDS: float = 10.0
 
     # CORS
     ALLOWED_ORIGINS: list[str] = ["http://localhost:8080"]
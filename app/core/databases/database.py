@@ -3,10 +3,20 @@ Database configuration module.
 Handles SQLAlchemy async engine, session factory, and ORM models.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import os
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
+from app.core.deadline import current_deadline
 
 _DATABASE_URL = settings.DATABASE_URL
 if _DATABASE_URL.startswith("sqlite:///") and not _DATABASE_URL.startswith("sqlite+aiosqlite://"):
@@ -20,6 +30,72 @@ async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncS
 Base = declarative_base()
 
 
+def _reset_pool_after_fork() -> None:
+    # Conexões herdadas do processo pai não podem ser usadas no filho: o pool é descartado sem
+    # fechá-las (close=False), para não encerrar as conexões que o pai continua usando
+    engine.sync_engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+class _StatementDeadline:
+    """
+    Progress handler do SQLite: interrompe o statement em execução quando o prazo da
+    requisição passa. Roda na thread do aiosqlite, onde o contextvar da requisição não é
+    visível; por isso o prazo é copiado para a conexão antes de cada statement.
+    """
+
+    __slots__ = ("deadline",)
+
+    def __init__(self):
+        self.deadline: float | None = None
+
+    def __call__(self) -> int:
+        deadline = self.deadline
+        return 1 if deadline is not None and time.monotonic() >= deadline else 0
+
+
+_DEADLINE_KEY = "statement_deadline"
+
+
+def _install_statement_deadline(dbapi_connection, connection_record) -> None:
+    if not hasattr(dbapi_connection, "run_async"):
+        return
+    guard = _StatementDeadline()
+    connection_record.info[_DEADLINE_KEY] = guard
+    dbapi_connection.run_async(
+        lambda conn: conn.set_progress_handler(guard, settings.DATABASE_DEADLINE_CHECK_OPCODES)
+    )
+
+
+def _arm_statement_deadline(conn, cursor, statement, parameters, context, executemany) -> None:
+    guard = conn.connection.info.get(_DEADLINE_KEY)
+    if guard is not None:
+        guard.deadline = current_deadline()
+
+
+def _disarm_statement_deadline(dbapi_connection, connection_record, reset_state) -> None:
+    # Antes do rollback de devolução ao pool: o próximo usuário da conexão pode não ter prazo
+    guard = connection_record.info.get(_DEADLINE_KEY)
+    if guard is not None:
+        guard.deadline = None
+
+
+def install_statement_deadlines(async_engine: AsyncEngine) -> None:
+    """Faz os statements SQLite do engine respeitarem o prazo da requisição atual"""
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "connect", _install_statement_deadline)
+    event.listen(sync_engine, "before_cursor_execute", _arm_statement_deadline)
+    event.listen(sync_engine.pool, "reset", _disarm_statement_deadline)
+
+
+# Outros drivers assíncronos (asyncpg) já cancelam a consulta quando a task é cancelada
+if engine.dialect.name == "sqlite":
+    install_statement_deadlines(engine)
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
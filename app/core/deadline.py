@@ -0,0 +1,57 @@
+"""
+Prazo (deadline) da requisição atual, propagado por contextvar.
+
+O prazo é um instante de `time.monotonic()`, definido pelo middleware de deadline a partir
+do header do cliente ou da configuração da rota. Tudo que roda no contexto da requisição o
+enxerga, inclusive os statements emitidos pelo SQLAlchemy (ver `app.core.databases.database`),
+e sub-requisições do `/batch` herdam o prazo do lote: um prazo só pode ser encurtado.
+"""
+
+import contextvars
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+def current_deadline() -> float | None:
+    return _deadline.get()
+
+
+def remaining_seconds() -> float | None:
+    """Tempo restante até o prazo (negativo se já passou); None sem prazo"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def deadline_exceeded() -> bool:
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: float) -> Iterator[float]:
+    """Define o prazo daqui a `timeout_seconds`, sem estender um prazo já em vigor"""
+    deadline = time.monotonic() + timeout_seconds
+    inherited = _deadline.get()
+    if inherited is not None:
+        deadline = min(deadline, inherited)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def detached_context() -> contextvars.Context:
+    """
+    Cópia do contexto atual sem prazo, para tasks que atendem vários chamadores (single-flight,
+    batch loader): o prazo curto de quem iniciou o trabalho não pode interromper o resultado
+    compartilhado com os demais, que continuam protegidos pelos próprios prazos.
+    """
+    context = contextvars.copy_context()
+    context.run(_deadline.set, None)
+    return context
@@ -1,42 +1,285 @@
+import logging
+
+from app.application.services.cache_warmup_service import CacheWarmupService
 from app.application.services.order_item_service import OrderItemService
+from app.application.services.order_queue_service import OrderQueueService
 from app.application.services.order_service import OrderService
 from app.application.services.product_service import ProductService
+from app.core.broadcast import BroadcastHub
+from app.core.cache.access_tracker import AccessTracker
+from app.core.cache.backends import CacheBackend, create_cache_backend
+from app.core.cache.bloom_filter import KnownIdFilter
+from app.core.cache.invalidation import CacheInvalidationBridge
+from app.core.cache.lru_ttl_cache import LRUTTLCache
+from app.core.cache.response_cache import ResponseCache
+from app.core.concurrency_limiter import AdaptiveConcurrencyLimiter
+from app.core.config import settings
+from app.core.events import PRODUCT_CHANGED, ProductChangedEvent, event_bus
+from app.core.lifecycle import lifecycle
+from app.core.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimiter,
+    RateLimitRule,
+    RateLimitStore,
+    RedisRateLimitStore,
+)
+from app.core.single_flight import SingleFlight
+from app.infrastructure.persistence.repositories.batching_product_repository_impl import (
+    BatchingProductRepository,
+)
+from app.infrastructure.persistence.repositories.cached_product_repository_impl import (
+    CachedProductRepository,
+)
 from app.infrastructure.persistence.repositories.order_item_repository_impl import (
     SQLOrderItemRepository,
 )
+from app.infrastructure.persistence.repositories.order_job_repository_impl import (
+    SQLOrderJobRepository,
+)
 from app.infrastructure.persistence.repositories.order_repository_impl import SQLOrderRepository
 from app.infrastructure.persistence.repositories.product_repository_impl import SQLProductRepository
 
+logger = logging.getLogger(__name__)
+
 
 class DependencyContainer:
     def __init__(self):
         self._repositories = {}
         self._services = {}
+        self._caches = {}
+        self._batch_loaders = {}
+        self._id_filters = {}
+        self._single_flight = SingleFlight(enabled=settings.SINGLE_FLIGHT_ENABLED)
+        self._access_tracker = AccessTracker(max_keys=settings.CACHE_WARMUP_PRODUCT_LIMIT * 10)
+        self._cache_backend: CacheBackend = create_cache_backend(settings.CACHE_BACKEND_URL)
+        self._invalidation_bridge = CacheInvalidationBridge(
+            self._cache_backend, event_bus, settings.CACHE_INVALIDATION_CHANNEL
+        )
+        self._product_stream_hub = BroadcastHub(
+            max_queue_size=settings.PRODUCT_STREAM_QUEUE_SIZE,
+            replay_size=settings.PRODUCT_STREAM_REPLAY_SIZE,
+        )
+        event_bus.subscribe(PRODUCT_CHANGED, self._publish_product_change)
+        # Fluxos SSE nunca terminam sozinhos: são encerrados assim que a drenagem começa
+        lifecycle.on_drain(self._product_stream_hub.close)
+        self._admission_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._initialize_admission_limiters()
+        self._rate_limiter: RateLimiter | None = None
+        self._initialize_rate_limiter()
+        self._initialize_caches()
         self._initialize_repositories()
         self._initialize_services()
 
+    def _initialize_admission_limiters(self):
+        """Initialize per route group concurrency limiters enabled by configuration"""
+        if not settings.ADMISSION_CONTROL_ENABLED:
+            return
+        groups = {
+            "read": (
+                settings.ADMISSION_READ_INITIAL_LIMIT,
+                settings.ADMISSION_READ_MAX_LIMIT,
+                settings.ADMISSION_READ_TARGET_LATENCY_MS,
+            ),
+            "write": (
+                settings.ADMISSION_WRITE_INITIAL_LIMIT,
+                settings.ADMISSION_WRITE_MAX_LIMIT,
+                settings.ADMISSION_WRITE_TARGET_LATENCY_MS,
+            ),
+        }
+        for group, (initial_limit, max_limit, target_latency_ms) in groups.items():
+            self._admission_limiters[group] = AdaptiveConcurrencyLimiter(
+                initial_limit=initial_limit,
+                min_limit=settings.ADMISSION_MIN_LIMIT,
+                max_limit=max_limit,
+                target_latency_seconds=target_latency_ms / 1000,
+                max_queue=settings.ADMISSION_QUEUE_SIZE,
+                queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000,
+            )
+
+    def _initialize_rate_limiter(self):
+        """Initialize the per client rate limiter, sharing buckets through a shared cache backend"""
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        store: RateLimitStore
+        if self._cache_backend.shared:
+            store = RedisRateLimitStore(self._cache_backend.client)
+        else:
+            store = InMemoryRateLimitStore(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+        default_rule = (
+            RateLimitRule.parse("default", settings.RATE_LIMIT_DEFAULT)
+            if settings.RATE_LIMIT_DEFAULT
+            else None
+        )
+        self._rate_limiter = RateLimiter(store, default_rule, settings.RATE_LIMIT_RULES)
+
+    def _initialize_caches(self):
+        """Initialize in-process caches enabled by configuration"""
+        if settings.PRODUCT_CACHE_ENABLED:
+            self._caches["product_cache"] = LRUTTLCache(
+                max_size=settings.PRODUCT_CACHE_MAX_SIZE,
+                ttl_seconds=settings.PRODUCT_CACHE_TTL_SECONDS,
+            )
+            self._caches["product_negative_cache"] = LRUTTLCache(
+                max_size=settings.PRODUCT_NEGATIVE_CACHE_MAX_SIZE,
+                ttl_seconds=settings.PRODUCT_NEGATIVE_CACHE_TTL_SECONDS,
+            )
+        if settings.PRODUCT_CACHE_ENABLED and settings.PRODUCT_ID_FILTER_ENABLED:
+            # Sem backend compartilhado, remoções feitas por outros workers não chegam aqui e
+            # o filtro não saberia que um ID removido pode voltar a ser atribuído. Sem
+            # SERVER_WORKERS o app não veio do launcher (que sempre o define): um só processo
+            if not self._cache_backend.shared and settings.SERVER_WORKERS not in (None, 1):
+                logger.info(
+                    "Filtro de IDs de produtos desativado: requer CACHE_BACKEND_URL "
+                    "compartilhado ou SERVER_WORKERS=1"
+                )
+            else:
+                self._id_filters["product_id_filter"] = KnownIdFilter(
+                    capacity=settings.PRODUCT_ID_FILTER_CAPACITY,
+                    error_rate=settings.PRODUCT_ID_FILTER_ERROR_RATE,
+                )
+        if settings.RESPONSE_CACHE_ENABLED:
+            response_cache = ResponseCache(
+                max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+            )
+            event_bus.subscribe(PRODUCT_CHANGED, response_cache.bump_generation)
+            self._caches["product_list_response_cache"] = response_cache
+
     def _initialize_repositories(self):
         """Initialize all repositories as singletons"""
-        self._repositories["product_repository"] = SQLProductRepository()
+        product_repository = SQLProductRepository()
+        if settings.PRODUCT_BATCH_LOADER_ENABLED:
+            product_repository = BatchingProductRepository(
+                product_repository,
+                window_seconds=settings.PRODUCT_BATCH_LOADER_WINDOW_MS / 1000,
+                max_batch_size=settings.PRODUCT_BATCH_LOADER_MAX_BATCH_SIZE,
+            )
+            self._batch_loaders["product_loader"] = product_repository.loader
+        if "product_cache" in self._caches:
+            product_repository = CachedProductRepository(
+                product_repository,
+                self._caches["product_cache"],
+                shared_cache=self._cache_backend if self._cache_backend.shared else None,
+                shared_ttl_seconds=settings.PRODUCT_CACHE_TTL_SECONDS,
+                shared_tombstone_seconds=settings.PRODUCT_CACHE_TOMBSTONE_SECONDS,
+                negative_cache=self._caches["product_negative_cache"],
+                id_filter=self._id_filters.get("product_id_filter"),
+            )
+            event_bus.subscribe(PRODUCT_CHANGED, product_repository.on_product_changed)
+        self._repositories["product_repository"] = product_repository
         self._repositories["order_repository"] = SQLOrderRepository()
         self._repositories["order_item_repository"] = SQLOrderItemRepository()
+        self._repositories["order_job_repository"] = SQLOrderJobRepository()
 
     def _initialize_services(self):
         """Initialize all services with repository dependencies"""
         self._services["product_service"] = ProductService(
-            product_repository=self._repositories["product_repository"]
+            product_repository=self._repositories["product_repository"],
+            single_flight=self._single_flight,
+            access_tracker=self._access_tracker,
+            max_batch_ids=settings.PRODUCT_BATCH_GET_MAX_IDS,
+        )
+
+        self._services["cache_warmup_service"] = CacheWarmupService(
+            product_repository=self._repositories["product_repository"],
+            order_item_repository=self._repositories["order_item_repository"],
+            access_tracker=self._access_tracker,
+            product_limit=settings.CACHE_WARMUP_PRODUCT_LIMIT,
+            batch_size=settings.PRODUCT_BATCH_LOADER_MAX_BATCH_SIZE,
+            concurrency=settings.CACHE_WARMUP_CONCURRENCY,
+            timeout_seconds=settings.CACHE_WARMUP_TIMEOUT_SECONDS,
+            snapshot_path=settings.CACHE_WARMUP_SNAPSHOT_PATH,
+        )
+
+        self._services["order_queue_service"] = OrderQueueService(
+            order_job_repository=self._repositories["order_job_repository"],
+            order_repository=self._repositories["order_repository"],
+            workers=settings.ORDER_QUEUE_WORKERS,
+            batch_size=settings.ORDER_QUEUE_BATCH_SIZE,
+            poll_interval_seconds=settings.ORDER_QUEUE_POLL_INTERVAL_SECONDS,
+            lease_seconds=settings.ORDER_QUEUE_LEASE_SECONDS,
+            max_attempts=settings.ORDER_QUEUE_MAX_ATTEMPTS,
+            retry_backoff_seconds=settings.ORDER_QUEUE_RETRY_BACKOFF_SECONDS,
+            retry_backoff_max_seconds=settings.ORDER_QUEUE_RETRY_BACKOFF_MAX_SECONDS,
         )
 
         self._services["order_service"] = OrderService(
             order_repository=self._repositories["order_repository"],
             order_item_repository=self._repositories["order_item_repository"],
             product_repository=self._repositories["product_repository"],
+            order_queue_service=(
+                self._services["order_queue_service"] if settings.ORDER_QUEUE_ENABLED else None
+            ),
+            single_flight=self._single_flight,
         )
 
         self._services["order_item_service"] = OrderItemService(
             order_item_repository=self._repositories["order_item_repository"],
         )
 
+    def _publish_product_change(self, event: ProductChangedEvent) -> None:
+        """Repassa mudanças de produto (locais e de outros workers) ao fluxo SSE"""
+        self._product_stream_hub.publish(
+            {"id": event.product_id, "action": event.action, **(event.stock or {})}
+        )
+
+    # Lifecycle
+    async def start(self) -> None:
+        """Start background components (cache invalidation, order queue workers)"""
+        self._product_stream_hub.reopen()
+        await self._invalidation_bridge.start()
+        product_repository = self._repositories["product_repository"]
+        if isinstance(product_repository, CachedProductRepository):
+            await product_repository.load_id_filter()
+        self._services["cache_warmup_service"].load_snapshot()
+        if settings.ORDER_QUEUE_ENABLED:
+            await self._services["order_queue_service"].start()
+
+    async def stop(self) -> None:
+        self._product_stream_hub.close()
+        await self._services["order_queue_service"].stop(
+            timeout=settings.SHUTDOWN_QUEUE_TIMEOUT_SECONDS
+        )
+        self._services["cache_warmup_service"].save_snapshot()
+        await self._invalidation_bridge.stop()
+        await self._cache_backend.close()
+
+    # Cache getters
+    def get_response_cache(self) -> ResponseCache | None:
+        return self._caches.get("product_list_response_cache")
+
+    def get_cache_stats(self) -> dict[str, dict]:
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
+    def get_batch_loader_stats(self) -> dict[str, dict]:
+        return {name: loader.stats() for name, loader in self._batch_loaders.items()}
+
+    def get_id_filter_stats(self) -> dict[str, dict]:
+        return {name: id_filter.stats() for name, id_filter in self._id_filters.items()}
+
+    def get_single_flight_stats(self) -> dict:
+        return self._single_flight.stats()
+
+    def get_admission_limiters(self) -> dict[str, AdaptiveConcurrencyLimiter]:
+        return self._admission_limiters
+
+    def get_admission_stats(self) -> dict[str, dict]:
+        return {group: limiter.stats() for group, limiter in self._admission_limiters.items()}
+
+    def get_rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    def get_rate_limit_stats(self) -> dict:
+        if self._rate_limiter is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._rate_limiter.stats()}
+
+    def get_product_stream_stats(self) -> dict:
+        return self._product_stream_hub.stats()
+
+    def get_product_stream_hub(self) -> BroadcastHub:
+        return self._product_stream_hub
+
     # Service getters
     def get_product_service(self) -> ProductService:
         return self._services["product_service"]
@@ -47,11 +290,25 @@ class DependencyContainer:
     def get_order_item_service(self) -> OrderItemService:
         return self._services["order_item_service"]
 
+    def get_order_queue_service(self) -> OrderQueueService:
+        return self._services["order_queue_service"]
+
+    def get_cache_warmup_service(self) -> CacheWarmupService:
+        return self._services["cache_warmup_service"]
+
 
 # Global container instance
 dependency_container = DependencyContainer()
 
 
+async def start_dependencies() -> None:
+    await dependency_container.start()
+
+
+async def stop_dependencies() -> None:
+    await dependency_container.stop()
+
+
 # FastAPI dependency functions
 def get_product_service() -> ProductService:
     return dependency_container.get_product_service()
@@ -63,3 +320,55 @@ def get_order_service() -> OrderService:
 
 def get_order_item_service() -> OrderItemService:
     return dependency_container.get_order_item_service()
+
+
+def get_order_queue_service() -> OrderQueueService:
+    return dependency_container.get_order_queue_service()
+
+
+def get_cache_warmup_service() -> CacheWarmupService:
+    return dependency_container.get_cache_warmup_service()
+
+
+def get_response_cache() -> ResponseCache | None:
+    return dependency_container.get_response_cache()
+
+
+def get_batch_loader_stats() -> dict[str, dict]:
+    return dependency_container.get_batch_loader_stats()
+
+
+def get_single_flight_stats() -> dict:
+    return dependency_container.get_single_flight_stats()
+
+
+def get_id_filter_stats() -> dict[str, dict]:
+    return dependency_container.get_id_filter_stats()
+
+
+def get_cache_stats() -> dict[str, dict]:
+    return dependency_container.get_cache_stats()
+
+
+def get_admission_limiters() -> dict[str, AdaptiveConcurrencyLimiter]:
+    return dependency_container.get_admission_limiters()
+
+
+def get_admission_stats() -> dict[str, dict]:
+    return dependency_container.get_admission_stats()
+
+
+def get_rate_limiter() -> RateLimiter | None:
+    return dependency_container.get_rate_limiter()
+
+
+def get_rate_limit_stats() -> dict:
+    return dependency_container.get_rate_limit_stats()
+
+
+def get_product_stream_stats() -> dict:
+    return dependency_container.get_product_stream_stats()
+
+
+def get_product_stream_hub() -> BroadcastHub:
+    return dependency_container.get_product_stream_hub()
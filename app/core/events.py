@@ -0,0 +1,67 @@
+"""
+Barramento de eventos em processo.
+
+Permite que caminhos de escrita (repositórios) notifiquem caches e outros consumidores
+sem conhecê-los diretamente. Os handlers são síncronos e executados na ordem de inscrição.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_CHANGED = "product.changed"
+
+
+def _stock_of(product: Any) -> dict | None:
+    if product is None:
+        return None
+    return {
+        "quantity": product.quantity,
+        "price": str(product.price),
+        "updated_at": product.updated_at.isoformat(),
+    }
+
+
+class ProductChangedEvent:
+    def __init__(
+        self,
+        product_id: int,
+        action: str,
+        product: Any = None,
+        origin: str | None = None,
+        stock: dict | None = None,
+    ):
+        self.product_id = product_id
+        # "created", "updated" ou "deleted"
+        self.action = action
+        self.product = product
+        # None para eventos locais; id da instância de origem para eventos vindos de outro worker
+        self.origin = origin
+        # Estoque e preço após a mudança, já serializáveis: extraídos de `product` nos eventos
+        # locais e recebidos prontos nos eventos de outros workers
+        self.stock = stock if stock is not None else _stock_of(product)
+
+
+class EventBus:
+    def __init__(self):
+        self._handlers: dict[str, list[Callable[[Any], None]]] = defaultdict(list)
+
+    def subscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
+        self._handlers[topic].append(handler)
+
+    def unsubscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
+        if handler in self._handlers[topic]:
+            self._handlers[topic].remove(handler)
+
+    def publish(self, topic: str, event: Any) -> None:
+        for handler in list(self._handlers[topic]):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Erro no handler do evento {topic}: {str(e)}", exc_info=True)
+
+
+event_bus = EventBus()
@@ -0,0 +1,64 @@
+"""
+Estado de desligamento do processo e contagem de requisições em andamento.
+
+`begin_drain()` é chamado quando o servidor recebe o sinal de parada (ver `app.launcher`) e,
+de novo, no início do shutdown do lifespan: a instância passa a responder /ready com 503,
+os fluxos SSE são encerrados e as respostas saem com `Connection: close`, para que os
+clientes reconectem em outra instância. O lifespan então espera as requisições em
+andamento terminarem, até um prazo, antes de parar a fila e descartar o pool.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class Lifecycle:
+    def __init__(self):
+        self.draining = False
+        self._in_flight = 0
+        self._drain_callbacks: list[Callable[[], None]] = []
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def on_drain(self, callback: Callable[[], None]) -> None:
+        self._drain_callbacks.append(callback)
+
+    def begin_drain(self) -> None:
+        if self.draining:
+            return
+        self.draining = True
+        logger.info(f"Iniciando drenagem: {self._in_flight} requisições em andamento")
+        for callback in self._drain_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Erro ao iniciar drenagem: {str(e)}", exc_info=True)
+
+    def request_started(self) -> None:
+        self._in_flight += 1
+
+    def request_finished(self) -> None:
+        self._in_flight -= 1
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """Espera não haver requisições em andamento; False se o prazo acabar antes"""
+        # Polling em vez de asyncio.Event: o objeto é global e sobrevive a mais de um event loop
+        deadline = time.monotonic() + timeout
+        while self._in_flight > 0:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def reset(self) -> None:
+        """Volta ao estado inicial (novo ciclo de startup no mesmo processo, como nos testes)"""
+        self.draining = False
+
+
+lifecycle = Lifecycle()
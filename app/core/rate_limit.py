@@ -0,0 +1,214 @@
+"""
+Rate limiting por token bucket, com estado em memória ou num store compartilhado.
+
+Cada bucket guarda só (tokens, instante da última atualização): a recarga é calculada na
+consulta, então cada verificação é O(1) e não há tarefas periódicas. `InMemoryRateLimitStore`
+vale para um único worker; `RedisRateLimitStore` compartilha os buckets entre workers
+(fakeredis serve de dublê local em testes), atualizando cada bucket numa transação
+WATCH/MULTI para que workers concorrentes não gastem o mesmo token.
+"""
+
+import logging
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from app.core.route_rules import RouteRules
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover - dependência opcional
+    WatchError = None
+
+logger = logging.getLogger(__name__)
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RULE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day|s|m|h|d)\s*$")
+_SHORT_PERIODS = {"s": "second", "m": "minute", "h": "hour", "d": "day"}
+
+
+class RateLimitRule:
+    """`limit` requisições por `period_seconds`, com rajada de até `limit`"""
+
+    __slots__ = ("name", "limit", "period_seconds", "refill_per_second")
+
+    def __init__(self, name: str, limit: int, period_seconds: float):
+        if limit <= 0 or period_seconds <= 0:
+            raise ValueError(f"Regra de rate limit inválida: {name}")
+        self.name = name
+        self.limit = limit
+        self.period_seconds = period_seconds
+        self.refill_per_second = limit / period_seconds
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "RateLimitRule":
+        """Formatos: `120/minute`, `10/second`, `1000/hour`, `20/5s`"""
+        match = _RULE_PATTERN.match(spec)
+        if match is None:
+            raise ValueError(f"Regra de rate limit inválida para {name}: {spec!r}")
+        limit, count, unit = match.groups()
+        unit = _SHORT_PERIODS.get(unit, unit)
+        return cls(name, int(limit), int(count or 1) * _PERIODS[unit])
+
+    @property
+    def policy(self) -> str:
+        return f"{self.limit};w={int(self.period_seconds)}"
+
+
+class RateLimitResult:
+    __slots__ = ("allowed", "limit", "remaining", "reset_seconds", "retry_after_seconds")
+
+    def __init__(
+        self,
+        allowed: bool,
+        limit: int,
+        remaining: int,
+        reset_seconds: int,
+        retry_after_seconds: int,
+    ):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        # Segundos até o bucket voltar a ficar cheio
+        self.reset_seconds = reset_seconds
+        # Segundos até haver tokens para a próxima requisição (0 quando permitida)
+        self.retry_after_seconds = retry_after_seconds
+
+
+def consume_tokens(
+    tokens: float, updated_at: float, now: float, rule: RateLimitRule, cost: int = 1
+) -> tuple[float, RateLimitResult]:
+    """Recarrega o bucket até `now` e tenta gastar `cost` tokens; devolve o novo saldo"""
+    tokens = min(float(rule.limit), tokens + max(0.0, now - updated_at) * rule.refill_per_second)
+    allowed = tokens >= cost
+    if allowed:
+        tokens -= cost
+    missing = 0.0 if allowed else cost - tokens
+    result = RateLimitResult(
+        allowed=allowed,
+        limit=rule.limit,
+        remaining=int(tokens),
+        reset_seconds=math.ceil((rule.limit - tokens) / rule.refill_per_second),
+        retry_after_seconds=math.ceil(missing / rule.refill_per_second),
+    )
+    return tokens, result
+
+
+class RateLimitStore(ABC):
+    @abstractmethod
+    async def consume(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Buckets do processo, limitados a `max_keys` (os menos usados recentemente saem)"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (float(rule.limit), now))
+        tokens, result = consume_tokens(tokens, updated_at, now, rule, cost)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return result
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Buckets compartilhados num servidor que fale o protocolo Redis"""
+
+    def __init__(self, client: Any, key_prefix: str = "ecommerce:ratelimit:", retries: int = 3):
+        # Sem ao menos uma tentativa não haveria leitura do bucket para decidir
+        if retries < 1:
+            raise ValueError(f"retries deve ser pelo menos 1: {retries}")
+        self.client = client
+        self.key_prefix = key_prefix
+        self.retries = retries
+
+    async def consume(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        key = f"{self.key_prefix}{key}"
+        # Um bucket parado por um período inteiro está cheio: pode expirar
+        ttl_ms = int(rule.period_seconds * 1000) + 1000
+        async with self.client.pipeline(transaction=True) as pipe:
+            for _ in range(self.retries):
+                try:
+                    await pipe.watch(key)
+                    now = time.time()
+                    raw = await pipe.get(key)
+                    if raw is None:
+                        tokens, updated_at = float(rule.limit), now
+                    else:
+                        tokens, _, updated_at = raw.decode().partition(":")
+                        tokens, updated_at = float(tokens), float(updated_at)
+                    tokens, result = consume_tokens(tokens, updated_at, now, rule, cost)
+                    pipe.multi()
+                    pipe.set(key, f"{tokens:.6f}:{now:.6f}", px=ttl_ms)
+                    await pipe.execute()
+                    return result
+                except WatchError:
+                    continue
+        # Disputa contínua pelo mesmo bucket: decide com a última leitura, sem gravar
+        logger.warning(f"Rate limit: bucket {key} em disputa após {self.retries} tentativas")
+        return result
+
+
+class RateLimiter:
+    """
+    Associa cada requisição à regra da rota e consome o bucket (regra, cliente) no store.
+
+    Regras por rota seguem `app.core.route_rules` (`"GET /orders"`); sem correspondência,
+    vale a regra padrão. Cada regra tem buckets próprios, então um cliente que esgota
+    `GET /orders` continua navegando produtos.
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        default_rule: RateLimitRule | None,
+        rules: dict[str, str] | None = None,
+    ):
+        self.store = store
+        self.default_rule = default_rule
+        self._rules = RouteRules(
+            {name: RateLimitRule.parse(name, spec) for name, spec in (rules or {}).items()}
+        )
+        self._allowed = 0
+        self._limited = 0
+        self._errors = 0
+
+    def rule_for(self, method: str, path: str) -> RateLimitRule | None:
+        return self._rules.match(method, path, default=self.default_rule)
+
+    async def check(
+        self, client_id: str, method: str, path: str
+    ) -> tuple[RateLimitRule, RateLimitResult] | None:
+        """None quando a rota não tem regra ou o store está indisponível (falha aberta)"""
+        rule = self.rule_for(method, path)
+        if rule is None:
+            return None
+        try:
+            result = await self.store.consume(f"{rule.name}:{client_id}", rule)
+        except Exception as e:
+            # Um store fora do ar não pode derrubar a API inteira
+            self._errors += 1
+            logger.warning(f"Rate limit indisponível, requisição liberada: {str(e)}")
+            return None
+        if result.allowed:
+            self._allowed += 1
+        else:
+            self._limited += 1
+        return rule, result
+
+    def stats(self) -> dict:
+        return {
+            "store": type(self.store).__name__,
+            "allowed": self._allowed,
+            "limited": self._limited,
+            "errors": self._errors,
+        }
@@ -0,0 +1,32 @@
+"""
+Regras configuradas por rota no formato `"METHOD /prefixo"` (ou `"* /prefixo"` para qualquer
+método), usadas pelo rate limiting e pelos prazos de requisição.
+"""
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RouteRules(Generic[T]):
+    """Vence o prefixo mais longo; `/orders` cobre `/orders/1`, mas não `/ordersx`"""
+
+    def __init__(self, rules: dict[str, T] | None = None):
+        self._rules: list[tuple[str, str, T]] = []
+        for name, value in (rules or {}).items():
+            method, _, prefix = name.strip().partition(" ")
+            prefix = prefix.strip()
+            if not prefix.startswith("/"):
+                raise ValueError(f"Rota inválida: {name!r}")
+            self._rules.append((method.upper(), prefix.rstrip("/") or "/", value))
+        # Prefixos mais longos primeiro; a primeira correspondência vence
+        self._rules.sort(key=lambda item: len(item[1]), reverse=True)
+
+    def match(self, method: str, path: str, default: T | None = None) -> T | None:
+        """Valor da regra da rota, que pode ser None; `default` quando nenhuma regra cobre"""
+        for rule_method, prefix, value in self._rules:
+            if rule_method not in ("*", method):
+                continue
+            if path == prefix or path.startswith(prefix if prefix == "/" else prefix + "/"):
+                return value
+        return default
@@ -0,0 +1,79 @@
+"""
+Coalescência de chamadas concorrentes idênticas (single-flight).
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from app.core.deadline import detached_context
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Garante no máximo uma execução em andamento por chave.
+
+    Chamadas concorrentes com a mesma chave aguardam a mesma coroutine e recebem o mesmo
+    resultado (ou a mesma exceção). A execução roda em uma task própria, sem o prazo da
+    requisição que a iniciou: o cancelamento ou o prazo de um chamador não interrompe o
+    trabalho compartilhado com os demais. O resultado é compartilhado por referência,
+    portanto deve ser tratado como somente leitura.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._executed: dict[str, int] = defaultdict(int)
+        self._coalesced: dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _operation(key: Hashable) -> str:
+        return str(key[0]) if isinstance(key, tuple) and key else str(key)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        operation = self._operation(key)
+        if not self.enabled:
+            self._executed[operation] += 1
+            return await fn()
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced[operation] += 1
+            return await asyncio.shield(task)
+
+        self._executed[operation] += 1
+        task = detached_context().run(asyncio.get_running_loop().create_task, fn())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Evita "exception was never retrieved" quando todos os chamadores foram cancelados
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        executed = sum(self._executed.values())
+        coalesced = sum(self._coalesced.values())
+        operations = sorted(set(self._executed) | set(self._coalesced))
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._in_flight),
+            "executed": executed,
+            "coalesced": coalesced,
+            "coalesced_ratio": (
+                round(coalesced / (executed + coalesced), 4) if executed + coalesced else 0.0
+            ),
+            "operations": {
+                operation: {
+                    "executed": self._executed[operation],
+                    "coalesced": self._coalesced[operation],
+                }
+                for operation in operations
+            },
+        }
@@ -1,3 +1,9 @@
+from collections.abc import Iterator, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
 @staticmethod
 def update_columns_obj(obj: object, **kwargs: object) -> object:
     """Atualiza os atributos de um objeto com base nos valores fornecidos nos kwargs"""
@@ -5,3 +11,9 @@ def update_columns_obj(obj: object, **kwargs: object) -> object:
         if value is not None:
             setattr(obj, key, value)
     return obj
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Divide uma sequência em blocos de no máximo `size` elementos"""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
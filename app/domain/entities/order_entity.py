@@ -4,6 +4,8 @@ from app.domain.entities.order_item_entity import OrderItemEntity
 
 
 class OrderEntity:
+    __slots__ = ("id", "order_date", "status", "total_amount")
+
     def __init__(
         self,
         id: int | None = None,
@@ -18,6 +20,8 @@ class OrderEntity:
 
 
 class OrderCompleteEntity(OrderEntity):
+    __slots__ = ("items",)
+
     def __init__(
         self,
         id: int | None = None,
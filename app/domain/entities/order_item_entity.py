@@ -1,4 +1,6 @@
 class OrderItemEntity:
+    __slots__ = ("id", "product_id", "order_id", "quantity", "price")
+
     def __init__(
         self,
         id: int | None = None,
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+
+class OrderJobEntity:
+    def __init__(
+        self,
+        order_id: int,
+        target_status: str,
+        id: int | None = None,
+        status: str | None = None,
+        attempts: int = 0,
+        available_at: datetime | None = None,
+        leased_until: datetime | None = None,
+        last_error: str | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        self.id = id
+        self.order_id = order_id
+        self.target_status = target_status
+        self.status = status
+        self.attempts = attempts
+        self.available_at = available_at
+        self.leased_until = leased_until
+        self.last_error = last_error
+        self.created_at = created_at
+        self.updated_at = updated_at
@@ -3,6 +3,8 @@ from decimal import Decimal
 
 
 class ProductEntity:
+    __slots__ = ("id", "name", "description", "price", "quantity", "created_at", "updated_at")
+
     def __init__(
         self,
         name: str,
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class OrderJobStatus(str, Enum):
+    """Status possíveis para um job da fila de processamento de pedidos."""
+
+    QUEUED = "Queued"
+    PROCESSING = "Processing"
+    DONE = "Done"
+    DEAD = "Dead"
+
+    def __str__(self) -> str:
+        return self.value
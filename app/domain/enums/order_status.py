@@ -13,3 +13,26 @@ class OrderStatus(str, Enum):
 
     def __str__(self) -> str:
         return self.value
+
+
+# Transições de status permitidas: status atual -> status de destino aceitos
+ALLOWED_TRANSITIONS: dict[OrderStatus, frozenset[OrderStatus]] = {
+    OrderStatus.PENDING: frozenset({OrderStatus.PROCESSING, OrderStatus.CANCELLED}),
+    OrderStatus.PROCESSING: frozenset({OrderStatus.SHIPPED, OrderStatus.CANCELLED}),
+    OrderStatus.SHIPPED: frozenset({OrderStatus.DELIVERED}),
+    OrderStatus.DELIVERED: frozenset({OrderStatus.REFUNDED}),
+    OrderStatus.CANCELLED: frozenset(),
+    OrderStatus.REFUNDED: frozenset(),
+}
+
+
+def can_transition(from_status: OrderStatus, to_status: OrderStatus) -> bool:
+    """Indica se a transição de status é permitida pela tabela de transições."""
+    return to_status in ALLOWED_TRANSITIONS.get(from_status, frozenset())
+
+
+# Etapas de fulfilment executadas pela fila de processamento: status atual -> próximo status
+FULFILLMENT_FLOW: dict[OrderStatus, OrderStatus] = {
+    OrderStatus.PENDING: OrderStatus.PROCESSING,
+    OrderStatus.PROCESSING: OrderStatus.SHIPPED,
+}
@@ -11,3 +11,7 @@ class OrderItemRepository(ABC):
     @abstractmethod
     async def create_bulk(self, order_items: list[OrderItemEntity]) -> list[OrderItemEntity]:
         pass
+
+    @abstractmethod
+    async def get_top_product_ids(self, limit: int) -> list[int]:
+        """IDs dos produtos presentes em mais itens de pedido, do mais vendido ao menos"""
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.entities.order_job_entity import OrderJobEntity
+
+
+class OrderJobRepository(ABC):
+    @abstractmethod
+    async def enqueue(self, job: OrderJobEntity) -> OrderJobEntity:
+        pass
+
+    @abstractmethod
+    async def enqueue_bulk(self, jobs: list[OrderJobEntity]) -> int:
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, limit: int, lease_seconds: int) -> list[OrderJobEntity]:
+        pass
+
+    @abstractmethod
+    async def complete(self, job_id: int, next_job: OrderJobEntity | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def schedule_retry(self, job_id: int, error: str, available_at: datetime) -> None:
+        pass
+
+    @abstractmethod
+    async def dead_letter(self, job_id: int, error: str) -> None:
+        pass
+
+    @abstractmethod
+    async def count_by_status(self) -> dict[str, int]:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from app.domain.entities.order_entity import OrderCompleteEntity, OrderEntity
 
@@ -9,7 +10,9 @@ class OrderRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self) -> list[OrderCompleteEntity]:
+    async def get_all(
+        self, fields: Sequence[str] | None = None, include_items: bool = True
+    ) -> list[OrderCompleteEntity]:
         pass
 
     @abstractmethod
@@ -19,3 +22,15 @@ class OrderRepository(ABC):
     @abstractmethod
     async def delete_by_id(self, order_id: str) -> bool:
         pass
+
+    @abstractmethod
+    async def get_statuses(self, order_ids: list[int]) -> dict[int, str]:
+        pass
+
+    @abstractmethod
+    async def bulk_update_status(self, groups: dict[tuple[str, str], list[int]]) -> set[int]:
+        pass
+
+    @abstractmethod
+    async def create_bulk(self, orders: list[OrderCompleteEntity]) -> list[OrderCompleteEntity]:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from app.domain.entities.product_entity import ProductEntity
 
@@ -9,7 +10,9 @@ class ProductRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 10) -> list[ProductEntity]:
+    async def get_all(
+        self, skip: int = 0, limit: int = 10, fields: Sequence[str] | None = None
+    ) -> list[ProductEntity]:
         pass
 
     @abstractmethod
@@ -27,3 +30,18 @@ class ProductRepository(ABC):
     @abstractmethod
     async def get_bulk_by_ids(self, product_ids: list[int]) -> list[ProductEntity]:
         pass
+
+    @abstractmethod
+    async def get_all_ids(self) -> list[int]:
+        pass
+
+    @abstractmethod
+    async def reserve_stock(self, quantities: dict[int, int]) -> set[int]:
+        """
+        Subtrai `quantities[product_id]` do estoque de cada produto, em uma transação, só
+        onde há estoque suficiente. Retorna os IDs cujo estoque foi reservado.
+        """
+
+    @abstractmethod
+    async def release_stock(self, quantities: dict[int, int]) -> None:
+        """Devolve ao estoque quantidades reservadas e não utilizadas."""
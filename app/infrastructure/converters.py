@@ -1,10 +1,16 @@
+import json
+from collections.abc import Mapping
 from datetime import datetime
+from decimal import Decimal
 
 from app.domain.entities.order_entity import OrderCompleteEntity, OrderEntity
 from app.domain.entities.order_item_entity import OrderItemEntity
+from app.domain.entities.order_job_entity import OrderJobEntity
 from app.domain.entities.product_entity import ProductEntity
+from app.domain.enums.order_job_status import OrderJobStatus
 from app.infrastructure.persistence.models import ProductORM
 from app.infrastructure.persistence.models.order_item_orm_model import OrderItemORM
+from app.infrastructure.persistence.models.order_job_orm_model import OrderJobORM
 from app.infrastructure.persistence.models.order_orm_model import OrderORM
 
 
@@ -21,6 +27,19 @@ class ProductConverter:
             updated_at=orm.updated_at,
         )
 
+    @staticmethod
+    def row_to_entity(row: Mapping) -> ProductEntity:
+        """Entidade parcial a partir de uma consulta projetada: colunas ausentes ficam None"""
+        return ProductEntity(
+            name=row.get("name"),
+            description=row.get("description"),
+            price=row.get("price"),
+            quantity=row.get("quantity"),
+            id=row["id"],
+            created_at=row.get("created_at"),
+            updated_at=row["updated_at"],
+        )
+
     @staticmethod
     def entity_to_orm(entity: ProductEntity) -> ProductORM:
         return ProductORM(
@@ -33,6 +52,34 @@ class ProductConverter:
             updated_at=entity.updated_at or datetime.utcnow(),
         )
 
+    @staticmethod
+    def entity_to_cache(entity: ProductEntity) -> bytes:
+        return json.dumps(
+            {
+                "id": entity.id,
+                "name": entity.name,
+                "description": entity.description,
+                "price": str(entity.price),
+                "quantity": entity.quantity,
+                "created_at": entity.created_at.isoformat(),
+                "updated_at": entity.updated_at.isoformat(),
+            },
+            separators=(",", ":"),
+        ).encode()
+
+    @staticmethod
+    def cache_to_entity(data: bytes) -> ProductEntity:
+        payload = json.loads(data)
+        return ProductEntity(
+            id=payload["id"],
+            name=payload["name"],
+            description=payload["description"],
+            price=Decimal(payload["price"]),
+            quantity=payload["quantity"],
+            created_at=datetime.fromisoformat(payload["created_at"]),
+            updated_at=datetime.fromisoformat(payload["updated_at"]),
+        )
+
 
 class OrderConverter:
     @staticmethod
@@ -65,6 +112,19 @@ class OrderConverter:
         order_entity.items = items
         return order_entity
 
+    @staticmethod
+    def row_to_complete_entity(
+        row: Mapping, items: list[OrderItemEntity] | None = None
+    ) -> OrderCompleteEntity:
+        """Pedido parcial a partir de uma consulta projetada: colunas ausentes ficam None"""
+        return OrderCompleteEntity(
+            id=row["id"],
+            order_date=row.get("order_date"),
+            status=row.get("status"),
+            total_amount=row.get("total_amount"),
+            items=items,
+        )
+
 
 class OrderItemConverter:
     @staticmethod
@@ -85,3 +145,33 @@ class OrderItemConverter:
             quantity=entity.quantity,
             price=entity.price,
         )
+
+
+class OrderJobConverter:
+    @staticmethod
+    def orm_to_entity(orm: OrderJobORM) -> OrderJobEntity:
+        return OrderJobEntity(
+            id=orm.id,
+            order_id=orm.order_id,
+            target_status=orm.target_status,
+            status=orm.status,
+            attempts=orm.attempts,
+            available_at=orm.available_at,
+            leased_until=orm.leased_until,
+            last_error=orm.last_error,
+            created_at=orm.created_at,
+            updated_at=orm.updated_at,
+        )
+
+    @staticmethod
+    def entity_to_orm(entity: OrderJobEntity) -> OrderJobORM:
+        now = datetime.utcnow()
+        return OrderJobORM(
+            order_id=entity.order_id,
+            target_status=entity.target_status,
+            status=entity.status or OrderJobStatus.QUEUED.value,
+            attempts=entity.attempts,
+            available_at=entity.available_at or now,
+            created_at=entity.created_at or now,
+            updated_at=entity.updated_at or now,
+        )
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.core.databases.database import Base
+from app.domain.enums.order_job_status import OrderJobStatus
+
+
+class OrderJobORM(Base):
+    __tablename__ = "order_jobs"
+    __table_args__ = (Index("ix_order_jobs_status_available_at", "status", "available_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True)
+    target_status = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=OrderJobStatus.QUEUED.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    leased_until = Column(DateTime, nullable=True)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
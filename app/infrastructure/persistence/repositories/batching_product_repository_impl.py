@@ -0,0 +1,63 @@
+import copy
+from collections.abc import Sequence
+
+from app.core.batch_loader import BatchLoader
+from app.domain.entities.product_entity import ProductEntity
+from app.domain.repositories.product_repository import ProductRepository
+
+
+class BatchingProductRepository(ProductRepository):
+    """
+    Micro-batching decorator for a ProductRepository.
+
+    Lookups by id issued by concurrent coroutines within the loader window are resolved
+    with a single `get_bulk_by_ids` (one `IN (...)` query) on the wrapped repository.
+    Each caller receives its own copy of the shared entities.
+    """
+
+    def __init__(
+        self,
+        repository: ProductRepository,
+        window_seconds: float = 0.002,
+        max_batch_size: int = 100,
+    ):
+        self.repository = repository
+        self.loader: BatchLoader[int, ProductEntity] = BatchLoader(
+            self._load_products, window_seconds=window_seconds, max_batch_size=max_batch_size
+        )
+
+    async def _load_products(self, product_ids: list[int]) -> dict[int, ProductEntity]:
+        products = await self.repository.get_bulk_by_ids(product_ids)
+        return {product.id: product for product in products}
+
+    async def create(self, product: ProductEntity) -> ProductEntity:
+        return await self.repository.create(product)
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 10, fields: Sequence[str] | None = None
+    ) -> list[ProductEntity]:
+        return await self.repository.get_all(skip=skip, limit=limit, fields=fields)
+
+    async def get_by_id(self, product_id: int) -> ProductEntity | None:
+        product = await self.loader.load(product_id)
+        return copy.copy(product) if product is not None else None
+
+    async def update(self, product: ProductEntity) -> ProductEntity:
+        return await self.repository.update(product)
+
+    async def delete_by_id(self, product_id: int) -> None:
+        await self.repository.delete_by_id(product_id)
+
+    async def get_bulk_by_ids(self, product_ids: list[int]) -> list[ProductEntity]:
+        unique_ids = list(dict.fromkeys(product_ids))
+        products = await self.loader.load_many(unique_ids)
+        return [copy.copy(product) for product in products if product is not None]
+
+    async def get_all_ids(self) -> list[int]:
+        return await self.repository.get_all_ids()
+
+    async def reserve_stock(self, quantities: dict[int, int]) -> set[int]:
+        return await self.repository.reserve_stock(quantities)
+
+    async def release_stock(self, quantities: dict[int, int]) -> None:
+        return await self.repository.release_stock(quantities)
@@ -0,0 +1,241 @@
+import copy
+import logging
+from collections.abc import Sequence
+
+from app.core.cache.backends import CacheBackend
+from app.core.cache.bloom_filter import KnownIdFilter
+from app.core.cache.lru_ttl_cache import LRUTTLCache
+from app.core.events import ProductChangedEvent
+from app.domain.entities.product_entity import ProductEntity
+from app.domain.repositories.product_repository import ProductRepository
+from app.infrastructure.converters import ProductConverter
+
+logger = logging.getLogger(__name__)
+
+# Valor gravado no cache compartilhado ao invalidar: conta como ausente na leitura
+_TOMBSTONE = b"tombstone"
+
+
+class CachedProductRepository(ProductRepository):
+    """
+    Caching decorator for a ProductRepository.
+
+    Lookups by id are served from an in-process LRU+TTL cache; writes go to the wrapped
+    repository and invalidate the affected entries. Entities are copied in and out of the
+    cache because callers mutate them (e.g. partial updates).
+
+    When a shared backend is given it acts as a second tier behind the local near-cache:
+    local misses are looked up there before hitting the database, and writes evict the
+    shared entry. Other workers evict their near-cache through `on_product_changed`.
+    Evicting writes a short-lived tombstone and fills only create absent keys (SET NX), so a
+    worker that read the row before a concurrent write cannot put the stale value back; that
+    holds as long as the read finishes within `shared_tombstone_seconds`.
+
+    Ids known not to exist are answered without a query: recent misses are kept in a
+    short-lived negative cache, and an optional filter of existing ids rejects the rest.
+    """
+
+    def __init__(
+        self,
+        repository: ProductRepository,
+        cache: LRUTTLCache,
+        shared_cache: CacheBackend | None = None,
+        shared_ttl_seconds: float | None = None,
+        shared_tombstone_seconds: float = 5.0,
+        negative_cache: LRUTTLCache | None = None,
+        id_filter: KnownIdFilter | None = None,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.shared_cache = shared_cache
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.shared_tombstone_seconds = shared_tombstone_seconds
+        self.negative_cache = negative_cache
+        self.id_filter = id_filter
+
+    @staticmethod
+    def _shared_key(product_id: int) -> str:
+        return f"product:{product_id}"
+
+    def on_product_changed(self, event: ProductChangedEvent) -> None:
+        """Applies changes made by other workers to the local caches."""
+        if event.origin is None:
+            return
+        self.cache.delete(event.product_id)
+        if event.action == "created":
+            self._mark_existing(event.product_id)
+        elif event.action == "deleted" and self.id_filter is not None:
+            self.id_filter.remove(event.product_id)
+
+    async def load_id_filter(self) -> None:
+        """Fills the id filter with every existing product id (called at startup)."""
+        if self.id_filter is None:
+            return
+        try:
+            product_ids = await self.repository.get_all_ids()
+        except Exception as e:
+            # Sem a carga completa o filtro não rejeita nada; as buscas seguem para o banco
+            logger.warning(f"Falha ao carregar filtro de IDs de produtos: {str(e)}")
+            return
+        for product_id in product_ids:
+            self.id_filter.add(product_id)
+        self.id_filter.mark_ready()
+        logger.info(f"Filtro de IDs de produtos carregado: {len(self.id_filter.bloom)} IDs")
+
+    def _mark_existing(self, product_id: int) -> None:
+        if self.id_filter is not None:
+            self.id_filter.add(product_id)
+        if self.negative_cache is not None:
+            self.negative_cache.delete(product_id)
+
+    def _known_missing(self, product_id: int) -> bool:
+        if self.id_filter is not None and not self.id_filter.might_exist(product_id):
+            return True
+        return self.negative_cache is not None and self.negative_cache.get(product_id) is not None
+
+    def _remember_missing(self, product_ids: list[int], version: int | None) -> None:
+        if self.negative_cache is None:
+            return
+        for product_id in product_ids:
+            self.negative_cache.set(product_id, True, version=version)
+
+    async def _shared_get_many(self, product_ids: list[int]) -> dict[int, ProductEntity]:
+        if self.shared_cache is None or not product_ids:
+            return {}
+        try:
+            values = await self.shared_cache.get_many(
+                [self._shared_key(product_id) for product_id in product_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao ler cache compartilhado: {str(e)}")
+            return {}
+        return {
+            product_id: ProductConverter.cache_to_entity(value)
+            for product_id, value in zip(product_ids, values)
+            if value is not None and value != _TOMBSTONE
+        }
+
+    async def _shared_set(self, products: list[ProductEntity]) -> None:
+        if self.shared_cache is None:
+            return
+        try:
+            for product in products:
+                # Não sobrescreve um tombstone: a linha lida pode ser anterior à invalidação
+                await self.shared_cache.add(
+                    self._shared_key(product.id),
+                    ProductConverter.entity_to_cache(product),
+                    ttl_seconds=self.shared_ttl_seconds,
+                )
+        except Exception as e:
+            logger.warning(f"Falha ao gravar cache compartilhado: {str(e)}")
+
+    def _negative_version(self) -> int | None:
+        return self.negative_cache.version if self.negative_cache is not None else None
+
+    async def _invalidate(self, product_id: int) -> None:
+        self.cache.delete(product_id)
+        if self.shared_cache is None:
+            return
+        try:
+            await self.shared_cache.set(
+                self._shared_key(product_id),
+                _TOMBSTONE,
+                ttl_seconds=self.shared_tombstone_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao invalidar cache compartilhado: {str(e)}")
+
+    async def create(self, product: ProductEntity) -> ProductEntity:
+        created = await self.repository.create(product)
+        self._mark_existing(created.id)
+        await self._invalidate(created.id)
+        return created
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 10, fields: Sequence[str] | None = None
+    ) -> list[ProductEntity]:
+        return await self.repository.get_all(skip=skip, limit=limit, fields=fields)
+
+    async def get_by_id(self, product_id: int) -> ProductEntity | None:
+        cached = self.cache.get(product_id)
+        if cached is not None:
+            logger.debug(f"Produto {product_id} servido do cache")
+            return copy.copy(cached)
+        if self._known_missing(product_id):
+            logger.debug(f"Produto {product_id} inexistente, consulta evitada")
+            return None
+
+        version = self.cache.version
+        negative_version = self._negative_version()
+        product = (await self._shared_get_many([product_id])).get(product_id)
+        if product is None:
+            product = await self.repository.get_by_id(product_id)
+            if product is None:
+                self._remember_missing([product_id], negative_version)
+                return None
+            await self._shared_set([product])
+        self.cache.set(product_id, copy.copy(product), version=version)
+        return product
+
+    async def update(self, product: ProductEntity) -> ProductEntity:
+        try:
+            return await self.repository.update(product)
+        finally:
+            await self._invalidate(product.id)
+
+    async def delete_by_id(self, product_id: int) -> None:
+        try:
+            await self.repository.delete_by_id(product_id)
+        finally:
+            if self.id_filter is not None:
+                self.id_filter.remove(product_id)
+            await self._invalidate(product_id)
+
+    async def get_all_ids(self) -> list[int]:
+        return await self.repository.get_all_ids()
+
+    async def reserve_stock(self, quantities: dict[int, int]) -> set[int]:
+        try:
+            return await self.repository.reserve_stock(quantities)
+        finally:
+            for product_id in quantities:
+                await self._invalidate(product_id)
+
+    async def release_stock(self, quantities: dict[int, int]) -> None:
+        try:
+            await self.repository.release_stock(quantities)
+        finally:
+            for product_id in quantities:
+                await self._invalidate(product_id)
+
+    async def get_bulk_by_ids(self, product_ids: list[int]) -> list[ProductEntity]:
+        """Serve the cached ids and fetch only the misses from the wrapped repository."""
+        found: dict[int, ProductEntity] = {}
+        misses: list[int] = []
+        for product_id in dict.fromkeys(product_ids):
+            cached = self.cache.get(product_id)
+            if cached is not None:
+                found[product_id] = copy.copy(cached)
+            elif not self._known_missing(product_id):
+                misses.append(product_id)
+
+        if misses:
+            version = self.cache.version
+            negative_version = self._negative_version()
+            shared = await self._shared_get_many(misses)
+            db_misses = [product_id for product_id in misses if product_id not in shared]
+            logger.debug(
+                f"get_bulk_by_ids - cache: {len(found)}, compartilhado: {len(shared)}, "
+                f"BD: {len(db_misses)}"
+            )
+            loaded = await self.repository.get_bulk_by_ids(db_misses) if db_misses else []
+            await self._shared_set(loaded)
+            for product in [*shared.values(), *loaded]:
+                self.cache.set(product.id, copy.copy(product), version=version)
+                found[product.id] = product
+            self._remember_missing(
+                [product_id for product_id in misses if product_id not in found], negative_version
+            )
+        return [
+            found[product_id] for product_id in dict.fromkeys(product_ids) if product_id in found
+        ]
@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import status
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.databases.database import async_session
@@ -11,6 +12,7 @@ from app.core.exceptions import ApplicationException
 from app.domain.entities.order_item_entity import OrderItemEntity
 from app.domain.repositories.order_item_repository import OrderItemRepository
 from app.infrastructure.converters import OrderItemConverter
+from app.infrastructure.persistence.models.order_item_orm_model import OrderItemORM
 
 
 class SQLOrderItemRepository(OrderItemRepository):
@@ -67,3 +69,30 @@ class SQLOrderItemRepository(OrderItemRepository):
                 message="Erro interno ao criar itens de pedido em lote",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    async def get_top_product_ids(self, limit: int) -> list[int]:
+        """Retrieve the IDs of the products with the most order items."""
+        try:
+            async with async_session() as session:
+                stmt = (
+                    select(OrderItemORM.product_id)
+                    .group_by(OrderItemORM.product_id)
+                    .order_by(func.count(OrderItemORM.id).desc())
+                    .limit(limit)
+                )
+                result = await session.execute(stmt)
+                return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao recuperar produtos mais vendidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao recuperar produtos mais vendidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(
+                f"Erro interno ao recuperar produtos mais vendidos: {str(e)}", exc_info=True
+            )
+            raise ApplicationException(
+                message="Erro interno ao recuperar produtos mais vendidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
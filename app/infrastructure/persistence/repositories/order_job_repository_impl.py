@@ -0,0 +1,260 @@
+import logging
+from datetime import datetime, timedelta
+
+from fastapi import status
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.databases.database import async_session
+from app.core.exceptions import ApplicationException
+from app.core.utils import chunked
+from app.domain.entities.order_job_entity import OrderJobEntity
+from app.domain.enums.order_job_status import OrderJobStatus
+from app.domain.repositories.order_job_repository import OrderJobRepository
+from app.infrastructure.converters import OrderJobConverter
+from app.infrastructure.persistence.models.order_job_orm_model import OrderJobORM
+
+logger = logging.getLogger(__name__)
+
+# Linhas por INSERT multi-linha, abaixo do limite de parâmetros por statement do SQLite
+ENQUEUE_BULK_CHUNK_SIZE = 150
+
+
+class SQLOrderJobRepository(OrderJobRepository):
+    """SQLAlchemy async repository implementation for the order processing queue."""
+
+    def __init__(self):
+        self.converter = OrderJobConverter()
+
+    @staticmethod
+    def _claimable(now: datetime):
+        """Jobs prontos para execução ou com lease expirado (worker morto/travado)."""
+        return or_(
+            and_(
+                OrderJobORM.status == OrderJobStatus.QUEUED.value,
+                OrderJobORM.available_at <= now,
+            ),
+            and_(
+                OrderJobORM.status == OrderJobStatus.PROCESSING.value,
+                OrderJobORM.leased_until < now,
+            ),
+        )
+
+    async def enqueue(self, job: OrderJobEntity) -> OrderJobEntity:
+        """Insert a new job in the queue."""
+        try:
+            logger.debug(f"Enfileirando job do pedido {job.order_id} -> {job.target_status}")
+            async with async_session() as session:
+                orm_obj = self.converter.entity_to_orm(job)
+                session.add(orm_obj)
+                await session.commit()
+                await session.refresh(orm_obj)
+                return self.converter.orm_to_entity(orm_obj)
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao enfileirar job: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao enfileirar job",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao enfileirar job: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao enfileirar job",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def enqueue_bulk(self, jobs: list[OrderJobEntity]) -> int:
+        """Insert many jobs with chunked multi-row INSERTs in a single transaction."""
+        try:
+            logger.debug(f"Enfileirando {len(jobs)} jobs em lote")
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "order_id": job.order_id,
+                    "target_status": job.target_status,
+                    "status": job.status or OrderJobStatus.QUEUED.value,
+                    "attempts": job.attempts,
+                    "available_at": job.available_at or now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for job in jobs
+            ]
+            async with async_session() as session:
+                for chunk in chunked(rows, ENQUEUE_BULK_CHUNK_SIZE):
+                    await session.execute(insert(OrderJobORM).values(chunk))
+                await session.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao enfileirar jobs em lote: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao enfileirar jobs em lote",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao enfileirar jobs em lote: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao enfileirar jobs em lote",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def claim_batch(self, limit: int, lease_seconds: int) -> list[OrderJobEntity]:
+        """
+        Claim up to `limit` jobs with a single atomic UPDATE.
+
+        The status flip and the lease timestamp are written in the same statement, so two
+        workers can never claim the same job; expired leases become claimable again.
+        """
+        try:
+            now = datetime.utcnow()
+            async with async_session() as session:
+                candidates = (
+                    select(OrderJobORM.id)
+                    .where(self._claimable(now))
+                    .order_by(OrderJobORM.available_at, OrderJobORM.id)
+                    .limit(limit)
+                    .scalar_subquery()
+                )
+                stmt = (
+                    update(OrderJobORM)
+                    .where(OrderJobORM.id.in_(candidates))
+                    .where(self._claimable(now))
+                    .values(
+                        status=OrderJobStatus.PROCESSING.value,
+                        leased_until=now + timedelta(seconds=lease_seconds),
+                        attempts=OrderJobORM.attempts + 1,
+                        updated_at=now,
+                    )
+                    .returning(OrderJobORM)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(stmt)
+                rows = result.scalars().all()
+                await session.commit()
+                jobs = sorted(
+                    (self.converter.orm_to_entity(orm) for orm in rows), key=lambda job: job.id
+                )
+                if jobs:
+                    logger.info(f"Jobs reivindicados: {len(jobs)}")
+                return jobs
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao reivindicar jobs: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao reivindicar jobs",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao reivindicar jobs: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao reivindicar jobs",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def complete(self, job_id: int, next_job: OrderJobEntity | None = None) -> None:
+        """Mark a job as done and, in the same transaction, enqueue the next step."""
+        try:
+            now = datetime.utcnow()
+            async with async_session() as session:
+                await session.execute(
+                    update(OrderJobORM)
+                    .where(OrderJobORM.id == job_id)
+                    .values(status=OrderJobStatus.DONE.value, leased_until=None, updated_at=now)
+                )
+                if next_job is not None:
+                    session.add(self.converter.entity_to_orm(next_job))
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao concluir job {job_id}: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message=f"Erro BD ao concluir job {job_id}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao concluir job {job_id}: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message=f"Erro interno ao concluir job {job_id}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def schedule_retry(self, job_id: int, error: str, available_at: datetime) -> None:
+        """Release the lease and make the job claimable again at `available_at`."""
+        try:
+            async with async_session() as session:
+                await session.execute(
+                    update(OrderJobORM)
+                    .where(OrderJobORM.id == job_id)
+                    .values(
+                        status=OrderJobStatus.QUEUED.value,
+                        available_at=available_at,
+                        leased_until=None,
+                        last_error=error,
+                        updated_at=datetime.utcnow(),
+                    )
+                )
+                await session.commit()
+                logger.warning(f"Job {job_id} reagendado para {available_at.isoformat()}")
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao reagendar job {job_id}: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message=f"Erro BD ao reagendar job {job_id}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao reagendar job {job_id}: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message=f"Erro interno ao reagendar job {job_id}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def dead_letter(self, job_id: int, error: str) -> None:
+        """Move a job to the dead-letter state; it is never claimed again."""
+        try:
+            async with async_session() as session:
+                await session.execute(
+                    update(OrderJobORM)
+                    .where(OrderJobORM.id == job_id)
+                    .values(
+                        status=OrderJobStatus.DEAD.value,
+                        leased_until=None,
+                        last_error=error,
+                        updated_at=datetime.utcnow(),
+                    )
+                )
+                await session.commit()
+                logger.error(f"Job {job_id} movido para dead-letter: {error}")
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao mover job {job_id} para dead-letter: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message=f"Erro BD ao mover job {job_id} para dead-letter",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(
+                f"Erro interno ao mover job {job_id} para dead-letter: {str(e)}", exc_info=True
+            )
+            raise ApplicationException(
+                message=f"Erro interno ao mover job {job_id} para dead-letter",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Return the number of jobs per status."""
+        try:
+            async with async_session() as session:
+                stmt = select(OrderJobORM.status, func.count(OrderJobORM.id)).group_by(
+                    OrderJobORM.status
+                )
+                result = await session.execute(stmt)
+                return {job_status: count for job_status, count in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao contar jobs: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao contar jobs",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao contar jobs: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao contar jobs",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -1,19 +1,28 @@
 import logging
+from collections.abc import Sequence
 
 from fastapi import status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
 
 from app.core.databases.database import async_session
 from app.core.exceptions import ApplicationException
+from app.core.utils import chunked
 from app.domain.entities.order_entity import OrderCompleteEntity, OrderEntity
+from app.domain.entities.order_item_entity import OrderItemEntity
 from app.domain.repositories.order_repository import OrderRepository
-from app.infrastructure.converters import OrderConverter
+from app.infrastructure.converters import OrderConverter, OrderItemConverter
+from app.infrastructure.persistence.models.order_item_orm_model import OrderItemORM
 from app.infrastructure.persistence.models.order_orm_model import OrderORM
 
 logger = logging.getLogger(__name__)
 
+# Mantém cada IN (...) bem abaixo do limite de parâmetros por statement do SQLite
+STATUS_UPDATE_CHUNK_SIZE = 500
+# INSERTs multi-linha: linhas por statement = BULK_INSERT_MAX_PARAMS // colunas por linha
+BULK_INSERT_MAX_PARAMS = 900
+
 
 class SQLOrderRepository(OrderRepository):
     """SQLAlchemy async repository implementation for orders."""
@@ -74,8 +83,17 @@ class SQLOrderRepository(OrderRepository):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    async def get_all(self) -> list[OrderCompleteEntity]:
-        """Retrieve all orders from the database."""
+    async def get_all(
+        self, fields: Sequence[str] | None = None, include_items: bool = True
+    ) -> list[OrderCompleteEntity]:
+        """
+        Retrieve all orders from the database.
+
+        With `fields`, only those columns (plus id) are selected; without `include_items`
+        the order items are not queried at all and every order has an empty `items`.
+        """
+        if fields is not None or not include_items:
+            return await self._get_all_projected(fields, include_items)
         try:
             logger.info("Recuperando todos os pedidos")
             async with async_session() as session:
@@ -102,6 +120,113 @@ class SQLOrderRepository(OrderRepository):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    async def _get_all_projected(
+        self, fields: Sequence[str] | None, include_items: bool
+    ) -> list[OrderCompleteEntity]:
+        try:
+            names = dict.fromkeys(["id", *(fields or OrderORM.__table__.columns.keys())])
+            logger.info(f"Recuperando pedidos (projeção {list(names)}, itens: {include_items})")
+            async with async_session() as session:
+                stmt = select(*(getattr(OrderORM, name) for name in names))
+                result = await session.execute(stmt)
+                rows = result.mappings().all()
+
+                items: dict[int, list[OrderItemEntity]] = {}
+                if include_items:
+                    order_ids = [row["id"] for row in rows]
+                    for chunk in chunked(order_ids, STATUS_UPDATE_CHUNK_SIZE):
+                        stmt = select(OrderItemORM).where(OrderItemORM.order_id.in_(chunk))
+                        result = await session.execute(stmt)
+                        for item_orm in result.scalars().all():
+                            items.setdefault(item_orm.order_id, []).append(
+                                OrderItemConverter.orm_to_entity(item_orm)
+                            )
+
+                entities = [
+                    self.converter.row_to_complete_entity(row, items.get(row["id"])) for row in rows
+                ]
+                logger.info(f"{len(entities)} pedidos recuperados")
+                return entities
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao recuperar pedidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao recuperar pedidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao recuperar pedidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao recuperar pedidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def create_bulk(self, orders: list[OrderCompleteEntity]) -> list[OrderCompleteEntity]:
+        """
+        Insert orders and their items in a single transaction.
+
+        Orders and items are written with chunked multi-row INSERT ... RETURNING statements;
+        the generated ids are assigned back to the given entities, which are returned.
+        """
+        try:
+            logger.info(f"Criando {len(orders)} pedidos em lote")
+            order_rows = [
+                {
+                    "order_date": order.order_date,
+                    "status": order.status,
+                    "total_amount": order.total_amount,
+                }
+                for order in orders
+            ]
+            async with async_session() as session:
+                order_chunk_size = BULK_INSERT_MAX_PARAMS // len(order_rows[0]) if orders else 1
+                order_ids: list[int] = []
+                for chunk in chunked(order_rows, order_chunk_size):
+                    stmt = insert(OrderORM).values(chunk).returning(OrderORM.id)
+                    result = await session.execute(stmt)
+                    # Ids gerados em ordem crescente de VALUES; o RETURNING não garante a ordem
+                    order_ids.extend(sorted(result.scalars().all()))
+
+                items: list[OrderItemEntity] = []
+                for order, order_id in zip(orders, order_ids):
+                    order.id = order_id
+                    for item in order.items:
+                        item.order_id = order_id
+                        items.append(item)
+
+                item_rows = [
+                    {
+                        "order_id": item.order_id,
+                        "product_id": item.product_id,
+                        "quantity": item.quantity,
+                        "price": item.price,
+                    }
+                    for item in items
+                ]
+                item_chunk_size = BULK_INSERT_MAX_PARAMS // len(item_rows[0]) if items else 1
+                item_ids: list[int] = []
+                for chunk in chunked(item_rows, item_chunk_size):
+                    stmt = insert(OrderItemORM).values(chunk).returning(OrderItemORM.id)
+                    result = await session.execute(stmt)
+                    item_ids.extend(sorted(result.scalars().all()))
+                for item, item_id in zip(items, item_ids):
+                    item.id = item_id
+
+                await session.commit()
+            logger.info(f"Pedidos criados em lote: {len(orders)} ({len(items)} itens)")
+            return orders
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao criar pedidos em lote: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao criar pedidos em lote",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao criar pedidos em lote: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao criar pedidos em lote",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     async def delete_by_id(self, order_id: str) -> bool:
         """Delete an order by its ID."""
         try:
@@ -126,3 +251,65 @@ class SQLOrderRepository(OrderRepository):
                 message="Erro interno ao deletar pedido",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    async def get_statuses(self, order_ids: list[int]) -> dict[int, str]:
+        """Return the current status of each existing order in `order_ids`."""
+        try:
+            logger.debug(f"Recuperando status de {len(order_ids)} pedidos")
+            statuses: dict[int, str] = {}
+            async with async_session() as session:
+                for chunk in chunked(order_ids, STATUS_UPDATE_CHUNK_SIZE):
+                    stmt = select(OrderORM.id, OrderORM.status).where(OrderORM.id.in_(chunk))
+                    result = await session.execute(stmt)
+                    statuses.update({order_id: status for order_id, status in result.all()})
+            return statuses
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao recuperar status dos pedidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao recuperar status dos pedidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao recuperar status dos pedidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao recuperar status dos pedidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def bulk_update_status(self, groups: dict[tuple[str, str], list[int]]) -> set[int]:
+        """
+        Apply grouped status transitions in a single transaction.
+
+        `groups` maps `(from_status, to_status)` to the order ids to move. Each group becomes
+        `UPDATE orders SET status = :to WHERE id IN (...) AND status = :from`, so rows changed
+        concurrently by someone else are left untouched. Returns the ids that actually moved.
+        """
+        try:
+            logger.info(f"Atualizando status em lote: {len(groups)} grupos")
+            moved: set[int] = set()
+            async with async_session() as session:
+                for (from_status, to_status), order_ids in groups.items():
+                    for chunk in chunked(order_ids, STATUS_UPDATE_CHUNK_SIZE):
+                        stmt = (
+                            update(OrderORM)
+                            .where(OrderORM.id.in_(chunk), OrderORM.status == from_status)
+                            .values(status=to_status)
+                            .returning(OrderORM.id)
+                        )
+                        result = await session.execute(stmt)
+                        moved.update(result.scalars().all())
+                await session.commit()
+            logger.info(f"Pedidos com status atualizado: {len(moved)}")
+            return moved
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao atualizar status dos pedidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao atualizar status dos pedidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao atualizar status dos pedidos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao atualizar status dos pedidos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -1,10 +1,13 @@
 import logging
+from collections.abc import Sequence
+from datetime import datetime
 
 from fastapi import status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.databases.database import async_session
+from app.core.events import PRODUCT_CHANGED, ProductChangedEvent, event_bus
 from app.core.exceptions import ApplicationException
 from app.domain.entities.product_entity import ProductEntity
 from app.domain.repositories.product_repository import ProductRepository
@@ -13,6 +16,9 @@ from app.infrastructure.persistence.models import ProductORM
 
 logger = logging.getLogger(__name__)
 
+# Sempre lidas numa consulta projetada: identificam a linha e alimentam ETag/Last-Modified
+PROJECTION_REQUIRED_COLUMNS = ("id", "updated_at")
+
 
 class SQLProductRepository(ProductRepository):
     """SQLAlchemy async repository implementation for products."""
@@ -31,6 +37,9 @@ class SQLProductRepository(ProductRepository):
                 await session.refresh(orm_obj)
                 result = self.converter.orm_to_entity(orm_obj)
                 logger.info(f"Produto criado. ID: {result.id}")
+                event_bus.publish(
+                    PRODUCT_CHANGED, ProductChangedEvent(result.id, "created", result)
+                )
                 return result
         except SQLAlchemyError as e:
             logger.error(f"Erro BD ao criar produto: {str(e)}", exc_info=True)
@@ -45,16 +54,32 @@ class SQLProductRepository(ProductRepository):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    async def get_all(self, skip: int = 0, limit: int = 10) -> list[ProductEntity]:
-        """Retrieve all products with pagination."""
+    async def get_all(
+        self, skip: int = 0, limit: int = 10, fields: Sequence[str] | None = None
+    ) -> list[ProductEntity]:
+        """
+        Retrieve all products with pagination.
+
+        With `fields`, only those columns (plus id and updated_at) are selected and the
+        returned entities carry None for everything else.
+        """
         try:
-            logger.debug(f"get_all - skip: {skip}, limit: {limit}")
+            logger.debug(f"get_all - skip: {skip}, limit: {limit}, fields: {fields}")
             async with async_session() as session:
-                stmt = select(ProductORM).offset(skip).limit(limit)
+                if fields is None:
+                    stmt = select(ProductORM).offset(skip).limit(limit)
+                    result = await session.execute(stmt)
+                    rows = result.scalars().all()
+                    logger.info(f"Produtos recuperados: {len(rows)}")
+                    return [self.converter.orm_to_entity(orm) for orm in rows]
+
+                names = dict.fromkeys([*PROJECTION_REQUIRED_COLUMNS, *fields])
+                columns = [getattr(ProductORM, name) for name in names]
+                stmt = select(*columns).offset(skip).limit(limit)
                 result = await session.execute(stmt)
-                rows = result.scalars().all()
-                logger.info(f"Produtos recuperados: {len(rows)}")
-                return [self.converter.orm_to_entity(orm) for orm in rows]
+                rows = result.mappings().all()
+                logger.info(f"Produtos recuperados (projeção {list(names)}): {len(rows)}")
+                return [self.converter.row_to_entity(row) for row in rows]
         except SQLAlchemyError as e:
             logger.error(f"Erro BD ao recuperar produtos: {str(e)}", exc_info=True)
             raise ApplicationException(
@@ -107,6 +132,9 @@ class SQLProductRepository(ProductRepository):
                 result = self.converter.orm_to_entity(orm_obj)
 
                 logger.info(f"Produto atualizado: {result.id}")
+                event_bus.publish(
+                    PRODUCT_CHANGED, ProductChangedEvent(result.id, "updated", result)
+                )
                 return result
         except SQLAlchemyError as e:
             logger.error(f"Erro BD ao atualizar produto {product.id}: {str(e)}", exc_info=True)
@@ -133,6 +161,7 @@ class SQLProductRepository(ProductRepository):
                 await session.commit()
                 if result.rowcount > 0:
                     logger.info(f"Produto deletado: {product_id}")
+                    event_bus.publish(PRODUCT_CHANGED, ProductChangedEvent(product_id, "deleted"))
                 else:
                     logger.warning(f"Produto não encontrado para deleção: {product_id}")
         except SQLAlchemyError as e:
@@ -170,3 +199,103 @@ class SQLProductRepository(ProductRepository):
                 message="Erro interno ao recuperar produtos em lote",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    async def get_all_ids(self) -> list[int]:
+        """Retrieve the IDs of all products."""
+        try:
+            async with async_session() as session:
+                result = await session.execute(select(ProductORM.id))
+                ids = list(result.scalars().all())
+                logger.info(f"IDs de produtos recuperados: {len(ids)}")
+                return ids
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao recuperar IDs de produtos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao recuperar IDs de produtos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao recuperar IDs de produtos: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao recuperar IDs de produtos",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @staticmethod
+    def _publish_updated(products: list[ProductEntity]) -> None:
+        for product in products:
+            event_bus.publish(PRODUCT_CHANGED, ProductChangedEvent(product.id, "updated", product))
+
+    async def reserve_stock(self, quantities: dict[int, int]) -> set[int]:
+        """
+        Reserve stock for several products in one transaction.
+
+        Each product gets `UPDATE products SET quantity = quantity - :n WHERE id = :id AND
+        quantity >= :n`, so concurrent reservations can never take stock below zero. Returns
+        the ids that were reserved; the others had insufficient stock (or no longer exist).
+        """
+        try:
+            logger.info(f"Reservando estoque de {len(quantities)} produtos")
+            products: list[ProductEntity] = []
+            async with async_session() as session:
+                for product_id, quantity in quantities.items():
+                    stmt = (
+                        update(ProductORM)
+                        .where(ProductORM.id == product_id, ProductORM.quantity >= quantity)
+                        .values(
+                            quantity=ProductORM.quantity - quantity, updated_at=datetime.utcnow()
+                        )
+                        .returning(*ProductORM.__table__.columns)
+                    )
+                    row = (await session.execute(stmt)).mappings().one_or_none()
+                    if row is not None:
+                        products.append(self.converter.row_to_entity(row))
+                await session.commit()
+            logger.info(f"Estoque reservado: {len(products)} de {len(quantities)} produtos")
+            self._publish_updated(products)
+            return {product.id for product in products}
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao reservar estoque: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao reservar estoque",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao reservar estoque: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao reservar estoque",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def release_stock(self, quantities: dict[int, int]) -> None:
+        """Return previously reserved stock, in one transaction."""
+        try:
+            logger.info(f"Devolvendo estoque de {len(quantities)} produtos")
+            products: list[ProductEntity] = []
+            async with async_session() as session:
+                for product_id, quantity in quantities.items():
+                    stmt = (
+                        update(ProductORM)
+                        .where(ProductORM.id == product_id)
+                        .values(
+                            quantity=ProductORM.quantity + quantity, updated_at=datetime.utcnow()
+                        )
+                        .returning(*ProductORM.__table__.columns)
+                    )
+                    row = (await session.execute(stmt)).mappings().one_or_none()
+                    if row is not None:
+                        products.append(self.converter.row_to_entity(row))
+                await session.commit()
+            self._publish_updated(products)
+        except SQLAlchemyError as e:
+            logger.error(f"Erro BD ao devolver estoque: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro BD ao devolver estoque",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except Exception as e:
+            logger.error(f"Erro interno ao devolver estoque: {str(e)}", exc_info=True)
+            raise ApplicationException(
+                message="Erro interno ao devolver estoque",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
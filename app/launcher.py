@@ -0,0 +1,132 @@
+"""
+Ponto de entrada de produção com vários workers.
+
+    python -m app.launcher [--host 0.0.0.0] [--port 8080] [--workers N]
+
+O processo principal cria o schema uma única vez, antes de iniciar os workers, e descarta
+as conexões que abriu para isso; os workers sobem com `DATABASE_INIT_ON_STARTUP=false` e
+não repetem o `create_all`. Cada worker abre seu próprio pool de conexões (o engine ainda
+descarta pools herdados num fork, ver `app.core.databases.database`). O número de workers
+padrão é o de CPUs disponíveis para o processo, e uvloop/httptools são usados quando
+instalados.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import os
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.core.config import settings
+from app.core.lifecycle import lifecycle
+
+logger = logging.getLogger(__name__)
+
+APP = "app.main:app"
+
+
+def default_workers() -> int:
+    """CPUs que este processo pode usar (respeita affinity/cpuset de containers)"""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def choose_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+
+
+def choose_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+
+class DrainingServer(uvicorn.Server):
+    """
+    Inicia a drenagem da aplicação assim que o sinal de parada chega. O uvicorn espera as
+    conexões abertas terminarem antes do shutdown do lifespan; sem isso, fluxos SSE segurariam
+    o desligamento até SERVER_GRACEFUL_SHUTDOWN_SECONDS.
+    """
+
+    def handle_exit(self, sig, frame) -> None:
+        lifecycle.begin_drain()
+        super().handle_exit(sig, frame)
+
+
+def serve(config: uvicorn.Config) -> None:
+    """Equivalente a `uvicorn.run`, com o `DrainingServer` em cada worker"""
+    server = DrainingServer(config)
+    if config.workers > 1:
+        sock = config.bind_socket()
+        Multiprocess(config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
+
+
+async def prepare_database() -> None:
+    """Cria o schema e fecha as conexões antes que os workers sejam iniciados"""
+    # Importa os modelos para registrá-los no metadata sem carregar a aplicação inteira
+    import app.infrastructure.persistence.models.order_item_orm_model  # noqa: F401
+    import app.infrastructure.persistence.models.order_job_orm_model  # noqa: F401
+    import app.infrastructure.persistence.models.order_orm_model  # noqa: F401
+    import app.infrastructure.persistence.models.product_orm_model  # noqa: F401
+    from app.core.databases.database import close_db, init_db
+
+    try:
+        await init_db()
+    finally:
+        await close_db()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Servidor de produção da API")
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(message)s")
+    workers = args.workers or default_workers()
+    loop, http = choose_loop(), choose_http()
+
+    asyncio.run(prepare_database())
+    os.environ["DATABASE_INIT_ON_STARTUP"] = "false"
+
+    # Os workers herdam o ambiente: sabem quantos são e se há backend compartilhado
+    os.environ["SERVER_WORKERS"] = str(workers)
+    if workers > 1 and settings.CACHE_BACKEND_URL.startswith("memory://"):
+        # O filtro de IDs de um worker não enxerga remoções feitas nos outros e responderia
+        # 404 para produtos que existem
+        os.environ["PRODUCT_ID_FILTER_ENABLED"] = "false"
+        # As páginas da listagem em cache também não são invalidadas por escritas feitas nos
+        # outros workers: ficam no máximo tão desatualizadas quanto o cache de produtos
+        response_ttl = min(settings.RESPONSE_CACHE_TTL_SECONDS, settings.PRODUCT_CACHE_TTL_SECONDS)
+        os.environ["RESPONSE_CACHE_TTL_SECONDS"] = str(response_ttl)
+        logger.warning(
+            "CACHE_BACKEND_URL=memory:// com vários workers: cada worker tem caches próprios, "
+            "então alterações feitas em outro worker podem não aparecer por até "
+            f"{settings.PRODUCT_CACHE_TTL_SECONDS}s (produtos) e {response_ttl}s (listagem em "
+            "cache, RESPONSE_CACHE_TTL_SECONDS) e produtos recém-criados podem responder 404 "
+            f"por até {settings.PRODUCT_NEGATIVE_CACHE_TTL_SECONDS}s; o filtro de IDs foi "
+            "desativado. Use um backend compartilhado (redis://)"
+        )
+    logger.info(
+        f"Iniciando {workers} worker(s) em {args.host}:{args.port} (loop={loop}, http={http})"
+    )
+    config = uvicorn.Config(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        proxy_headers=True,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+    )
+    serve(config)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,68 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.core.config import settings
-from app.core.databases.database import init_db
+from app.core.databases.database import close_db, init_db
+from app.core.dependencies import (
+    get_admission_limiters,
+    get_rate_limiter,
+    start_dependencies,
+    stop_dependencies,
+)
+from app.core.lifecycle import lifecycle
+from app.presentation.admission import AdmissionControlMiddleware
+from app.presentation.api.v1.endpoints.batch_controller import router as batch_router
+from app.presentation.api.v1.endpoints.metrics_controller import router as metrics_router
 from app.presentation.api.v1.endpoints.order_controller import router as order_router
 from app.presentation.api.v1.endpoints.ping_controller import router as ping_router
 from app.presentation.api.v1.endpoints.product_controller import router as product_router
+from app.presentation.compression import CompressionMiddleware, compressor
+from app.presentation.deadline import DeadlineMiddleware
+from app.presentation.draining import DrainingMiddleware
+from app.presentation.rate_limit import RateLimitMiddleware
+from app.presentation.responses import DefaultJSONResponse
+from app.presentation.warmup import warm_up_caches
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    lifecycle.reset()
+    if settings.DATABASE_INIT_ON_STARTUP:
+        await init_db()
+    await start_dependencies()
+    # Em segundo plano: a instância atende /ping e reporta /ready 503 até o warm-up terminar
+    warmup_task = asyncio.create_task(warm_up_caches())
+    app.state.warmup_task = warmup_task
+    try:
+        yield
+    finally:
+        await _shutdown(warmup_task)
+
+
+async def _shutdown(warmup_task: asyncio.Task) -> None:
+    """
+    Para de receber trabalho (/ready 503, fluxos SSE encerrados), espera as requisições em
+    andamento até SHUTDOWN_DRAIN_TIMEOUT_SECONDS, para a fila com prazo e só então descarta
+    o pool de conexões.
+    """
+    lifecycle.begin_drain()
+    if not await lifecycle.wait_idle(settings.SHUTDOWN_DRAIN_TIMEOUT_SECONDS):
+        logger.warning(
+            f"Drenagem: {lifecycle.in_flight} requisições ainda em andamento após "
+            f"{settings.SHUTDOWN_DRAIN_TIMEOUT_SECONDS}s"
+        )
+    if not warmup_task.done():
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+    try:
+        await stop_dependencies()
+    finally:
+        await close_db()
 
 
 def _get_app_args() -> dict:
@@ -14,17 +72,15 @@ def _get_app_args() -> dict:
         "description": settings.API_DESCRIPTION,
         "docs_url": settings.DOCS_URL,
         "redoc_url": settings.REDOC_URL,
+        "default_response_class": DefaultJSONResponse,
+        "lifespan": lifespan,
     }
 
 
 def _init_fast_api_app() -> FastAPI:
     app = FastAPI(**_get_app_args())
     app = _config_app_routers(app)
-
-    @app.on_event("startup")
-    async def _on_startup():
-        await init_db()
-
+    app = _config_app_middlewares(app)
     return app
 
 
@@ -37,9 +93,42 @@ def _config_app_routers(app: FastAPI):
         ping_router,
         product_router,
         order_router,
+        metrics_router,
+        batch_router,
     ]
     [app.include_router(router) for router in routers]
     return app
 
 
+def _config_app_middlewares(app: FastAPI):
+    if compressor is not None:
+        app.add_middleware(CompressionMiddleware, compressor=compressor)
+    if settings.ADMISSION_CONTROL_ENABLED:
+        # Fora da compressão: requisições recusadas não chegam a ser processadas
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            limiters=get_admission_limiters(),
+            retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS,
+        )
+    rate_limiter = get_rate_limiter()
+    if rate_limiter is not None:
+        # Fora da admissão: um cliente acima da cota não ocupa vagas de concorrência
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=rate_limiter,
+            api_key_header=settings.RATE_LIMIT_API_KEY_HEADER,
+        )
+    if settings.REQUEST_DEADLINE_ENABLED:
+        # O prazo conta desde a chegada: inclui a espera na fila da admissão
+        app.add_middleware(
+            DeadlineMiddleware,
+            default_timeout_ms=settings.REQUEST_DEADLINE_DEFAULT_MS,
+            route_timeouts_ms=settings.REQUEST_DEADLINE_ROUTES_MS,
+            header=settings.REQUEST_DEADLINE_HEADER,
+        )
+    # Último a ser adicionado, é o mais externo: conta a requisição inteira, inclusive a compressão
+    app.add_middleware(DrainingMiddleware, lifecycle=lifecycle)
+    return app
+
+
 app = init_app()
@@ -0,0 +1,83 @@
+"""
+Controle de admissão: limite de concorrência adaptativo por grupo de rotas.
+
+Leituras e escritas têm limitadores separados, para que a disputa por escrita no SQLite
+não tome as vagas das leituras. Health checks, métricas, o fluxo SSE (conexão longa) e o
+`/batch` (cujas sub-requisições passam individualmente pela admissão) ficam de fora.
+Requisições acima do limite e da fila de espera recebem 503 imediato com `Retry-After`.
+"""
+
+import json
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+EXEMPT_PATHS = ("/ping", "/ready", "/products/stream", "/batch")
+EXEMPT_PREFIXES = ("/metrics/",)
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def route_group(scope: Scope) -> str | None:
+    """Grupo de admissão da requisição; None para rotas isentas"""
+    path = scope["path"].rstrip("/") or "/"
+    if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
+        return None
+    return "read" if scope["method"] in SAFE_METHODS else "write"
+
+
+class AdmissionControlMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiters: dict[str, AdaptiveConcurrencyLimiter],
+        retry_after_seconds: int = 1,
+    ):
+        self.app = app
+        self.limiters = limiters
+        self.retry_after_seconds = retry_after_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        group = route_group(scope)
+        limiter = self.limiters.get(group) if group is not None else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            await self._reject(send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 5xx contam como sinal de sobrecarga, assim como a latência acima do alvo
+            limiter.release(time.monotonic() - started, failed=status_code >= 500)
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "Servidor sobrecarregado, tente novamente"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(self.retry_after_seconds).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
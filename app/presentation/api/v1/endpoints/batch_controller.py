@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Request
+
+from app.core.config import settings
+from app.presentation.batch import execute_batch
+from app.presentation.content_negotiation import NegotiatedRoute
+from app.presentation.responses import DefaultJSONResponse
+from app.presentation.schemas.batch_schema import BatchInput, BatchOutput
+
+router = APIRouter(prefix="/batch", tags=["Batch"], route_class=NegotiatedRoute)
+
+
+@router.post(
+    "",
+    response_model=BatchOutput,
+    summary="Executar várias operações",
+    description=(
+        "Executa até BATCH_MAX_OPERATIONS sub-requisições (method, path, body) em uma chamada. "
+        "Leituras consecutivas rodam em paralelo; escritas rodam na ordem, uma de cada vez. "
+        "As respostas voltam na ordem das operações, cada uma com seu próprio status."
+    ),
+)
+async def run_batch(batch: BatchInput, request: Request):
+    responses = await execute_batch(
+        request.app, request.scope, batch.operations, settings.BATCH_MAX_CONCURRENCY
+    )
+    # Corpos das sub-respostas já decodificados: evita validá-los de novo pelo response_model
+    return DefaultJSONResponse({"responses": responses})
@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends
+
+from app.core.dependencies import (
+    get_admission_stats,
+    get_batch_loader_stats,
+    get_cache_stats,
+    get_id_filter_stats,
+    get_product_stream_stats,
+    get_rate_limit_stats,
+    get_single_flight_stats,
+)
+from app.presentation.schemas.metrics_schema import (
+    AdmissionStatsOutput,
+    BatchLoaderStatsOutput,
+    CacheStatsOutput,
+    IdFilterStatsOutput,
+    ProductStreamStatsOutput,
+    RateLimitStatsOutput,
+    SingleFlightStatsOutput,
+)
+
+router = APIRouter(prefix="/metrics", tags=["System"])
+
+
+@router.get(
+    "/cache",
+    response_model=dict[str, CacheStatsOutput],
+    summary="Métricas dos caches",
+    description="Retorna contadores de hit/miss/eviction de cada cache em memória deste processo",
+)
+def get_cache_metrics(stats: dict[str, dict] = Depends(get_cache_stats)):
+    return stats
+
+
+@router.get(
+    "/single-flight",
+    response_model=SingleFlightStatsOutput,
+    summary="Métricas de coalescência de leituras",
+    description="Retorna chamadas executadas versus coalescidas por operação neste processo",
+)
+def get_single_flight_metrics(stats: dict = Depends(get_single_flight_stats)):
+    return stats
+
+
+@router.get(
+    "/batch-loader",
+    response_model=dict[str, BatchLoaderStatsOutput],
+    summary="Métricas de micro-batching",
+    description="Retorna chaves solicitadas versus consultas em lote emitidas neste processo",
+)
+def get_batch_loader_metrics(stats: dict[str, dict] = Depends(get_batch_loader_stats)):
+    return stats
+
+
+@router.get(
+    "/id-filter",
+    response_model=dict[str, IdFilterStatsOutput],
+    summary="Métricas do filtro de IDs",
+    description="Retorna o estado do filtro de Bloom de IDs existentes e quantas buscas rejeitou",
+)
+def get_id_filter_metrics(stats: dict[str, dict] = Depends(get_id_filter_stats)):
+    return stats
+
+
+@router.get(
+    "/product-stream",
+    response_model=ProductStreamStatsOutput,
+    summary="Métricas do fluxo SSE de produtos",
+    description="Retorna assinantes conectados, eventos publicados e descartados neste processo",
+)
+def get_product_stream_metrics(stats: dict = Depends(get_product_stream_stats)):
+    return stats
+
+
+@router.get(
+    "/admission",
+    response_model=dict[str, AdmissionStatsOutput],
+    summary="Métricas do controle de admissão",
+    description="Retorna limite atual, requisições em andamento, em espera e recusadas por grupo",
+)
+def get_admission_metrics(stats: dict[str, dict] = Depends(get_admission_stats)):
+    return stats
+
+
+@router.get(
+    "/rate-limit",
+    response_model=RateLimitStatsOutput,
+    summary="Métricas do rate limiting",
+    description="Retorna o store dos buckets e quantas requisições foram liberadas e limitadas",
+)
+def get_rate_limit_metrics(stats: dict = Depends(get_rate_limit_stats)):
+    return stats
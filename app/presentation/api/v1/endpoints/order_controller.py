@@ -1,11 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
+from app.application.dtos.order_bulk_dto import OrderBulkInputDTO, OrderBulkResponseDTO
 from app.application.dtos.order_dto import OrderInputDTO, OrderResponseDTO
+from app.application.dtos.order_queue_dto import OrderQueueStatsDTO
+from app.application.dtos.order_status_dto import (
+    OrderStatusBatchInputDTO,
+    OrderStatusBatchResponseDTO,
+)
+from app.application.services.order_queue_service import OrderQueueService
 from app.application.services.order_service import OrderService
-from app.core.dependencies import get_order_service
+from app.core.dependencies import get_order_queue_service, get_order_service
 from app.core.exceptions import ApplicationException
+from app.presentation.content_negotiation import NegotiatedRoute
+from app.presentation.serializers import (
+    ORDER_FIELDS,
+    ORDER_INCLUDES,
+    dump_orders_json,
+    parse_fields,
+)
 
-router = APIRouter(prefix="/orders", tags=["Orders"])
+router = APIRouter(prefix="/orders", tags=["Orders"], route_class=NegotiatedRoute)
 
 
 @router.post(
@@ -30,6 +44,36 @@ async def create_order(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.post(
+    "/bulk",
+    status_code=200,
+    summary="Criar pedidos em lote",
+    description=(
+        "Cria vários pedidos em uma requisição: produtos lidos em uma consulta, estoque "
+        "reservado de forma agregada e inserções em lote, com resultado por pedido"
+    ),
+    response_model=OrderBulkResponseDTO,
+)
+async def create_orders_bulk(
+    body: OrderBulkInputDTO,
+    service: OrderService = Depends(get_order_service),
+):
+    """
+    Cria vários pedidos em uma única requisição
+
+    - **orders**: lista de pedidos, cada um com seus itens (product_id / quantity)
+
+    Pedidos com produto inexistente ou sem estoque suficiente são recusados individualmente;
+    os demais são criados. O estoque é disputado na ordem da lista.
+    """
+    try:
+        return await service.create_orders_bulk(body)
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.get(
     "",
     response_model=list[OrderResponseDTO],
@@ -37,13 +81,74 @@ async def create_order(
     description="Recupera todos os pedidos",
 )
 async def get_all_orders(
+    fields: str | None = Query(
+        None, description=f"Campos a retornar, separados por vírgula ({', '.join(ORDER_FIELDS)})"
+    ),
+    include: str | None = Query(None, description="Relações a expandir (items)"),
     service: OrderService = Depends(get_order_service),
 ):
     """
     Recupera todos os pedidos
+
+    - **fields**: Campos do pedido a retornar; só essas colunas são lidas do banco
+    - **include**: `items` para embutir os itens. Sem `fields` nem `include`, a resposta
+      completa (com itens) é mantida; com `fields`, os itens só vêm se pedidos
+    """
+    try:
+        selected = parse_fields(fields, ORDER_FIELDS)
+        includes = parse_fields(include, ORDER_INCLUDES)
+        include_items = "items" in includes if includes is not None else selected is None
+        orders = await service.get_order_rows(fields=selected, include_items=include_items)
+        return Response(
+            content=dump_orders_json(orders, selected, include_items),
+            media_type="application/json",
+        )
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post(
+    "/status",
+    response_model=OrderStatusBatchResponseDTO,
+    summary="Atualizar status de pedidos em lote",
+    description=(
+        "Aplica uma lista de transições (order_id, status) em uma única transação, "
+        "validando cada uma contra a tabela de transições permitidas"
+    ),
+)
+async def transition_order_statuses(
+    body: OrderStatusBatchInputDTO,
+    service: OrderService = Depends(get_order_service),
+):
+    """
+    Atualiza o status de vários pedidos em uma única requisição
+
+    - **transitions**: lista de pares order_id / status de destino
+    """
+    try:
+        return await service.transition_order_statuses(body)
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get(
+    "/queue/stats",
+    response_model=OrderQueueStatsDTO,
+    summary="Estatísticas da fila de processamento",
+    description="Retorna a profundidade da fila de pedidos por status e a vazão dos workers",
+)
+async def get_order_queue_stats(
+    service: OrderQueueService = Depends(get_order_queue_service),
+):
+    """
+    Retorna a profundidade e a vazão da fila de processamento de pedidos
     """
     try:
-        return await service.get_all_orders()
+        return await service.get_stats()
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -1,4 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response, status
+
+from app.application.services.cache_warmup_service import CacheWarmupService
+from app.core.dependencies import get_cache_warmup_service
+from app.core.lifecycle import lifecycle
+from app.presentation.schemas.readiness_schema import ReadinessOutput
 
 router = APIRouter(prefix="", tags=["System"])
 
@@ -6,3 +11,24 @@ router = APIRouter(prefix="", tags=["System"])
 @router.get("/ping", response_model=str, status_code=200)
 def ping():
     return "pong"
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessOutput,
+    responses={503: {"model": ReadinessOutput}},
+    summary="Prontidão da instância",
+    description=(
+        "Responde 200 após o warm-up dos caches e 503 enquanto ele não termina ou quando a "
+        "instância está sendo desligada"
+    ),
+)
+def ready(
+    response: Response,
+    warmup_service: CacheWarmupService = Depends(get_cache_warmup_service),
+):
+    warmup_status = warmup_service.get_status()
+    # Em drenagem a instância deixa de receber tráfego novo do balanceador
+    if not warmup_status.ready or lifecycle.draining:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessOutput(**warmup_status.model_dump(), draining=lifecycle.draining)
@@ -1,16 +1,87 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.application.dtos.product_dto import CreateProductDTO
 from app.application.services.product_service import ProductService
-from app.core.dependencies import get_product_service
-from app.core.exceptions import ApplicationException
+from app.core.broadcast import BroadcastHub
+from app.core.cache.response_cache import CachedResponse, ResponseCache
+from app.core.config import settings
+from app.core.dependencies import get_product_service, get_product_stream_hub, get_response_cache
+from app.core.exceptions import ApplicationException, ValidationException
+from app.presentation.compression import compressor, weak_etag
+from app.presentation.content_negotiation import NegotiatedRoute, wants_msgpack
+from app.presentation.http_cache import (
+    is_not_modified,
+    not_modified_response,
+    product_etag,
+    product_list_etag,
+    validator_headers,
+)
+from app.presentation.responses import MSGPACK_MEDIA_TYPE, json_to_msgpack
 from app.presentation.schemas.product_schema import (
     CreateProductInput,
+    ProductBatchOutput,
     ProductOutput,
     UpdateProductInput,
 )
+from app.presentation.serializers import PRODUCT_FIELDS, dump_products_json, parse_fields
+from app.presentation.sse import SSE_HEADERS, SSE_MEDIA_TYPE, event_stream
+
+router = APIRouter(prefix="/products", tags=["Products"], route_class=NegotiatedRoute)
+
+
+def _cached_response(entry: CachedResponse, request: Request) -> Response:
+    """
+    Serve a entrada do cache na representação negociada (JSON ou MessagePack) e, acima do
+    tamanho mínimo, já comprimida. Cada variante é calculada uma vez e guardada na entrada.
+    """
+    media_type, body, etag = entry.media_type, entry.body, entry.etag
+    if wants_msgpack(request):
+        media_type, etag = MSGPACK_MEDIA_TYPE, weak_etag(etag)
+        body = entry.variant((media_type, None), lambda: json_to_msgpack(entry.body))
+
+    encoding = None
+    if compressor is not None and len(body) >= compressor.minimum_size:
+        encoding = compressor.negotiate(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return Response(
+            content=body,
+            media_type=media_type,
+            headers=validator_headers(etag, entry.last_modified),
+        )
+
+    body = entry.variant((media_type, encoding), lambda: compressor.compress(body, encoding))
+    headers = validator_headers(weak_etag(etag), entry.last_modified)
+    headers.update({"Content-Encoding": encoding, "Vary": "Accept-Encoding"})
+    return Response(content=body, media_type=media_type, headers=headers)
+
 
-router = APIRouter(prefix="/products", tags=["Products"])
+async def render_product_list_page(
+    service: ProductService,
+    response_cache: ResponseCache | None,
+    skip: int,
+    limit: int,
+    fields: tuple[str, ...] | None = None,
+) -> CachedResponse:
+    """Retorna a página de listagem já codificada, do cache de respostas ou do banco"""
+    cache_key = ("products", skip, limit) if fields is None else ("products", skip, limit, fields)
+    if response_cache is not None:
+        entry = response_cache.get(cache_key)
+        if entry is not None:
+            return entry
+    # Capturada antes da consulta: uma escrita concorrente invalida o que for lido agora
+    generation = response_cache.generation if response_cache is not None else 0
+
+    products = await service.get_product_rows(skip=skip, limit=limit, fields=fields)
+    entry = CachedResponse(
+        body=dump_products_json(products, fields),
+        etag=product_list_etag(products, skip, limit, fields),
+        last_modified=max((product.updated_at for product in products), default=None),
+        generation=generation,
+    )
+    if response_cache is not None:
+        response_cache.set(cache_key, entry)
+    return entry
 
 
 @router.post(
@@ -53,24 +124,113 @@ async def create_product(
     description="Recupera uma lista de produtos com paginação",
 )
 async def get_all_products(
+    request: Request,
     skip: int = Query(0, ge=0, description="Número de itens a pular"),
     limit: int = Query(10, ge=1, le=100, description="Limite de itens a retornar"),
+    fields: str | None = Query(
+        None, description=f"Campos a retornar, separados por vírgula ({', '.join(PRODUCT_FIELDS)})"
+    ),
     service: ProductService = Depends(get_product_service),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
 ):
     """
     Recupera uma lista de produtos com paginação
 
     - **skip**: Número de itens a pular (padrão: 0)
     - **limit**: Limite de itens a retornar (padrão: 10, máximo: 100)
+    - **fields**: Campos a retornar (padrão: todos); só essas colunas são lidas do banco
+
+    Suporta `If-None-Match`: responde 304 sem corpo quando a página não mudou. Páginas já
+    codificadas são servidas do cache de respostas até a próxima escrita no catálogo.
     """
     try:
-        return await service.get_all_products(skip=skip, limit=limit)
+        entry = await render_product_list_page(
+            service, response_cache, skip, limit, parse_fields(fields, PRODUCT_FIELDS)
+        )
+        # If-Modified-Since não é avaliado em listas: remoções não alteram o maior updated_at
+        if is_not_modified(request, entry.etag):
+            return not_modified_response(entry.etag, entry.last_modified)
+        return _cached_response(entry, request)
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+def _parse_ids(raw: str) -> list[int]:
+    try:
+        return [int(value) for value in raw.split(",") if value.strip()]
+    except ValueError:
+        raise ValidationException("`ids` deve ser uma lista de inteiros separados por vírgula")
+
+
+# Declarada antes de /{product_id} para que "batch" não seja interpretado como um ID
+@router.get(
+    "/batch",
+    response_model=ProductBatchOutput,
+    summary="Obter vários produtos por ID",
+    description=(
+        "Recupera vários produtos em uma única requisição, na ordem pedida, "
+        "informando os IDs inexistentes"
+    ),
+)
+async def get_products_by_ids(
+    ids: str = Query(
+        ...,
+        description=(
+            "IDs separados por vírgula "
+            f"(máximo de {settings.PRODUCT_BATCH_GET_MAX_IDS} por requisição)"
+        ),
+        examples=["1,2,3"],
+    ),
+    service: ProductService = Depends(get_product_service),
+):
+    """
+    Recupera vários produtos pelos IDs
+
+    - **ids**: IDs separados por vírgula; repetidos são considerados uma vez
+
+    Os produtos já em cache não vão ao banco; os demais são buscados em uma única consulta.
+    """
+    try:
+        return await service.get_products_by_ids(_parse_ids(ids))
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Fluxo de mudanças de estoque e preço",
+    description=(
+        "Server-Sent Events com id, quantity, price e updated_at de cada produto alterado. "
+        "Reconexões com Last-Event-ID recebem os eventos perdidos ainda em buffer; um evento "
+        "`reset` indica que o cliente deve recarregar a listagem."
+    ),
+)
+async def stream_product_changes(
+    last_event_id: str | None = Header(None),
+    hub: BroadcastHub = Depends(get_product_stream_hub),
+):
+    """
+    Assina as mudanças de produtos deste processo e as de outros workers
+    """
+    subscription = hub.subscribe(last_event_id)
+    return StreamingResponse(
+        event_stream(
+            hub,
+            subscription,
+            event_name="product",
+            heartbeat_seconds=settings.PRODUCT_STREAM_HEARTBEAT_SECONDS,
+            retry_ms=settings.PRODUCT_STREAM_RETRY_MS,
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get(
     "/{product_id}",
     response_model=ProductOutput,
@@ -79,15 +239,25 @@ async def get_all_products(
 )
 async def get_product_by_id(
     product_id: int,
+    request: Request,
+    response: Response,
     service: ProductService = Depends(get_product_service),
 ):
     """
     Recupera um produto específico pelo seu ID
 
     - **product_id**: ID do produto
+
+    Suporta `If-None-Match` e `If-Modified-Since`: responde 304 sem corpo quando o produto
+    não mudou.
     """
     try:
-        return await service.get_product_by_id(product_id)
+        product = await service.get_product_by_id(product_id)
+        etag = product_etag(product)
+        if is_not_modified(request, etag, product.updated_at):
+            return not_modified_response(etag, product.updated_at)
+        response.headers.update(validator_headers(etag, product.updated_at))
+        return product
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
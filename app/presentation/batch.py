@@ -0,0 +1,140 @@
+"""
+Execução de sub-requisições em lote (POST /batch) dentro do próprio processo.
+
+Cada operação vira um scope ASGI e é despachada para a aplicação, passando pelas mesmas
+rotas, validações e caches de uma requisição HTTP comum, mas sem rede. Leituras (GET/HEAD)
+consecutivas rodam concorrentemente; uma escrita espera as leituras anteriores e roda
+sozinha, de modo que operações posteriores enxergam seu efeito, como se tivessem sido
+feitas em sequência pelo cliente.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any
+from urllib.parse import unquote
+
+from starlette.types import ASGIApp, Message, Scope
+
+from app.presentation.responses import json_loads
+from app.presentation.schemas.batch_schema import BatchOperationInput
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD")
+# Cabeçalhos da sub-requisição controlados pelo lote, não pela operação
+_MANAGED_HEADERS = ("accept", "accept-encoding", "content-length", "content-type", "host")
+
+
+def _build_scope(parent: Scope, operation: BatchOperationInput, body: bytes) -> Scope:
+    path, _, query = operation.path.partition("?")
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in operation.headers.items()
+        if name.lower() not in _MANAGED_HEADERS
+    ]
+    headers.append((b"accept", b"application/json"))
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    host = dict(parent.get("headers", [])).get(b"host")
+    if host is not None:
+        headers.append((b"host", host))
+
+    scope = {
+        "type": "http",
+        "asgi": parent.get("asgi", {"version": "3.0"}),
+        "http_version": parent.get("http_version", "1.1"),
+        "method": operation.method,
+        "scheme": parent.get("scheme", "http"),
+        "path": unquote(path),
+        "raw_path": path.encode("latin-1"),
+        "query_string": query.encode("latin-1"),
+        "root_path": parent.get("root_path", ""),
+        "headers": headers,
+        "client": parent.get("client"),
+        "server": parent.get("server"),
+    }
+    if "state" in parent:
+        scope["state"] = parent["state"]
+    return scope
+
+
+def _decode_body(headers: dict[str, str], body: bytes) -> Any:
+    if not body:
+        return None
+    content_type = headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        return json_loads(body)
+    return body.decode("utf-8", errors="replace")
+
+
+async def dispatch(app: ASGIApp, parent: Scope, operation: BatchOperationInput) -> dict:
+    """Executa uma operação pela aplicação e devolve status, cabeçalhos e corpo decodificado"""
+    body = b"" if operation.body is None else json.dumps(operation.body).encode()
+    scope = _build_scope(parent, operation, body)
+    request_sent = False
+    status_code = 500
+    headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Corpo já entregue: respostas em streaming (ex.: SSE) terminam em vez de ficar abertas
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for name, value in message.get("headers", []):
+                name = name.decode("latin-1").lower()
+                if name != "content-length":
+                    headers[name] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+        return {
+            "status": status_code,
+            "headers": headers,
+            "body": _decode_body(headers, b"".join(chunks)),
+        }
+    except Exception as e:
+        logger.error(
+            f"Erro ao executar sub-requisição {operation.method} {operation.path}: {str(e)}",
+            exc_info=True,
+        )
+        return {"status": 500, "headers": {}, "body": {"detail": "Internal server error"}}
+
+
+async def execute_batch(
+    app: ASGIApp,
+    parent: Scope,
+    operations: list[BatchOperationInput],
+    max_concurrency: int,
+) -> list[dict]:
+    """Executa as operações na ordem pedida; leituras consecutivas rodam juntas"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results: list[dict | None] = [None] * len(operations)
+
+    async def run(index: int, operation: BatchOperationInput) -> None:
+        async with semaphore:
+            results[index] = await dispatch(app, parent, operation)
+
+    reads = []
+    for index, operation in enumerate(operations):
+        if operation.method in SAFE_METHODS:
+            reads.append(run(index, operation))
+            continue
+        if reads:
+            await asyncio.gather(*reads)
+            reads = []
+        await run(index, operation)
+    if reads:
+        await asyncio.gather(*reads)
+    return results
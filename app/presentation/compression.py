@@ -0,0 +1,254 @@
+"""
+Compressão de respostas HTTP com negociação de Content-Encoding.
+
+gzip está sempre disponível; br (pacote `brotli`) e zstd (pacote `zstandard`) são usados
+quando instalados. O middleware comprime respostas acima de um tamanho mínimo, inclusive
+respostas em streaming, e deixa passar as que já têm Content-Encoding (como as variantes
+pré-comprimidas do cache de respostas) e os fluxos `text/event-stream`.
+"""
+
+import zlib
+from collections.abc import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependência opcional
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/msgpack",
+    "application/x-msgpack",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class Compressor:
+    """Codificações suportadas, em ordem de preferência do servidor, e seus níveis."""
+
+    def __init__(
+        self,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        brotli_enabled: bool = True,
+        zstd_enabled: bool = True,
+    ):
+        self.minimum_size = minimum_size
+        self._streams: dict[str, Callable[[], object]] = {}
+        if zstd_enabled and zstandard is not None:
+            self._streams["zstd"] = lambda: _ZstdStream(zstd_level)
+        if brotli_enabled and brotli is not None:
+            self._streams["br"] = lambda: _BrotliStream(brotli_quality)
+        self._streams["gzip"] = lambda: _GzipStream(gzip_level)
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        return tuple(self._streams)
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """
+        Escolhe a codificação pelo Accept-Encoding: maior q-value aceito pelo cliente e, no
+        empate, a preferência do servidor. Retorna None para enviar sem compressão.
+        """
+        if not accept_encoding:
+            return None
+        accepted: dict[str, float] = {}
+        for part in accept_encoding.split(","):
+            name, _, params = part.strip().partition(";")
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[name.strip().lower()] = quality
+
+        wildcard = accepted.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for encoding in self._streams:
+            quality = accepted.get(encoding, wildcard)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def stream(self, encoding: str):
+        return self._streams[encoding]()
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        stream = self.stream(encoding)
+        return stream.compress(data) + stream.finish()
+
+
+def is_compressible(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    if content_type.startswith(UNCOMPRESSIBLE_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def weak_etag(etag: str) -> str:
+    """ETags fortes identificam bytes exatos; a versão comprimida recebe um ETag fraco"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, compressor: Compressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.compressor.negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self.app, self.compressor, encoding)(scope, receive, send)
+
+
+class _CompressedResponder:
+    def __init__(self, app: ASGIApp, compressor: Compressor, encoding: str):
+        self.app = app
+        self.compressor = compressor
+        self.encoding = encoding
+        self.send: Send | None = None
+        self.start_message: Message | None = None
+        self.stream = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or not is_compressible(headers.get("content-type"))
+                or message["status"] < 200
+                or message["status"] in (204, 304)
+            )
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if self.start_message is not None:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not more_body and len(body) < self.compressor.minimum_size:
+                _add_vary(headers)
+                await self.send(self.start_message)
+                self.start_message = None
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            self.stream = self.compressor.stream(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            _add_vary(headers)
+            if "etag" in headers:
+                headers["ETag"] = weak_etag(headers["etag"])
+            if more_body:
+                del headers["Content-Length"]
+                chunk = self.stream.compress(body)
+            else:
+                chunk = self.stream.compress(body) + self.stream.finish()
+                headers["Content-Length"] = str(len(chunk))
+            await self.send(self.start_message)
+            self.start_message = None
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        chunk = self.stream.compress(body)
+        if not more_body:
+            chunk += self.stream.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+compressor: Compressor | None = (
+    Compressor(
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+        brotli_enabled=settings.COMPRESSION_BROTLI_ENABLED,
+        zstd_enabled=settings.COMPRESSION_ZSTD_ENABLED,
+    )
+    if settings.COMPRESSION_ENABLED
+    else None
+)
@@ -0,0 +1,128 @@
+"""
+Negociação de conteúdo JSON / MessagePack para clientes internos.
+
+`NegotiatedRoute` é a classe de rota dos routers de produtos e pedidos:
+
+- `Content-Type: application/msgpack`: o corpo é decodificado de MessagePack e validado pelo
+  mesmo modelo de entrada (`CreateProductInput`, `OrderInputDTO`, ...) que um corpo JSON;
+- `Accept: application/msgpack`: a resposta é codificada direto em MessagePack pelo
+  `MsgPackResponse`, sem passar por JSON. Respostas que o endpoint já devolve codificadas
+  em JSON (listagens) são convertidas uma vez.
+
+JSON continua sendo o padrão: MessagePack só é usado quando o cliente o aceita com qualidade
+maior que a de `application/json`. Sem o pacote `msgpack` instalado, as rotas se comportam
+como rotas comuns.
+"""
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.presentation.compression import weak_etag
+from app.presentation.responses import MSGPACK_MEDIA_TYPE, MsgPackResponse, json_to_msgpack, msgpack
+
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def _media_qualities(accept: str) -> dict[str, float]:
+    qualities: dict[str, float] = {}
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type.strip().lower()] = quality
+    return qualities
+
+
+def wants_msgpack(request: Request) -> bool:
+    """True quando o Accept prefere MessagePack a JSON; empates ficam com JSON"""
+    if msgpack is None:
+        return False
+    accept = request.headers.get("accept")
+    if not accept:
+        return False
+    qualities = _media_qualities(accept)
+    msgpack_quality = max(qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    return msgpack_quality > qualities.get("application/json", 0.0)
+
+
+def is_msgpack_body(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "")
+    return content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+class MsgPackRequest(Request):
+    """
+    Request com corpo MessagePack. O FastAPI só decodifica corpos com content-type JSON,
+    então o cabeçalho é reescrito para `application/json` e `json()` decodifica MessagePack.
+    """
+
+    def __init__(self, request: Request):
+        headers = [
+            (name, value) for name, value in request.scope["headers"] if name != b"content-type"
+        ]
+        headers.append((b"content-type", b"application/json"))
+        super().__init__({**request.scope, "headers": headers}, request.receive)
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+def to_msgpack_response(response: Response) -> Response:
+    """Converte uma resposta JSON já codificada; demais respostas são devolvidas intactas"""
+    if (
+        response.media_type != "application/json"
+        or "content-encoding" in response.headers
+        or not response.body
+    ):
+        return response
+    converted = Response(
+        content=json_to_msgpack(response.body),
+        status_code=response.status_code,
+        media_type=MSGPACK_MEDIA_TYPE,
+        background=response.background,
+    )
+    for name, value in response.headers.items():
+        if name not in ("content-length", "content-type"):
+            converted.headers.append(name, value)
+    return converted
+
+
+class NegotiatedRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        json_handler = super().get_route_handler()
+        if msgpack is None:
+            return json_handler
+
+        response_class = self.response_class
+        self.response_class = MsgPackResponse
+        try:
+            msgpack_handler = super().get_route_handler()
+        finally:
+            self.response_class = response_class
+
+        async def negotiated_route_handler(request: Request) -> Response:
+            if is_msgpack_body(request):
+                request = MsgPackRequest(request)
+            if not wants_msgpack(request):
+                response = await json_handler(request)
+            else:
+                response = to_msgpack_response(await msgpack_handler(request))
+                # ETags identificam a representação JSON; a MessagePack recebe um ETag fraco
+                if "etag" in response.headers:
+                    response.headers["ETag"] = weak_etag(response.headers["etag"])
+            vary = response.headers.get("vary")
+            response.headers["Vary"] = f"{vary}, Accept" if vary else "Accept"
+            return response
+
+        return negotiated_route_handler
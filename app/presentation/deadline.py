@@ -0,0 +1,99 @@
+"""
+Prazo por requisição: a configuração da rota define o tempo máximo e o cliente pode pedir
+um prazo menor pelo header (em milissegundos).
+
+O prazo vai para o contextvar de `app.core.deadline`, de onde os statements do SQLite o
+leem (um statement em andamento é interrompido quando o prazo passa), e a requisição inteira
+roda sob `asyncio.wait_for`: ao estourar, o trabalho pendente é cancelado e o cliente recebe
+504 em vez de uma resposta que ninguém espera mais.
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.deadline import deadline_scope
+from app.core.route_rules import RouteRules
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout_ms: int | None,
+        route_timeouts_ms: dict[str, int | None] | None = None,
+        header: str = "X-Request-Timeout-Ms",
+    ):
+        self.app = app
+        self.default_timeout_ms = default_timeout_ms
+        self.routes = RouteRules(route_timeouts_ms)
+        self.header = header
+        self._header_key = header.lower().encode("latin-1")
+
+    def _requested_timeout_ms(self, scope: Scope) -> int | None:
+        for name, value in scope["headers"]:
+            if name == self._header_key:
+                timeout_ms = int(value)
+                if timeout_ms <= 0:
+                    raise ValueError(value)
+                return timeout_ms
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"].rstrip("/") or "/"
+        timeout_ms = self.routes.match(scope["method"], path, default=self.default_timeout_ms)
+        try:
+            requested_ms = self._requested_timeout_ms(scope)
+        except ValueError:
+            await self._respond(send, 400, f"Header {self.header} inválido")
+            return
+        if requested_ms is not None:
+            timeout_ms = requested_ms if timeout_ms is None else min(timeout_ms, requested_ms)
+        if timeout_ms is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        # Sub-requisições do /batch herdam o prazo do lote: deadline_scope só encurta
+        with deadline_scope(timeout_ms / 1000) as deadline:
+            try:
+                await asyncio.wait_for(
+                    self.app(scope, receive, send_tracking_start), deadline - time.monotonic()
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Prazo esgotado: {scope['method']} {scope['path']} (limite {timeout_ms}ms)"
+                )
+                if response_started:
+                    # Resposta já iniciada: resta encerrar a conexão com o corpo incompleto
+                    return
+                await self._respond(send, 504, "Prazo da requisição esgotado")
+
+    async def _respond(self, send: Send, status_code: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
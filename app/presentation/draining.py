@@ -0,0 +1,34 @@
+"""
+Middleware que conta as requisições em andamento para a drenagem no desligamento.
+
+Durante a drenagem as requisições continuam sendo atendidas (uma requisição já aceita não
+deve virar erro num deploy), mas as respostas saem com `Connection: close`, então o cliente
+não reutiliza a conexão com esta instância.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.lifecycle import Lifecycle
+
+
+class DrainingMiddleware:
+    def __init__(self, app: ASGIApp, lifecycle: Lifecycle):
+        self.app = app
+        self.lifecycle = lifecycle
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_connection_close(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.lifecycle.draining:
+                MutableHeaders(raw=message["headers"])["Connection"] = "close"
+            await send(message)
+
+        self.lifecycle.request_started()
+        try:
+            await self.app(scope, receive, send_with_connection_close)
+        finally:
+            self.lifecycle.request_finished()
@@ -0,0 +1,102 @@
+"""
+Validadores HTTP (ETag / Last-Modified) e avaliação de requisições condicionais.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from app.application.dtos.product_dto import ProductResponseDTO
+from app.domain.entities.product_entity import ProductEntity
+
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Gera um ETag forte a partir das partes que identificam a versão do recurso"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def product_etag(product: ProductResponseDTO | ProductEntity) -> str:
+    return make_etag("product", product.id, product.updated_at.isoformat())
+
+
+def product_list_etag(
+    products: Iterable[ProductResponseDTO | ProductEntity],
+    skip: int,
+    limit: int,
+    fields: tuple[str, ...] | None = None,
+) -> str:
+    parts = ("products", skip, limit) if fields is None else ("products", skip, limit, fields)
+    return make_etag(
+        *parts,
+        tuple((product.id, product.updated_at.isoformat()) for product in products),
+    )
+
+
+def http_date(value: datetime) -> str:
+    """Formata um datetime (naive = UTC) no formato IMF-fixdate"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _parse_http_date(value: str) -> datetime | None:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparação fraca, como exigido para If-None-Match (RFC 9110 §13.1.2)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """
+    Indica se a requisição pode ser respondida com 304.
+
+    If-None-Match tem precedência; If-Modified-Since só é avaliado na sua ausência e
+    quando `last_modified` é informado.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    since = _parse_http_date(if_modified_since)
+    if since is None:
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # Last-Modified tem resolução de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
@@ -0,0 +1,89 @@
+"""
+Rate limiting por cliente: token bucket por chave de API (ou IP) e por regra de rota.
+
+O cliente é identificado pelo header de chave de API, guardado só como hash, ou pelo IP da
+conexão. Toda resposta limitada leva os headers `RateLimit-Limit`, `RateLimit-Remaining`,
+`RateLimit-Reset` e `RateLimit-Policy`; requisições acima do limite recebem 429 com
+`Retry-After` sem chegar à aplicação. Health checks ficam de fora, assim como o `/batch`:
+suas sub-requisições passam pelo middleware uma a uma, com a identidade do cliente do lote.
+"""
+
+import hashlib
+import json
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.rate_limit import RateLimiter, RateLimitResult, RateLimitRule
+
+EXEMPT_PATHS = ("/ping", "/ready", "/batch")
+# Chave no estado do scope, herdado pelas sub-requisições do /batch
+CLIENT_STATE_KEY = "rate_limit_client"
+
+
+def client_id(scope: Scope, api_key_header: bytes) -> str:
+    inherited = scope.get("state", {}).get(CLIENT_STATE_KEY)
+    if inherited is not None:
+        return inherited
+    for name, value in scope["headers"]:
+        if name == api_key_header and value:
+            return "key:" + hashlib.sha256(value).hexdigest()[:32]
+    client = scope.get("client")
+    return f"ip:{client[0]}" if client else "ip:unknown"
+
+
+def rate_limit_headers(rule: RateLimitRule, result: RateLimitResult) -> dict[str, str]:
+    return {
+        "RateLimit-Limit": str(result.limit),
+        "RateLimit-Remaining": str(result.remaining),
+        "RateLimit-Reset": str(result.reset_seconds),
+        "RateLimit-Policy": rule.policy,
+    }
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp, limiter: RateLimiter, api_key_header: str = "X-API-Key"):
+        self.app = app
+        self.limiter = limiter
+        self.api_key_header = api_key_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        client = client_id(scope, self.api_key_header)
+        path = scope["path"].rstrip("/") or "/"
+        if path in EXEMPT_PATHS:
+            scope.setdefault("state", {})[CLIENT_STATE_KEY] = client
+            await self.app(scope, receive, send)
+            return
+
+        checked = await self.limiter.check(client, scope["method"], path)
+        if checked is None:
+            await self.app(scope, receive, send)
+            return
+        rule, result = checked
+        headers = rate_limit_headers(rule, result)
+        if not result.allowed:
+            await self._reject(send, headers, result.retry_after_seconds)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"]).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _reject(self, send: Send, headers: dict[str, str], retry_after: int) -> None:
+        body = json.dumps({"detail": "Limite de requisições excedido"}).encode()
+        raw_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, retry_after)).encode()),
+        ]
+        raw_headers.extend(
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        )
+        await send({"type": "http.response.start", "status": 429, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,68 @@
+"""
+Classes de resposta da aplicação.
+
+Usa orjson quando disponível. O conteúdo chega aqui já serializado pelo response_model, de
+modo que o JSON produzido é o mesmo do `JSONResponse` do Starlette: Decimal vira string,
+datetime vira ISO 8601 e enums viram seus valores. `MsgPackResponse` codifica o mesmo
+conteúdo em MessagePack, para clientes que o negociam (ver `content_negotiation`).
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dependência opcional
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Tipo não serializável em JSON: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+DefaultJSONResponse: type[JSONResponse] = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Tipo não serializável em MessagePack: {type(value).__name__}")
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_msgpack_default)
+
+
+def json_loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    """Converte um corpo JSON já codificado (listagens e páginas em cache) para MessagePack"""
+    return msgpack.packb(json_loads(body))
@@ -0,0 +1,50 @@
+import re
+from typing import Any, Literal
+from urllib.parse import unquote
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.core.config import settings
+
+
+class BatchOperationInput(BaseModel):
+    method: Literal["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"]
+    path: str = Field(
+        ..., pattern=r"^/", description="Caminho com query string, ex.: /products?limit=5"
+    )
+    headers: dict[str, str] = Field(default_factory=dict)
+    body: Any = None
+
+    @field_validator("method", mode="before")
+    @classmethod
+    def normalize_method(cls, v):
+        return v.upper() if isinstance(v, str) else v
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, v):
+        # Mesma decodificação do despacho (ver app.presentation.batch): "/%62atch" é /batch
+        route = re.sub(r"/+", "/", unquote(v.split("?")[0])).rstrip("/")
+        if route == "/batch":
+            raise ValueError("Sub-requisições não podem chamar /batch")
+        return v
+
+    class Config:
+        json_schema_extra = {"example": {"method": "GET", "path": "/products/1"}}
+
+
+class BatchInput(BaseModel):
+    operations: list[BatchOperationInput] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_OPERATIONS
+    )
+
+
+class BatchOperationOutput(BaseModel):
+    status: int
+    headers: dict[str, str]
+    body: Any = None
+
+
+class BatchOutput(BaseModel):
+    # Na mesma ordem de `operations`
+    responses: list[BatchOperationOutput]
@@ -0,0 +1,72 @@
+from pydantic import BaseModel
+
+
+class CacheStatsOutput(BaseModel):
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+    generation: int | None = None
+    stale: int | None = None
+
+
+class SingleFlightOperationOutput(BaseModel):
+    executed: int
+    coalesced: int
+
+
+class SingleFlightStatsOutput(BaseModel):
+    enabled: bool
+    in_flight: int
+    executed: int
+    coalesced: int
+    coalesced_ratio: float
+    operations: dict[str, SingleFlightOperationOutput]
+
+
+class BatchLoaderStatsOutput(BaseModel):
+    window_ms: float
+    max_batch_size: int
+    loads: int
+    batches: int
+    keys_dispatched: int
+    avg_batch_size: float
+
+
+class IdFilterStatsOutput(BaseModel):
+    ready: bool
+    size: int
+    capacity: int
+    error_rate: float
+    max_known_id: int
+    rejected: int
+
+
+class ProductStreamStatsOutput(BaseModel):
+    subscribers: int
+    published: int
+    dropped: int
+    last_event_id: str | None
+
+
+class AdmissionStatsOutput(BaseModel):
+    limit: int
+    in_flight: int
+    waiting: int
+    admitted: int
+    queued: int
+    rejected: int
+    latency_ewma_ms: float | None
+
+
+class RateLimitStatsOutput(BaseModel):
+    enabled: bool
+    store: str | None = None
+    allowed: int = 0
+    limited: int = 0
+    errors: int = 0
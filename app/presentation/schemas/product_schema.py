@@ -46,6 +46,14 @@ class ProductOutput(BaseModel):
         }
 
 
+class ProductBatchOutput(BaseModel):
+    products: list[ProductOutput]
+    missing_ids: list[int]
+
+    class Config:
+        from_attributes = True
+
+
 class ProductListOutput(BaseModel):
     total: int
     skip: int
@@ -0,0 +1,12 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class ReadinessOutput(BaseModel):
+    status: Literal["pending", "running", "done", "timeout", "failed", "disabled"]
+    ready: bool
+    products_warmed: int
+    pages_warmed: int
+    duration_seconds: float
+    draining: bool = False
@@ -0,0 +1,139 @@
+"""
+Serialização direta de entidades para JSON nas listagens.
+
+As entidades vindas dos repositórios já são confiáveis, então não passam por DTOs nem pela
+validação dos modelos de resposta: cada linha vira um dict e é codificada por um serializer
+pré-compilado (`TypeAdapter.dump_json`). Os TypedDicts espelham `ProductOutput` e
+`OrderResponseDTO` campo a campo, e o JSON gerado é idêntico ao do caminho validado.
+
+Listagens com `?fields=` (sparse fieldsets) usam as variantes parciais dos TypedDicts e
+emitem só os campos pedidos, na ordem canônica.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from decimal import Decimal
+from operator import attrgetter
+from typing import TypedDict
+
+from pydantic import TypeAdapter
+
+from app.core.exceptions import ValidationException
+from app.domain.entities.order_entity import OrderCompleteEntity
+from app.domain.entities.order_item_entity import OrderItemEntity
+from app.domain.entities.product_entity import ProductEntity
+
+
+class ProductRow(TypedDict):
+    id: int
+    name: str
+    description: str
+    price: Decimal
+    quantity: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class OrderItemRow(TypedDict):
+    id: int
+    product_id: int
+    order_id: int
+    quantity: int
+    price: float
+
+
+class OrderRow(TypedDict):
+    id: int
+    order_date: datetime
+    status: str
+    total_amount: float
+    items: list[OrderItemRow] | None
+
+
+PartialProductRow = TypedDict("PartialProductRow", ProductRow.__annotations__, total=False)
+PartialOrderRow = TypedDict("PartialOrderRow", OrderRow.__annotations__, total=False)
+
+PRODUCT_FIELDS = tuple(ProductRow.__annotations__)
+# Colunas do pedido selecionáveis por `?fields=`; os itens são expandidos por `?include=items`
+ORDER_FIELDS = tuple(name for name in OrderRow.__annotations__ if name != "items")
+ORDER_INCLUDES = ("items",)
+
+_product_values = attrgetter(*PRODUCT_FIELDS)
+_product_rows_adapter = TypeAdapter(list[ProductRow])
+_partial_product_rows_adapter = TypeAdapter(list[PartialProductRow])
+_order_rows_adapter = TypeAdapter(list[OrderRow])
+_partial_order_rows_adapter = TypeAdapter(list[PartialOrderRow])
+
+
+def parse_fields(raw: str | None, allowed: tuple[str, ...]) -> tuple[str, ...] | None:
+    """
+    Interpreta uma lista separada por vírgulas (`?fields=id,name`) contra os nomes permitidos.
+    Retorna os nomes na ordem canônica de `allowed`, ou None quando o parâmetro está ausente.
+    """
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValidationException(
+            f"Campos inválidos: {', '.join(sorted(unknown))}. Permitidos: {', '.join(allowed)}"
+        )
+    return tuple(name for name in allowed if name in requested)
+
+
+def product_row(product: ProductEntity) -> ProductRow:
+    return dict(zip(PRODUCT_FIELDS, _product_values(product)))
+
+
+def dump_products_json(
+    products: Iterable[ProductEntity], fields: tuple[str, ...] | None = None
+) -> bytes:
+    if fields is None:
+        return _product_rows_adapter.dump_json([product_row(product) for product in products])
+    return _partial_product_rows_adapter.dump_json(
+        [{name: getattr(product, name) for name in fields} for product in products]
+    )
+
+
+def _order_item_row(item: OrderItemEntity) -> OrderItemRow:
+    return {
+        "id": item.id,
+        "product_id": item.product_id,
+        "order_id": item.order_id,
+        "quantity": item.quantity,
+        "price": float(item.price),
+    }
+
+
+def order_row(order: OrderCompleteEntity) -> OrderRow:
+    return {
+        "id": order.id,
+        "order_date": order.order_date,
+        "status": order.status,
+        "total_amount": float(order.total_amount),
+        "items": [_order_item_row(item) for item in order.items],
+    }
+
+
+def _partial_order_row(
+    order: OrderCompleteEntity, fields: tuple[str, ...], include_items: bool
+) -> PartialOrderRow:
+    row = {name: getattr(order, name) for name in fields}
+    if "total_amount" in row:
+        row["total_amount"] = float(row["total_amount"])
+    if include_items:
+        row["items"] = [_order_item_row(item) for item in order.items]
+    return row
+
+
+def dump_orders_json(
+    orders: Iterable[OrderCompleteEntity],
+    fields: tuple[str, ...] | None = None,
+    include_items: bool = True,
+) -> bytes:
+    if fields is None and include_items:
+        return _order_rows_adapter.dump_json([order_row(order) for order in orders])
+    fields = ORDER_FIELDS if fields is None else fields
+    return _partial_order_rows_adapter.dump_json(
+        [_partial_order_row(order, fields, include_items) for order in orders]
+    )
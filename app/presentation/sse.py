@@ -0,0 +1,57 @@
+"""
+Formatação de fluxos Server-Sent Events a partir de uma assinatura do `BroadcastHub`.
+
+O fluxo começa com `retry:` (intervalo de reconexão do EventSource), envia cada evento com
+`id:` para permitir retomada via `Last-Event-ID`, um comentário de keep-alive quando fica
+ocioso e um evento `reset` quando o cliente perdeu eventos e deve recarregar o estado.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from app.core.broadcast import BroadcastHub, Subscription
+
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+KEEP_ALIVE = b": keep-alive\n\n"
+
+
+def format_event(data: Any, event: str | None = None, id: str | None = None) -> bytes:
+    lines = []
+    if id is not None:
+        lines.append(f"id: {id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+async def event_stream(
+    hub: BroadcastHub,
+    subscription: Subscription,
+    event_name: str,
+    heartbeat_seconds: float,
+    retry_ms: int,
+) -> AsyncIterator[bytes]:
+    try:
+        yield f"retry: {retry_ms}\n\n".encode()
+        while True:
+            reason = subscription.take_reset()
+            if reason is not None:
+                yield format_event({"reason": reason}, event="reset")
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield KEEP_ALIVE
+                continue
+            if event is None:
+                return
+            # Descartes ocorridos enquanto a fila enchia são avisados antes do próximo evento
+            reason = subscription.take_reset()
+            if reason is not None:
+                yield format_event({"reason": reason}, event="reset")
+            yield format_event(event.data, event=event_name, id=event.id)
+    finally:
+        hub.unsubscribe(subscription)
@@ -0,0 +1,30 @@
+"""
+Warm-up dos caches na inicialização: produtos quentes e primeiras páginas de listagem.
+"""
+
+from functools import partial
+
+from app.application.dtos.cache_warmup_dto import CacheWarmupStatusDTO
+from app.core.config import settings
+from app.core.dependencies import get_cache_warmup_service, get_product_service, get_response_cache
+from app.presentation.api.v1.endpoints.product_controller import render_product_list_page
+
+
+async def warm_up_caches() -> CacheWarmupStatusDTO:
+    warmup_service = get_cache_warmup_service()
+    if not settings.CACHE_WARMUP_ENABLED:
+        warmup_service.mark_disabled()
+        return warmup_service.get_status()
+
+    page_size = settings.CACHE_WARMUP_LIST_PAGE_SIZE
+    page_loaders = [
+        partial(
+            render_product_list_page,
+            get_product_service(),
+            get_response_cache(),
+            page * page_size,
+            page_size,
+        )
+        for page in range(settings.CACHE_WARMUP_LIST_PAGES)
+    ]
+    return await warmup_service.run(page_loaders)
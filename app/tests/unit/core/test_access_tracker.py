@@ -0,0 +1,42 @@
+from app.core.cache.access_tracker import AccessTracker
+
+
+class TestAccessTracker:
+    def test_top_returns_most_accessed_keys(self):
+        tracker = AccessTracker()
+        for key in (1, 2, 2, 3, 3, 3):
+            tracker.record(key)
+
+        assert tracker.top(2) == [3, 2]
+
+    def test_number_of_keys_is_bounded(self):
+        tracker = AccessTracker(max_keys=2)
+        tracker.record(1)
+        tracker.record(1)
+        for key in range(2, 10):
+            tracker.record(key)
+
+        assert len(tracker) <= 4
+        assert tracker.top(1) == [1]
+
+    def test_snapshot_round_trip_halves_counts(self, tmp_path):
+        path = str(tmp_path / "snapshot" / "access.json")
+        tracker = AccessTracker()
+        for key in (1, 1, 1, 1, 2):
+            tracker.record(key)
+        tracker.save(path)
+
+        restored = AccessTracker()
+        assert restored.load(path) == 2
+        restored.record(2)
+        restored.record(2)
+
+        assert restored.top(2) == [2, 1]
+
+    def test_missing_or_corrupt_snapshot_is_ignored(self, tmp_path):
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        tracker = AccessTracker()
+
+        assert tracker.load(str(tmp_path / "missing.json")) == 0
+        assert tracker.load(str(corrupt)) == 0
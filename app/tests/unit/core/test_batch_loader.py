@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.core.batch_loader import BatchLoader
+
+
+class TestBatchLoader:
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_resolved_with_one_batch(self):
+        calls = []
+
+        async def batch_fn(keys):
+            calls.append(keys)
+            return {key: key * 10 for key in keys}
+
+        loader = BatchLoader(batch_fn, window_seconds=0.005)
+
+        results = await asyncio.gather(*(loader.load(key) for key in [1, 2, 3, 2]))
+
+        assert results == [10, 20, 30, 20]
+        assert calls == [[1, 2, 3]]
+        assert loader.stats()["batches"] == 1
+        assert loader.stats()["loads"] == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_keys_resolve_to_none(self):
+        async def batch_fn(keys):
+            return {1: "a"}
+
+        loader = BatchLoader(batch_fn, window_seconds=0.001)
+
+        assert await loader.load_many([1, 2]) == ["a", None]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_dispatches_before_window(self):
+        calls = []
+
+        async def batch_fn(keys):
+            calls.append(list(keys))
+            return {key: key for key in keys}
+
+        loader = BatchLoader(batch_fn, window_seconds=10, max_batch_size=2)
+
+        results = await asyncio.wait_for(loader.load_many([1, 2]), timeout=1)
+
+        assert results == [1, 2]
+        assert calls == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_error_is_propagated_to_every_caller(self):
+        async def batch_fn(keys):
+            raise RuntimeError("DB Error")
+
+        loader = BatchLoader(batch_fn, window_seconds=0.001)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
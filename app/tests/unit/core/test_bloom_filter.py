@@ -0,0 +1,78 @@
+import pytest
+
+from app.core.cache.bloom_filter import BloomFilter, KnownIdFilter
+
+
+class TestBloomFilter:
+    def test_added_keys_are_always_reported_present(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for key in range(1000):
+            bloom.add(key)
+
+        assert all(key in bloom for key in range(1000))
+
+    def test_false_positive_rate_stays_near_target(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for key in range(1000):
+            bloom.add(key)
+
+        false_positives = sum(key in bloom for key in range(1000, 11000))
+
+        assert false_positives / 10000 < 0.03
+
+    def test_invalid_parameters_are_rejected(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+
+class TestKnownIdFilter:
+    def test_nothing_is_rejected_before_ready(self):
+        id_filter = KnownIdFilter(capacity=100)
+        id_filter.add(10)
+
+        assert id_filter.might_exist(5)
+
+    def test_unknown_id_below_max_known_is_rejected(self):
+        id_filter = KnownIdFilter(capacity=100)
+        for product_id in (1, 2, 10):
+            id_filter.add(product_id)
+        id_filter.mark_ready()
+
+        assert id_filter.might_exist(2)
+        assert not id_filter.might_exist(5)
+        assert id_filter.stats()["rejected"] == 1
+
+    def test_ids_above_max_known_are_not_rejected(self):
+        id_filter = KnownIdFilter(capacity=100)
+        id_filter.add(10)
+        id_filter.mark_ready()
+
+        assert id_filter.might_exist(11)
+
+    def test_ids_created_after_load_do_not_raise_the_limit(self):
+        id_filter = KnownIdFilter(capacity=100)
+        for product_id in range(1, 6):
+            id_filter.add(product_id)
+        id_filter.mark_ready()
+
+        id_filter.add(7)
+
+        # 6 pode ter sido criado em outro worker antes do 7
+        assert id_filter.might_exist(6)
+        assert id_filter.stats()["max_known_id"] == 5
+
+    def test_removing_the_highest_id_stops_rejecting(self):
+        id_filter = KnownIdFilter(capacity=100)
+        for product_id in (1, 2, 10):
+            id_filter.add(product_id)
+        id_filter.mark_ready()
+
+        id_filter.remove(2)
+        assert not id_filter.might_exist(3)
+        id_filter.remove(10)
+
+        # Sem o 10, o SQLite reatribui a partir do maior restante (o próximo seria o 2)
+        assert id_filter.might_exist(2)
+        assert id_filter.might_exist(3)
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from app.core.broadcast import BroadcastHub
+
+
+async def _drain(subscription) -> list:
+    events = []
+    while True:
+        try:
+            event = await asyncio.wait_for(subscription.get(), 0.01)
+        except asyncio.TimeoutError:
+            return events
+        events.append(event.data)
+
+
+class TestBroadcastHub:
+    @pytest.mark.asyncio
+    async def test_publish_reaches_every_subscriber(self):
+        hub = BroadcastHub()
+        first, second = hub.subscribe(), hub.subscribe()
+
+        hub.publish({"id": 1})
+
+        assert await _drain(first) == [{"id": 1}]
+        assert await _drain(second) == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_and_flags_overflow(self):
+        hub = BroadcastHub(max_queue_size=2)
+        subscription = hub.subscribe()
+
+        for product_id in range(1, 5):
+            hub.publish({"id": product_id})
+
+        assert await _drain(subscription) == [{"id": 3}, {"id": 4}]
+        assert subscription.take_reset() == "overflow"
+        assert subscription.take_reset() is None
+        assert hub.stats()["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_last_event_id_replays_missed_events(self):
+        hub = BroadcastHub()
+        first = hub.publish({"id": 1})
+        hub.publish({"id": 2})
+        hub.publish({"id": 3})
+
+        subscription = hub.subscribe(last_event_id=first.id)
+
+        assert await _drain(subscription) == [{"id": 2}, {"id": 3}]
+        assert subscription.take_reset() is None
+
+    @pytest.mark.parametrize("last_event_id", ["other-1", "garbage", "{stream}-99"])
+    def test_unknown_or_expired_event_id_starts_with_gap_reset(self, last_event_id):
+        hub = BroadcastHub(replay_size=2)
+        for product_id in range(1, 5):
+            hub.publish({"id": product_id})
+
+        subscription = hub.subscribe(last_event_id=last_event_id.format(stream=hub.stream_id))
+        expired = hub.subscribe(last_event_id=f"{hub.stream_id}-1")
+
+        assert subscription.take_reset() == "gap"
+        assert expired.take_reset() == "gap"
+
+    @pytest.mark.asyncio
+    async def test_close_ends_subscriptions_after_pending_events(self):
+        hub = BroadcastHub()
+        subscription = hub.subscribe()
+        hub.publish({"id": 1})
+
+        hub.close()
+
+        assert (await subscription.get()).data == {"id": 1}
+        assert await subscription.get() is None
+        assert hub.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_after_close_returns_ended_subscription(self):
+        hub = BroadcastHub()
+        hub.close()
+
+        subscription = hub.subscribe()
+        hub.publish({"id": 1})
+
+        assert await asyncio.wait_for(subscription.get(), timeout=1) is None
+        assert hub.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_reopen_accepts_subscriptions_again(self):
+        hub = BroadcastHub()
+        hub.close()
+
+        hub.reopen()
+        subscription = hub.subscribe()
+        hub.publish({"id": 1})
+
+        assert (await subscription.get()).data == {"id": 1}
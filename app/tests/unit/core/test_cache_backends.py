@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from app.core.cache.backends import InMemoryCacheBackend, RedisCacheBackend, create_cache_backend
+from app.core.cache.invalidation import CacheInvalidationBridge
+from app.core.events import PRODUCT_CHANGED, EventBus, ProductChangedEvent
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condição não atendida a tempo")
+        await asyncio.sleep(0.01)
+
+
+def _fake_redis_backends(count: int) -> list[RedisCacheBackend]:
+    """Backends distintos apontando para o mesmo servidor fakeredis, como workers separados"""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    return [RedisCacheBackend(fakeredis.aioredis.FakeRedis(server=server)) for _ in range(count)]
+
+
+class TestInMemoryCacheBackend:
+    @pytest.mark.asyncio
+    async def test_set_get_and_delete(self):
+        backend = InMemoryCacheBackend()
+
+        await backend.set("a", b"1")
+
+        assert await backend.get_many(["a", "b"]) == [b"1", None]
+        await backend.delete("a")
+        assert await backend.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        backend = InMemoryCacheBackend()
+
+        await backend.set("a", b"1", ttl_seconds=0.01)
+        await asyncio.sleep(0.02)
+
+        assert await backend.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_add_keeps_existing_value(self):
+        backend = InMemoryCacheBackend()
+
+        assert await backend.add("a", b"1")
+        assert not await backend.add("a", b"2")
+        assert await backend.get("a") == b"1"
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_subscribers(self):
+        backend = InMemoryCacheBackend()
+        received = []
+        await backend.subscribe("channel", received.append)
+
+        await backend.publish("channel", "hello")
+
+        assert received == ["hello"]
+
+
+class TestRedisCacheBackend:
+    @pytest.mark.asyncio
+    async def test_values_are_visible_to_other_workers(self):
+        first, second = _fake_redis_backends(2)
+
+        await first.set("product:1", b"payload", ttl_seconds=60)
+
+        assert await second.get_many(["product:1", "product:2"]) == [b"payload", None]
+        await second.delete("product:1")
+        assert await first.get("product:1") is None
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_add_keeps_value_written_by_other_worker(self):
+        first, second = _fake_redis_backends(2)
+
+        assert await first.add("product:1", b"fresh", ttl_seconds=60)
+        assert not await second.add("product:1", b"stale", ttl_seconds=60)
+
+        assert await second.get("product:1") == b"fresh"
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_subscribers_on_other_workers(self):
+        first, second = _fake_redis_backends(2)
+        received = []
+        await second.subscribe("channel", received.append)
+
+        await first.publish("channel", "hello")
+
+        await _wait_for(lambda: received == ["hello"])
+        await first.close()
+        await second.close()
+
+
+class TestCreateCacheBackend:
+    def test_memory_url(self):
+        assert isinstance(create_cache_backend("memory://"), InMemoryCacheBackend)
+
+    def test_fakeredis_url(self):
+        pytest.importorskip("fakeredis")
+        backend = create_cache_backend("fakeredis://")
+
+        assert isinstance(backend, RedisCacheBackend)
+        assert backend.shared
+
+    def test_unknown_scheme_is_rejected(self):
+        with pytest.raises(ValueError):
+            create_cache_backend("memcached://localhost")
+
+
+class TestCacheInvalidationBridge:
+    @pytest.mark.asyncio
+    async def test_local_change_is_delivered_to_other_workers_once(self):
+        backends = _fake_redis_backends(2)
+        buses = [EventBus(), EventBus()]
+        bridges = [
+            CacheInvalidationBridge(backend, bus, "product.changed")
+            for backend, bus in zip(backends, buses)
+        ]
+        for bridge in bridges:
+            await bridge.start()
+        local_events, remote_events = [], []
+        buses[0].subscribe(PRODUCT_CHANGED, local_events.append)
+        buses[1].subscribe(PRODUCT_CHANGED, remote_events.append)
+
+        buses[0].publish(PRODUCT_CHANGED, ProductChangedEvent(7, "updated"))
+
+        await _wait_for(lambda: len(remote_events) == 1)
+        await asyncio.sleep(0.05)
+        assert remote_events[0].product_id == 7
+        assert remote_events[0].origin == bridges[0].instance_id
+        # O evento não volta para o worker de origem
+        assert len(local_events) == 1
+        for bridge, backend in zip(bridges, backends):
+            await bridge.stop()
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_remote_events_are_not_rebroadcast(self):
+        backend = InMemoryCacheBackend()
+        bus = EventBus()
+        bridge = CacheInvalidationBridge(backend, bus, "product.changed")
+        await bridge.start()
+        published = []
+        await backend.subscribe("product.changed", published.append)
+
+        bus.publish(PRODUCT_CHANGED, ProductChangedEvent(7, "updated", origin="other"))
+        await bridge.stop()
+
+        assert published == []
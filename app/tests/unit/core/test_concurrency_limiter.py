@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from app.core.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.mark.asyncio
+    async def test_rejects_when_limit_and_queue_are_full(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue=0)
+
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        assert limiter.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_slot_released_by_another_request(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue=1, queue_timeout_seconds=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release(0.01)
+
+        assert await waiter
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_gives_up_after_queue_timeout(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=1, max_queue=1, queue_timeout_seconds=0.01
+        )
+        await limiter.acquire()
+
+        assert not await limiter.acquire()
+        assert limiter.stats()["waiting"] == 0
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_saturated_requests_increase_limit_additively(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, target_latency_seconds=0.1)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        limiter.release(0.01)
+
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_requests_decrease_limit_once_per_window(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=10, target_latency_seconds=60, backoff_ratio=0.5
+        )
+        for _ in range(3):
+            await limiter.acquire()
+
+        limiter.release(61)
+        limiter.release(61)
+        limiter.release(0.01, failed=True)
+
+        assert limiter.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_limit_never_drops_below_minimum(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=2, min_limit=2, target_latency_seconds=0, backoff_ratio=0.1
+        )
+        await limiter.acquire()
+
+        limiter.release(1)
+
+        assert limiter.limit == 2
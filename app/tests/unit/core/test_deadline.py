@@ -0,0 +1,95 @@
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.databases.database import install_statement_deadlines
+from app.core.deadline import (
+    current_deadline,
+    deadline_exceeded,
+    deadline_scope,
+    detached_context,
+    remaining_seconds,
+)
+
+# Conta até 10^9 na VM do SQLite: muito mais lento que qualquer prazo dos testes
+SLOW_QUERY = text(
+    "WITH RECURSIVE r(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM r WHERE x < 1000000000) "
+    "SELECT count(*) FROM r"
+)
+
+
+class TestDeadlineScope:
+    def test_without_scope_there_is_no_deadline(self):
+        assert current_deadline() is None
+        assert remaining_seconds() is None
+        assert not deadline_exceeded()
+
+    def test_sets_and_restores_the_deadline(self):
+        with deadline_scope(10) as deadline:
+            assert current_deadline() == deadline
+            assert 9 < remaining_seconds() <= 10
+
+        assert current_deadline() is None
+
+    def test_nested_scope_can_only_shorten_the_deadline(self):
+        with deadline_scope(1) as outer:
+            with deadline_scope(10) as inner:
+                assert inner == outer
+            with deadline_scope(0.5) as shorter:
+                assert shorter < outer
+
+    def test_deadline_exceeded(self):
+        with deadline_scope(0):
+            assert deadline_exceeded()
+
+    def test_detached_context_has_no_deadline(self):
+        with deadline_scope(10):
+            assert detached_context().run(current_deadline) is None
+            assert current_deadline() is not None
+
+
+class TestStatementDeadlines:
+    @pytest.fixture
+    async def engine(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        install_statement_deadlines(engine)
+        yield engine
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_statement_is_interrupted_when_the_deadline_passes(self, engine):
+        started = time.monotonic()
+
+        with deadline_scope(0.1):
+            async with engine.connect() as conn:
+                with pytest.raises(OperationalError, match="interrupted"):
+                    await conn.execute(SLOW_QUERY)
+
+        assert time.monotonic() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_connection_returned_to_the_pool_loses_the_deadline(self, engine):
+        with deadline_scope(10):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                raw = await conn.get_raw_connection()
+                assert raw.info["statement_deadline"].deadline is not None
+
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            assert raw.info["statement_deadline"].deadline is None
+
+    @pytest.mark.asyncio
+    async def test_statements_without_deadline_are_not_interrupted(self, engine):
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "WITH RECURSIVE r(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM r "
+                    "WHERE x < 100000) SELECT count(*) FROM r"
+                )
+            )
+
+        assert result.scalar() == 100000
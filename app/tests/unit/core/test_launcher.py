@@ -0,0 +1,76 @@
+import os
+from unittest.mock import AsyncMock, patch
+
+from app import launcher
+
+
+def test_default_workers_uses_available_cpus():
+    with patch.object(launcher.os, "sched_getaffinity", return_value={0, 1, 2}, create=True):
+        assert launcher.default_workers() == 3
+
+
+def test_main_prepares_database_once_before_starting_workers(monkeypatch):
+    monkeypatch.setenv("DATABASE_INIT_ON_STARTUP", "true")
+    monkeypatch.setenv("SERVER_WORKERS", "")
+    monkeypatch.setenv("PRODUCT_ID_FILTER_ENABLED", "true")
+    monkeypatch.setenv("RESPONSE_CACHE_TTL_SECONDS", "300")
+    prepare = AsyncMock()
+    with (
+        patch.object(launcher, "prepare_database", prepare),
+        patch.object(launcher, "serve") as serve,
+    ):
+        launcher.main(["--port", "9000", "--workers", "4"])
+
+        prepare.assert_awaited_once()
+        assert os.environ["DATABASE_INIT_ON_STARTUP"] == "false"
+        config = serve.call_args.args[0]
+        assert config.app == launcher.APP
+        assert config.workers == 4
+        assert config.port == 9000
+        assert config.loop in ("uvloop", "asyncio")
+        assert config.http in ("httptools", "h11")
+
+
+def test_main_disables_id_filter_for_several_workers_without_shared_backend(monkeypatch):
+    monkeypatch.setenv("SERVER_WORKERS", "")
+    monkeypatch.setenv("PRODUCT_ID_FILTER_ENABLED", "true")
+    monkeypatch.setenv("RESPONSE_CACHE_TTL_SECONDS", "300")
+    monkeypatch.setattr(launcher.settings, "CACHE_BACKEND_URL", "memory://")
+    monkeypatch.setattr(launcher.settings, "PRODUCT_CACHE_TTL_SECONDS", 60.0)
+    monkeypatch.setattr(launcher.settings, "RESPONSE_CACHE_TTL_SECONDS", 300.0)
+    with (
+        patch.object(launcher, "prepare_database", AsyncMock()),
+        patch.object(launcher, "serve"),
+    ):
+        launcher.main(["--workers", "4"])
+
+    assert os.environ["SERVER_WORKERS"] == "4"
+    assert os.environ["PRODUCT_ID_FILTER_ENABLED"] == "false"
+    assert os.environ["RESPONSE_CACHE_TTL_SECONDS"] == "60.0"
+
+
+def test_main_keeps_id_filter_for_a_single_worker(monkeypatch):
+    monkeypatch.setenv("SERVER_WORKERS", "")
+    monkeypatch.setenv("PRODUCT_ID_FILTER_ENABLED", "true")
+    monkeypatch.setenv("RESPONSE_CACHE_TTL_SECONDS", "300")
+    monkeypatch.setattr(launcher.settings, "CACHE_BACKEND_URL", "memory://")
+    with (
+        patch.object(launcher, "prepare_database", AsyncMock()),
+        patch.object(launcher, "serve"),
+    ):
+        launcher.main(["--workers", "1"])
+
+    assert os.environ["SERVER_WORKERS"] == "1"
+    assert os.environ["PRODUCT_ID_FILTER_ENABLED"] == "true"
+    assert os.environ["RESPONSE_CACHE_TTL_SECONDS"] == "300"
+
+
+def test_draining_server_starts_drain_on_exit_signal():
+    server = launcher.DrainingServer(launcher.uvicorn.Config(launcher.APP))
+    try:
+        server.handle_exit(15, None)
+
+        assert launcher.lifecycle.draining
+        assert server.should_exit
+    finally:
+        launcher.lifecycle.reset()
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from app.core.lifecycle import Lifecycle
+
+
+class TestLifecycle:
+    def test_begin_drain_runs_callbacks_once(self):
+        lifecycle = Lifecycle()
+        calls = []
+        lifecycle.on_drain(lambda: calls.append("hub"))
+
+        lifecycle.begin_drain()
+        lifecycle.begin_drain()
+
+        assert lifecycle.draining
+        assert calls == ["hub"]
+
+    def test_failing_callback_does_not_stop_drain(self):
+        lifecycle = Lifecycle()
+        calls = []
+        lifecycle.on_drain(lambda: 1 / 0)
+        lifecycle.on_drain(lambda: calls.append("next"))
+
+        lifecycle.begin_drain()
+
+        assert calls == ["next"]
+
+    @pytest.mark.asyncio
+    async def test_wait_idle_returns_when_requests_finish(self):
+        lifecycle = Lifecycle()
+        lifecycle.request_started()
+        asyncio.get_running_loop().call_later(0.05, lifecycle.request_finished)
+
+        assert await lifecycle.wait_idle(timeout=1)
+        assert lifecycle.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_idle_gives_up_at_deadline(self):
+        lifecycle = Lifecycle()
+        lifecycle.request_started()
+
+        assert not await lifecycle.wait_idle(timeout=0.05)
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from app.core.cache.lru_ttl_cache import LRUTTLCache
+
+
+class TestLRUTTLCache:
+    def test_get_returns_stored_value_and_counts_hit(self):
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set(1, "a")
+
+        assert cache.get(1) == "a"
+        assert cache.get(2) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set(1, "a")
+        cache.set(2, "b")
+        cache.get(1)
+        cache.set(3, "c")
+
+        assert 1 in cache
+        assert 2 not in cache
+        assert 3 in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        cache = LRUTTLCache(max_size=2, ttl_seconds=10)
+        with patch("app.core.cache.lru_ttl_cache.time.monotonic", return_value=100.0):
+            cache.set(1, "a")
+        with patch("app.core.cache.lru_ttl_cache.time.monotonic", return_value=111.0):
+            assert cache.get(1) is None
+
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_set_with_stale_version_is_discarded(self):
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        version = cache.version
+        cache.delete(1)
+
+        assert cache.set(1, "stale", version=version) is False
+        assert cache.get(1) is None
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+
+from app.core.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimiter,
+    RateLimitRule,
+    RateLimitStore,
+    RedisRateLimitStore,
+    consume_tokens,
+)
+
+
+class TestRateLimitRule:
+    @pytest.mark.parametrize(
+        "spec,limit,period",
+        [
+            ("120/minute", 120, 60),
+            ("10/second", 10, 1),
+            ("1000 / hour", 1000, 3600),
+            ("20/5s", 20, 5),
+            ("5/d", 5, 86400),
+        ],
+    )
+    def test_parse(self, spec, limit, period):
+        rule = RateLimitRule.parse("r", spec)
+
+        assert (rule.limit, rule.period_seconds) == (limit, period)
+
+    @pytest.mark.parametrize("spec", ["", "abc", "10/week", "0/minute", "-1/second"])
+    def test_parse_rejects_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            RateLimitRule.parse("r", spec)
+
+    def test_policy(self):
+        assert RateLimitRule.parse("r", "120/minute").policy == "120;w=60"
+
+
+class TestConsumeTokens:
+    def test_refills_proportionally_to_elapsed_time_up_to_the_limit(self):
+        rule = RateLimitRule.parse("r", "10/10s")
+
+        tokens, result = consume_tokens(0.0, updated_at=0.0, now=3.0, rule=rule)
+
+        assert result.allowed
+        assert tokens == pytest.approx(2.0)
+        tokens, _ = consume_tokens(0.0, updated_at=0.0, now=1000.0, rule=rule)
+        assert tokens == pytest.approx(9.0)
+
+    def test_denied_result_reports_retry_after(self):
+        rule = RateLimitRule.parse("r", "10/10s")
+
+        tokens, result = consume_tokens(0.25, updated_at=5.0, now=5.0, rule=rule)
+
+        assert not result.allowed
+        assert tokens == 0.25
+        assert result.remaining == 0
+        assert result.retry_after_seconds == 1
+        assert result.reset_seconds == 10
+
+
+class TestInMemoryRateLimitStore:
+    @pytest.mark.asyncio
+    async def test_allows_a_burst_up_to_the_limit_then_denies(self):
+        store = InMemoryRateLimitStore()
+        rule = RateLimitRule.parse("r", "3/minute")
+
+        results = [await store.consume("client", rule) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+        assert results[-1].retry_after_seconds == 20
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_per_key(self):
+        store = InMemoryRateLimitStore()
+        rule = RateLimitRule.parse("r", "1/minute")
+
+        await store.consume("a", rule)
+
+        assert (await store.consume("b", rule)).allowed
+        assert not (await store.consume("a", rule)).allowed
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_keys(self):
+        store = InMemoryRateLimitStore(max_keys=2)
+        rule = RateLimitRule.parse("r", "1/minute")
+
+        for key in ("a", "b", "a", "c"):
+            await store.consume(key, rule)
+
+        assert set(store._buckets) == {"a", "c"}
+
+
+def _fake_redis_stores(count: int) -> list[RedisRateLimitStore]:
+    """Stores distintos apontando para o mesmo servidor fakeredis, como workers separados"""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    return [RedisRateLimitStore(fakeredis.aioredis.FakeRedis(server=server)) for _ in range(count)]
+
+
+class TestRedisRateLimitStore:
+    @pytest.mark.asyncio
+    async def test_workers_share_the_same_bucket(self):
+        first, second = _fake_redis_stores(2)
+        rule = RateLimitRule.parse("r", "4/minute")
+
+        results = await asyncio.gather(
+            *(store.consume("client", rule) for store in (first, second) * 3)
+        )
+
+        assert sum(r.allowed for r in results) == 4
+
+    @pytest.mark.asyncio
+    async def test_bucket_expires_after_idle_period(self):
+        (store,) = _fake_redis_stores(1)
+        rule = RateLimitRule.parse("r", "2/minute")
+
+        await store.consume("client", rule)
+
+        ttl = await store.client.pttl("ecommerce:ratelimit:client")
+        assert 60_000 < ttl <= 61_000
+
+    def test_rejects_zero_retries(self):
+        with pytest.raises(ValueError):
+            RedisRateLimitStore(client=None, retries=0)
+
+
+class _FailingStore(RateLimitStore):
+    async def consume(self, key, rule, cost=1):
+        raise ConnectionError("store fora do ar")
+
+
+class TestRateLimiter:
+    def test_longest_matching_prefix_wins(self):
+        limiter = RateLimiter(
+            InMemoryRateLimitStore(),
+            RateLimitRule.parse("default", "100/minute"),
+            {
+                "GET /orders": "10/minute",
+                "GET /orders/status": "5/minute",
+                "* /products": "7/minute",
+            },
+        )
+
+        assert limiter.rule_for("GET", "/orders").limit == 10
+        assert limiter.rule_for("GET", "/orders/1").limit == 10
+        assert limiter.rule_for("GET", "/orders/status").limit == 5
+        assert limiter.rule_for("POST", "/orders/create").name == "default"
+        assert limiter.rule_for("GET", "/ordersx").name == "default"
+        assert limiter.rule_for("DELETE", "/products/1").limit == 7
+
+    def test_no_default_rule_leaves_other_routes_unlimited(self):
+        limiter = RateLimiter(InMemoryRateLimitStore(), None, {"GET /orders": "10/minute"})
+
+        assert limiter.rule_for("GET", "/products") is None
+
+    def test_rejects_rule_without_path(self):
+        with pytest.raises(ValueError):
+            RateLimiter(InMemoryRateLimitStore(), None, {"GET": "10/minute"})
+
+    @pytest.mark.asyncio
+    async def test_each_rule_has_its_own_bucket(self):
+        limiter = RateLimiter(
+            InMemoryRateLimitStore(),
+            RateLimitRule.parse("default", "5/minute"),
+            {"GET /orders": "1/minute"},
+        )
+
+        await limiter.check("client", "GET", "/orders")
+        _, orders = await limiter.check("client", "GET", "/orders")
+        _, products = await limiter.check("client", "GET", "/products")
+
+        assert not orders.allowed
+        assert products.allowed
+        assert limiter.stats()["limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_store_is_unavailable(self):
+        limiter = RateLimiter(_FailingStore(), RateLimitRule.parse("default", "1/minute"))
+
+        assert await limiter.check("client", "GET", "/orders") is None
+        assert limiter.stats()["errors"] == 1
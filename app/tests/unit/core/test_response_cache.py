@@ -0,0 +1,42 @@
+from app.core.cache.response_cache import CachedResponse, ResponseCache
+from app.core.events import PRODUCT_CHANGED, EventBus, ProductChangedEvent
+
+
+def _entry(generation: int) -> CachedResponse:
+    return CachedResponse(body=b"[]", etag='"x"', generation=generation)
+
+
+class TestResponseCache:
+    def test_entry_is_served_within_the_same_generation(self):
+        cache = ResponseCache(max_entries=4)
+        cache.set(("products", 0, 10), _entry(cache.generation))
+
+        assert cache.get(("products", 0, 10)).body == b"[]"
+        assert cache.stats()["hits"] == 1
+
+    def test_bumping_generation_makes_entries_stale(self):
+        cache = ResponseCache(max_entries=4)
+        cache.set(("products", 0, 10), _entry(cache.generation))
+
+        cache.bump_generation()
+
+        assert cache.get(("products", 0, 10)) is None
+        assert cache.stats()["stale"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entry_rendered_before_a_write_is_not_stored(self):
+        cache = ResponseCache(max_entries=4)
+        generation = cache.generation
+        cache.bump_generation()
+
+        assert cache.set(("products", 0, 10), _entry(generation)) is False
+        assert cache.get(("products", 0, 10)) is None
+
+    def test_product_change_event_bumps_generation(self):
+        bus = EventBus()
+        cache = ResponseCache(max_entries=4)
+        bus.subscribe(PRODUCT_CHANGED, cache.bump_generation)
+
+        bus.publish(PRODUCT_CHANGED, ProductChangedEvent(1, "updated"))
+
+        assert cache.generation == 1
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from app.core.deadline import current_deadline, deadline_scope
+from app.core.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "product"
+
+        results = await asyncio.gather(
+            *(single_flight.do(("product_by_id", 1), load) for _ in range(10))
+        )
+
+        assert results == ["product"] * 10
+        assert calls == 1
+        stats = single_flight.stats()
+        assert stats["executed"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["operations"]["product_by_id"] == {"executed": 1, "coalesced": 9}
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self):
+        single_flight = SingleFlight()
+
+        async def load(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            single_flight.do(("product_by_id", 1), lambda: load(1)),
+            single_flight.do(("product_by_id", 2), lambda: load(2)),
+        )
+
+        assert results == [1, 2]
+        assert single_flight.stats()["executed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_propagated_to_all_waiters(self):
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(single_flight.do(("product_list", 0, 10), fail) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.stats()["executed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        single_flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.create_task(single_flight.do(("order_list",), load))
+        second = asyncio.create_task(single_flight.do(("order_list",), load))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "ok"
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_execute_again(self):
+        single_flight = SingleFlight()
+
+        async def load():
+            return "fresh"
+
+        await single_flight.do(("order_list",), load)
+        await single_flight.do(("order_list",), load)
+
+        assert single_flight.stats()["executed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_single_flight_always_executes(self):
+        single_flight = SingleFlight(enabled=False)
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*(single_flight.do(("product_by_id", 1), load) for _ in range(3)))
+
+        assert calls == 3
+
+
+class TestSingleFlightDeadline:
+    @pytest.mark.asyncio
+    async def test_shared_execution_runs_without_the_callers_deadline(self):
+        single_flight = SingleFlight()
+
+        async def load():
+            return current_deadline()
+
+        with deadline_scope(10):
+            result = await single_flight.do("key", load)
+
+        assert result is None
@@ -0,0 +1,34 @@
+import copy
+
+import pytest
+
+from app.application.dtos.product_dto import CreateProductDTO, ProductResponseDTO
+from app.domain.entities.order_entity import OrderCompleteEntity, OrderEntity
+from app.domain.entities.order_item_entity import OrderItemEntity
+from app.domain.entities.product_entity import ProductEntity
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        ProductEntity(name="P", description="D", price=1, quantity=1),
+        OrderEntity(id=1),
+        OrderCompleteEntity(id=1),
+        OrderItemEntity(id=1),
+        CreateProductDTO(name="P", description="D", price=1, quantity=1),
+        ProductResponseDTO(1, "P", "D", 1, 1, None, None),
+    ],
+    ids=lambda instance: type(instance).__name__,
+)
+def test_instances_have_no_per_instance_dict(instance):
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unexpected = True
+
+
+def test_slotted_entity_copy_is_independent(product_entity):
+    copied = copy.copy(product_entity)
+    copied.name = "Changed"
+
+    assert product_entity.name == "Test Product"
+    assert copied.price == product_entity.price
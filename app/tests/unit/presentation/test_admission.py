@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.core.concurrency_limiter import AdaptiveConcurrencyLimiter
+from app.presentation.admission import AdmissionControlMiddleware, route_group
+
+
+def _scope(method: str, path: str) -> dict:
+    return Request({"type": "http", "method": method, "path": path, "headers": []}).scope
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("GET", "/products", "read"),
+        ("GET", "/orders/1", "read"),
+        ("POST", "/orders/create", "write"),
+        ("DELETE", "/products/1", "write"),
+        ("GET", "/ping", None),
+        ("GET", "/ready", None),
+        ("GET", "/metrics/cache", None),
+        ("GET", "/products/stream", None),
+        ("POST", "/batch", None),
+    ],
+)
+def test_route_group(method, path, expected):
+    assert route_group(_scope(method, path)) == expected
+
+
+def _client(limiters: dict) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    @app.post("/items")
+    async def create_item():
+        await asyncio.sleep(0)
+        return {}
+
+    @app.get("/ping")
+    async def ping():
+        return "pong"
+
+    app.add_middleware(AdmissionControlMiddleware, limiters=limiters, retry_after_seconds=2)
+    return TestClient(app)
+
+
+def test_rejects_with_503_and_retry_after_when_group_is_saturated():
+    write = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue=0)
+    write._in_flight = 1
+    client = _client({"read": AdaptiveConcurrencyLimiter(), "write": write})
+
+    rejected = client.post("/items")
+    read = client.get("/items")
+    ping = client.get("/ping")
+
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "2"
+    assert read.status_code == 200
+    assert ping.status_code == 200
+
+
+def test_admitted_request_releases_its_slot():
+    read = AdaptiveConcurrencyLimiter()
+    client = _client({"read": read, "write": AdaptiveConcurrencyLimiter()})
+
+    client.get("/items")
+
+    assert read.in_flight == 0
+    assert read.stats()["admitted"] == 1
@@ -0,0 +1,102 @@
+import asyncio
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.presentation.api.v1.endpoints.batch_controller import router as batch_router
+
+
+def _client() -> tuple[TestClient, dict]:
+    app = FastAPI()
+    state = {"items": {}, "active": 0, "max_active": 0}
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        if item_id not in state["items"]:
+            raise HTTPException(status_code=404, detail="not found")
+        return state["items"][item_id]
+
+    @app.post("/items", status_code=201)
+    async def create_item(body: dict):
+        item_id = len(state["items"]) + 1
+        state["items"][item_id] = {"id": item_id, **body}
+        return state["items"][item_id]
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app.include_router(batch_router)
+    return TestClient(app), state
+
+
+def _batch(client: TestClient, *operations: dict):
+    response = client.post("/batch", json={"operations": list(operations)})
+    assert response.status_code == 200
+    return response.json()["responses"]
+
+
+class TestBatch:
+    def test_responses_keep_operation_order_and_own_status(self):
+        client, _ = _client()
+
+        responses = _batch(
+            client,
+            {"method": "POST", "path": "/items", "body": {"name": "a"}},
+            {"method": "GET", "path": "/items/1"},
+            {"method": "GET", "path": "/items/2"},
+        )
+
+        assert [response["status"] for response in responses] == [201, 200, 404]
+        assert responses[1]["body"] == {"id": 1, "name": "a"}
+        assert responses[1]["headers"]["content-type"] == "application/json"
+
+    def test_consecutive_reads_run_concurrently(self):
+        client, state = _client()
+        state["items"][1] = {"id": 1}
+
+        _batch(client, *({"method": "GET", "path": "/items/1"} for _ in range(4)))
+
+        assert state["max_active"] > 1
+
+    def test_write_waits_for_previous_reads(self):
+        client, _ = _client()
+
+        responses = _batch(
+            client,
+            {"method": "GET", "path": "/items/1"},
+            {"method": "POST", "path": "/items", "body": {"name": "a"}},
+            {"method": "GET", "path": "/items/1"},
+        )
+
+        assert [response["status"] for response in responses] == [404, 201, 200]
+
+    def test_unhandled_error_becomes_500_result(self):
+        client, _ = _client()
+
+        responses = _batch(client, {"method": "GET", "path": "/boom"})
+
+        assert responses[0]["status"] == 500
+
+    def test_nested_batch_is_rejected(self):
+        client, _ = _client()
+
+        response = client.post(
+            "/batch", json={"operations": [{"method": "POST", "path": "/batch"}]}
+        )
+
+        assert response.status_code == 422
+
+    def test_percent_encoded_nested_batch_is_rejected(self):
+        client, _ = _client()
+        inner = {"operations": [{"method": "GET", "path": "/items/1"}]}
+
+        for path in ("/%62atch", "/%62%61tch/", "//batch?x=1"):
+            response = client.post(
+                "/batch", json={"operations": [{"method": "POST", "path": path, "body": inner}]}
+            )
+            assert response.status_code == 422, path
@@ -0,0 +1,136 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.core.cache.response_cache import CachedResponse
+from app.presentation.api.v1.endpoints import product_controller
+from app.presentation.compression import CompressionMiddleware, Compressor, weak_etag
+
+LARGE = b'{"items":"' + b"x" * 4096 + b'"}'
+
+
+def _client(compressor: Compressor) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return Response(LARGE, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/encoded")
+    async def encoded():
+        body = gzip.compress(LARGE)
+        return Response(body, media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/events")
+    async def events():
+        return StreamingResponse(iter([LARGE]), media_type="text/event-stream")
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([LARGE, LARGE]), media_type="application/json")
+
+    app.add_middleware(CompressionMiddleware, compressor=compressor)
+    return TestClient(app)
+
+
+class TestNegotiate:
+    def test_prefers_server_order_on_equal_quality(self):
+        compressor = Compressor(brotli_enabled=False, zstd_enabled=False)
+
+        assert compressor.negotiate("br, gzip") == "gzip"
+        assert compressor.negotiate("identity") is None
+        assert compressor.negotiate(None) is None
+
+    def test_honours_q_values_and_wildcard(self):
+        compressor = Compressor(brotli_enabled=False, zstd_enabled=False)
+
+        assert compressor.negotiate("gzip;q=0, *") is None
+        assert compressor.negotiate("*;q=0.5") == "gzip"
+
+    def test_highest_quality_wins_over_server_preference(self):
+        pytest.importorskip("brotli")
+        pytest.importorskip("zstandard")
+        compressor = Compressor()
+
+        assert compressor.encodings == ("zstd", "br", "gzip")
+        assert compressor.negotiate("gzip, br, zstd") == "zstd"
+        assert compressor.negotiate("gzip;q=1.0, zstd;q=0.5") == "gzip"
+
+
+class TestCompressionMiddleware:
+    def test_compresses_large_response_with_weak_etag(self):
+        client = _client(Compressor(brotli_enabled=False, zstd_enabled=False))
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.content == LARGE
+
+    def test_small_response_is_sent_uncompressed(self):
+        client = _client(Compressor(brotli_enabled=False, zstd_enabled=False))
+
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_already_encoded_and_event_stream_pass_through(self):
+        client = _client(Compressor(brotli_enabled=False, zstd_enabled=False))
+
+        encoded = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+        events = client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        assert encoded.content == LARGE
+        assert "content-encoding" not in events.headers
+        assert events.content == LARGE
+
+    def test_streaming_response_is_compressed_incrementally(self):
+        client = _client(Compressor(brotli_enabled=False, zstd_enabled=False))
+
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.content == LARGE + LARGE
+
+    @pytest.mark.parametrize("encoding", ["br", "zstd"])
+    def test_optional_encodings_round_trip(self, encoding):
+        module = pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[encoding])
+        compressor = Compressor()
+
+        data = compressor.compress(LARGE, encoding)
+
+        if encoding == "br":
+            assert module.decompress(data) == LARGE
+        else:
+            assert module.ZstdDecompressor().decompressobj().decompress(data) == LARGE
+
+
+def test_weak_etag_is_idempotent():
+    assert weak_etag('"abc"') == 'W/"abc"'
+    assert weak_etag('W/"abc"') == 'W/"abc"'
+
+
+def test_cached_response_reuses_precompressed_variant(monkeypatch):
+    compressor = Compressor(brotli_enabled=False, zstd_enabled=False)
+    monkeypatch.setattr(product_controller, "compressor", compressor)
+    entry = CachedResponse(body=LARGE, etag='"abc"', generation=0)
+    request = Request({"type": "http", "method": "GET", "headers": [(b"accept-encoding", b"gzip")]})
+
+    first = product_controller._cached_response(entry, request)
+    second = product_controller._cached_response(entry, request)
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"] == 'W/"abc"'
+    assert gzip.decompress(first.body) == LARGE
+    assert second.body is entry.variants[("application/json", "gzip")]
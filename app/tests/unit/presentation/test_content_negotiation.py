@@ -0,0 +1,97 @@
+from decimal import Decimal
+
+import pytest
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from app.presentation.content_negotiation import NegotiatedRoute, wants_msgpack
+
+msgpack = pytest.importorskip("msgpack")
+
+MSGPACK = {"Content-Type": "application/msgpack", "Accept": "application/msgpack"}
+
+
+class ItemInput(BaseModel):
+    name: str
+    price: Decimal
+
+
+def _client() -> TestClient:
+    router = APIRouter(route_class=NegotiatedRoute)
+
+    @router.post("/items", response_model=ItemInput)
+    async def create_item(body: ItemInput):
+        return body
+
+    @router.get("/raw")
+    async def raw():
+        return Response(b'[{"id":1}]', media_type="application/json", headers={"ETag": '"v1"'})
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def _request(accept: str | None) -> Request:
+    headers = [(b"accept", accept.encode())] if accept is not None else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class TestWantsMsgpack:
+    @pytest.mark.parametrize(
+        "accept,expected",
+        [
+            (None, False),
+            ("*/*", False),
+            ("application/json", False),
+            ("application/msgpack", True),
+            ("application/x-msgpack", True),
+            ("application/json, application/msgpack", False),
+            ("application/json;q=0.5, application/msgpack", True),
+            ("application/msgpack;q=0", False),
+        ],
+    )
+    def test_json_remains_default(self, accept, expected):
+        assert wants_msgpack(_request(accept)) is expected
+
+
+class TestNegotiatedRoute:
+    def test_msgpack_body_is_validated_and_answered_in_msgpack(self):
+        client = _client()
+
+        response = client.post(
+            "/items", content=msgpack.packb({"name": "Café", "price": "9.90"}), headers=MSGPACK
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert response.headers["vary"] == "Accept"
+        assert msgpack.unpackb(response.content) == {"name": "Café", "price": "9.90"}
+
+    def test_invalid_msgpack_body_fails_validation(self):
+        client = _client()
+
+        invalid = client.post("/items", content=msgpack.packb({"name": "x"}), headers=MSGPACK)
+        malformed = client.post("/items", content=b"\xc1", headers=MSGPACK)
+
+        assert invalid.status_code == 422
+        assert malformed.status_code == 400
+
+    def test_json_is_unchanged(self):
+        client = _client()
+
+        response = client.post("/items", json={"name": "x", "price": "1.00"})
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"name": "x", "price": "1.00"}
+
+    def test_prerendered_json_is_converted_with_weak_etag(self):
+        client = _client()
+
+        response = client.get("/raw", headers={"Accept": "application/msgpack"})
+
+        assert response.headers["content-type"] == "application/msgpack"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert msgpack.unpackb(response.content) == [{"id": 1}]
@@ -0,0 +1,71 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.deadline import remaining_seconds
+from app.presentation.deadline import DeadlineMiddleware
+
+
+def _client(default_timeout_ms: int | None = 1000, routes: dict | None = None) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/remaining")
+    async def remaining():
+        return {"remaining": remaining_seconds()}
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(5)
+        return {}
+
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout_ms=default_timeout_ms,
+        route_timeouts_ms=routes,
+        header="X-Request-Timeout-Ms",
+    )
+    return TestClient(app)
+
+
+def test_request_runs_with_the_route_deadline():
+    client = _client(default_timeout_ms=1000, routes={"GET /remaining": 300})
+
+    remaining = client.get("/remaining").json()["remaining"]
+
+    assert 0 < remaining <= 0.3
+
+
+def test_header_can_only_shorten_the_deadline():
+    client = _client(default_timeout_ms=1000)
+
+    shorter = client.get("/remaining", headers={"X-Request-Timeout-Ms": "200"})
+    longer = client.get("/remaining", headers={"X-Request-Timeout-Ms": "60000"})
+
+    assert shorter.json()["remaining"] <= 0.2
+    assert 0.2 < longer.json()["remaining"] <= 1
+
+
+def test_route_without_deadline():
+    client = _client(default_timeout_ms=1000, routes={"GET /remaining": None})
+
+    assert client.get("/remaining").json()["remaining"] is None
+    remaining = client.get("/remaining", headers={"X-Request-Timeout-Ms": "500"}).json()
+    assert 0 < remaining["remaining"] <= 0.5
+
+
+def test_expired_deadline_returns_504():
+    client = _client(default_timeout_ms=50)
+
+    response = client.get("/slow")
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Prazo da requisição esgotado"}
+
+
+def test_invalid_header_returns_400():
+    client = _client()
+
+    for value in ("abc", "0", "-5"):
+        response = client.get("/remaining", headers={"X-Request-Timeout-Ms": value})
+        assert response.status_code == 400
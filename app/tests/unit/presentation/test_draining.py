@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.lifecycle import Lifecycle
+from app.presentation.draining import DrainingMiddleware
+
+
+def _client(lifecycle: Lifecycle) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/in-flight")
+    async def in_flight():
+        return {"in_flight": lifecycle.in_flight}
+
+    app.add_middleware(DrainingMiddleware, lifecycle=lifecycle)
+    return TestClient(app)
+
+
+def test_counts_request_while_it_runs():
+    lifecycle = Lifecycle()
+    client = _client(lifecycle)
+
+    response = client.get("/in-flight")
+
+    assert response.json() == {"in_flight": 1}
+    assert "connection" not in response.headers
+    assert lifecycle.in_flight == 0
+
+
+def test_requests_are_served_with_connection_close_while_draining():
+    lifecycle = Lifecycle()
+    client = _client(lifecycle)
+    lifecycle.begin_drain()
+
+    response = client.get("/in-flight")
+
+    assert response.status_code == 200
+    assert response.headers["connection"] == "close"
@@ -0,0 +1,72 @@
+from datetime import datetime
+from decimal import Decimal
+
+from starlette.requests import Request
+
+from app.application.dtos.product_dto import ProductResponseDTO
+from app.presentation.http_cache import http_date, is_not_modified, product_etag, product_list_etag
+
+UPDATED_AT = datetime(2025, 1, 7, 10, 30, 0, 123456)
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/products/1",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+def _product(updated_at: datetime = UPDATED_AT) -> ProductResponseDTO:
+    return ProductResponseDTO(
+        id=1,
+        name="Notebook",
+        description="Notebook de alta performance",
+        price=Decimal("3999.99"),
+        quantity=10,
+        created_at=UPDATED_AT,
+        updated_at=updated_at,
+    )
+
+
+class TestEtags:
+    def test_product_etag_is_strong_and_changes_with_updated_at(self):
+        etag = product_etag(_product())
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == product_etag(_product())
+        assert etag != product_etag(_product(datetime(2025, 1, 8)))
+
+    def test_list_etag_depends_on_page_and_rows(self):
+        products = [_product()]
+
+        assert product_list_etag(products, 0, 10) != product_list_etag(products, 10, 10)
+        assert product_list_etag(products, 0, 10) != product_list_etag([], 0, 10)
+
+
+class TestIsNotModified:
+    def test_matching_if_none_match(self):
+        etag = product_etag(_product())
+
+        assert is_not_modified(_request({"If-None-Match": f'"other", {etag}'}), etag)
+        assert is_not_modified(_request({"If-None-Match": f"W/{etag}"}), etag)
+        assert not is_not_modified(_request({"If-None-Match": '"other"'}), etag)
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self):
+        request = _request({"If-None-Match": '"other"', "If-Modified-Since": http_date(UPDATED_AT)})
+
+        assert not is_not_modified(request, product_etag(_product()), UPDATED_AT)
+
+    def test_if_modified_since_uses_second_resolution(self):
+        request = _request({"If-Modified-Since": http_date(UPDATED_AT)})
+
+        assert is_not_modified(request, '"x"', UPDATED_AT)
+        assert not is_not_modified(request, '"x"', datetime(2025, 1, 7, 10, 30, 1))
+
+    def test_invalid_if_modified_since_is_ignored(self):
+        request = _request({"If-Modified-Since": "not a date"})
+
+        assert not is_not_modified(request, '"x"', UPDATED_AT)
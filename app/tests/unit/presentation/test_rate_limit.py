@@ -0,0 +1,85 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import InMemoryRateLimitStore, RateLimiter, RateLimitRule
+from app.presentation.batch import execute_batch
+from app.presentation.rate_limit import RateLimitMiddleware
+from app.presentation.schemas.batch_schema import BatchOperationInput
+
+
+def _client(default: str = "100/minute", rules: dict | None = None) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    @app.get("/ping")
+    async def ping():
+        return "pong"
+
+    @app.post("/batch")
+    async def batch(request_body: list[dict], request: Request):
+        operations = [BatchOperationInput(**op) for op in request_body]
+        return await execute_batch(request.app, request.scope, operations, 4)
+
+    limiter = RateLimiter(
+        InMemoryRateLimitStore(), RateLimitRule.parse("default", default), rules or {}
+    )
+    app.add_middleware(RateLimitMiddleware, limiter=limiter, api_key_header="X-API-Key")
+    return TestClient(app)
+
+
+def test_adds_rate_limit_headers():
+    client = _client("3/minute")
+
+    response = client.get("/items")
+
+    assert response.status_code == 200
+    assert response.headers["ratelimit-limit"] == "3"
+    assert response.headers["ratelimit-remaining"] == "2"
+    assert response.headers["ratelimit-reset"] == "20"
+    assert response.headers["ratelimit-policy"] == "3;w=60"
+
+
+def test_rejects_with_429_and_retry_after_when_bucket_is_empty():
+    client = _client("2/minute")
+
+    client.get("/items")
+    client.get("/items")
+    response = client.get("/items")
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Limite de requisições excedido"}
+    assert response.headers["retry-after"] == "30"
+    assert response.headers["ratelimit-remaining"] == "0"
+
+
+def test_api_keys_have_separate_buckets():
+    client = _client("1/minute")
+
+    first = client.get("/items", headers={"X-API-Key": "a"})
+    second = client.get("/items", headers={"X-API-Key": "b"})
+    again = client.get("/items", headers={"X-API-Key": "a"})
+
+    assert (first.status_code, second.status_code, again.status_code) == (200, 200, 429)
+
+
+def test_health_checks_are_exempt():
+    client = _client("1/minute")
+
+    responses = [client.get("/ping") for _ in range(3)]
+
+    assert all(response.status_code == 200 for response in responses)
+    assert "ratelimit-limit" not in responses[0].headers
+
+
+def test_batch_sub_requests_count_against_the_batch_client():
+    client = _client("2/minute")
+    operations = [{"method": "GET", "path": "/items"} for _ in range(3)]
+
+    response = client.post("/batch", json=operations, headers={"X-API-Key": "a"})
+    after = client.get("/items", headers={"X-API-Key": "a"})
+
+    assert sorted(result["status"] for result in response.json()) == [200, 200, 429]
+    assert after.status_code == 429
@@ -0,0 +1,52 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.domain.enums.order_status import OrderStatus
+from app.presentation.responses import ORJSONResponse
+from app.presentation.schemas.product_schema import ProductOutput
+
+pytest.importorskip("orjson")
+
+
+class TestORJSONResponse:
+    def test_body_matches_default_json_response_for_product_list(self):
+        adapter = TypeAdapter(list[ProductOutput])
+        products = adapter.validate_python(
+            [
+                {
+                    "id": 1,
+                    "name": "Café ☕",
+                    "description": "Descrição",
+                    "price": Decimal("19.90"),
+                    "quantity": 3,
+                    "created_at": datetime(2024, 1, 2, 3, 4, 5, 123456),
+                    "updated_at": datetime(2024, 1, 2, 3, 4, 5),
+                }
+            ]
+        )
+        content = adapter.dump_python(products, mode="json")
+
+        assert ORJSONResponse(content).body == JSONResponse(content).body
+
+    def test_raw_decimal_datetime_and_enum_are_encoded(self):
+        body = ORJSONResponse(
+            {
+                "price": Decimal("10.50"),
+                "at": datetime(2024, 1, 2, 3, 4, 5),
+                "status": OrderStatus.PENDING,
+                1: "int key",
+            }
+        ).body
+
+        assert body == (
+            b'{"price":"10.50","at":"2024-01-02T03:04:05",'
+            b'"status":"' + OrderStatus.PENDING.value.encode() + b'","1":"int key"}'
+        )
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            ORJSONResponse({"value": object()})
@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.application.dtos.order_dto import OrderResponseDTO
+from app.core.exceptions import ValidationException
+from app.domain.entities.order_entity import OrderCompleteEntity
+from app.domain.entities.order_item_entity import OrderItemEntity
+from app.presentation.schemas.product_schema import ProductOutput
+from app.presentation.serializers import (
+    ORDER_FIELDS,
+    PRODUCT_FIELDS,
+    OrderRow,
+    ProductRow,
+    dump_orders_json,
+    dump_products_json,
+    parse_fields,
+)
+
+
+def _order() -> OrderCompleteEntity:
+    return OrderCompleteEntity(
+        id=1,
+        order_date=datetime(2024, 5, 6, 7, 8, 9, 10),
+        status="Pending",
+        total_amount=59.97,
+        items=[OrderItemEntity(id=1, product_id=2, order_id=1, quantity=3, price=19.99)],
+    )
+
+
+class TestSerializers:
+    def test_rows_mirror_response_models(self):
+        assert list(ProductRow.__annotations__) == list(ProductOutput.model_fields)
+        assert list(OrderRow.__annotations__) == list(OrderResponseDTO.model_fields)
+
+    def test_products_json_matches_validated_output(self, product_entity_list):
+        adapter = TypeAdapter(list[ProductOutput])
+        expected = adapter.dump_json(
+            adapter.validate_python(product_entity_list, from_attributes=True)
+        )
+
+        assert dump_products_json(product_entity_list) == expected
+
+    def test_orders_json_matches_validated_output(self):
+        adapter = TypeAdapter(list[OrderResponseDTO])
+        expected = adapter.dump_json(adapter.validate_python([_order()], from_attributes=True))
+
+        assert dump_orders_json([_order()]) == expected
+
+    def test_empty_lists(self):
+        assert dump_products_json([]) == b"[]"
+        assert dump_orders_json([]) == b"[]"
+
+
+class TestSparseFieldsets:
+    def test_parse_fields_returns_canonical_order(self):
+        assert parse_fields(None, PRODUCT_FIELDS) is None
+        assert parse_fields(" price,id ,,name", PRODUCT_FIELDS) == ("id", "name", "price")
+
+    def test_parse_fields_rejects_unknown_names(self):
+        with pytest.raises(ValidationException) as exc:
+            parse_fields("id,secret", PRODUCT_FIELDS)
+
+        assert exc.value.status_code == 400
+        assert "secret" in exc.value.message
+
+    def test_products_json_with_fields(self, product_entity_list):
+        body = dump_products_json(product_entity_list[:1], ("id", "price"))
+
+        assert body == b'[{"id":1,"price":"' + str(product_entity_list[0].price).encode() + b'"}]'
+
+    def test_orders_json_without_items(self):
+        assert dump_orders_json([_order()], ("id", "total_amount"), include_items=False) == (
+            b'[{"id":1,"total_amount":59.97}]'
+        )
+
+    def test_orders_json_all_columns_without_items(self):
+        body = dump_orders_json([_order()], include_items=False)
+
+        assert b'"items"' not in body
+        assert all(f'"{name}"'.encode() in body for name in ORDER_FIELDS)
+
+    def test_orders_json_with_fields_and_items(self):
+        body = dump_orders_json([_order()], ("id",), include_items=True)
+
+        assert body == (
+            b'[{"id":1,"items":[{"id":1,"product_id":2,"order_id":1,"quantity":3,"price":19.99}]}]'
+        )
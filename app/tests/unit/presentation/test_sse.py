@@ -0,0 +1,44 @@
+import pytest
+
+from app.core.broadcast import BroadcastHub
+from app.presentation.sse import event_stream, format_event
+
+
+def test_format_event_includes_id_and_event_name():
+    assert format_event({"id": 1}, event="product", id="abc-1") == (
+        b'id: abc-1\nevent: product\ndata: {"id":1}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_retry_reset_and_events_then_unsubscribes():
+    hub = BroadcastHub()
+    subscription = hub.subscribe(last_event_id="unknown-1")
+    event = hub.publish({"id": 1, "quantity": 3})
+    hub.close()
+
+    chunks = [
+        chunk
+        async for chunk in event_stream(
+            hub, subscription, event_name="product", heartbeat_seconds=1, retry_ms=500
+        )
+    ]
+
+    assert chunks == [
+        b"retry: 500\n\n",
+        b'event: reset\ndata: {"reason":"gap"}\n\n',
+        f'id: {event.id}\nevent: product\ndata: {{"id":1,"quantity":3}}\n\n'.encode(),
+    ]
+    assert hub.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_keep_alive_when_idle():
+    hub = BroadcastHub()
+    stream = event_stream(
+        hub, hub.subscribe(), event_name="product", heartbeat_seconds=0.01, retry_ms=500
+    )
+
+    assert await stream.__anext__() == b"retry: 500\n\n"
+    assert await stream.__anext__() == b": keep-alive\n\n"
+    await stream.aclose()
@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.repositories.product_repository import ProductRepository
+from app.infrastructure.persistence.repositories.batching_product_repository_impl import (
+    BatchingProductRepository,
+)
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock(spec=ProductRepository)
+
+
+class TestBatchingProductRepository:
+    @pytest.mark.asyncio
+    async def test_concurrent_get_by_id_issue_one_bulk_query(
+        self, mock_repository, product_entity_list
+    ):
+        mock_repository.get_bulk_by_ids = AsyncMock(return_value=product_entity_list)
+        repository = BatchingProductRepository(mock_repository, window_seconds=0.005)
+
+        results = await asyncio.gather(*(repository.get_by_id(i) for i in [1, 2, 3, 4]))
+
+        assert [product.id if product else None for product in results] == [1, 2, 3, None]
+        mock_repository.get_bulk_by_ids.assert_called_once_with([1, 2, 3, 4])
+
+    @pytest.mark.asyncio
+    async def test_callers_receive_independent_copies(self, mock_repository, product_entity):
+        mock_repository.get_bulk_by_ids = AsyncMock(return_value=[product_entity])
+        repository = BatchingProductRepository(mock_repository, window_seconds=0.005)
+
+        first, second = await asyncio.gather(repository.get_by_id(1), repository.get_by_id(1))
+        first.name = "Changed"
+
+        assert second.name == "Test Product"
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_by_ids_joins_the_current_window(
+        self, mock_repository, product_entity_list
+    ):
+        mock_repository.get_bulk_by_ids = AsyncMock(return_value=product_entity_list)
+        repository = BatchingProductRepository(mock_repository, window_seconds=0.005)
+
+        single, bulk = await asyncio.gather(
+            repository.get_by_id(1), repository.get_bulk_by_ids([2, 3, 2])
+        )
+
+        assert single.id == 1
+        assert [product.id for product in bulk] == [2, 3]
+        mock_repository.get_bulk_by_ids.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_pass_through(self, mock_repository, product_entity):
+        mock_repository.update = AsyncMock(return_value=product_entity)
+        repository = BatchingProductRepository(mock_repository)
+
+        assert await repository.update(product_entity) is product_entity
+        mock_repository.update.assert_called_once_with(product_entity)
@@ -0,0 +1,311 @@
+import copy
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.cache.backends import InMemoryCacheBackend
+from app.core.cache.bloom_filter import KnownIdFilter
+from app.core.cache.lru_ttl_cache import LRUTTLCache
+from app.core.events import ProductChangedEvent
+from app.domain.repositories.product_repository import ProductRepository
+from app.infrastructure.persistence.repositories.cached_product_repository_impl import (
+    CachedProductRepository,
+)
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock(spec=ProductRepository)
+
+
+@pytest.fixture
+def repository(mock_repository):
+    return CachedProductRepository(mock_repository, LRUTTLCache(max_size=10, ttl_seconds=60))
+
+
+@pytest.fixture
+def shared_cache():
+    return InMemoryCacheBackend()
+
+
+def _worker(mock_repository, shared_cache):
+    return CachedProductRepository(
+        mock_repository,
+        LRUTTLCache(max_size=10, ttl_seconds=60),
+        shared_cache=shared_cache,
+        shared_ttl_seconds=60,
+    )
+
+
+class TestCachedProductRepositoryGetById:
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_served_from_cache(
+        self, repository, mock_repository, product_entity
+    ):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+
+        first = await repository.get_by_id(1)
+        second = await repository.get_by_id(1)
+
+        assert first.id == second.id == 1
+        mock_repository.get_by_id.assert_called_once_with(1)
+        assert repository.cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_entity_is_not_affected_by_caller_mutation(
+        self, repository, mock_repository, product_entity
+    ):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+
+        product = await repository.get_by_id(1)
+        product.name = "Changed"
+
+        assert (await repository.get_by_id(1)).name == "Test Product"
+
+    @pytest.mark.asyncio
+    async def test_missing_product_is_not_cached(self, repository, mock_repository):
+        mock_repository.get_by_id = AsyncMock(return_value=None)
+
+        assert await repository.get_by_id(99) is None
+        assert await repository.get_by_id(99) is None
+        assert mock_repository.get_by_id.call_count == 2
+
+
+class TestCachedProductRepositoryWrites:
+    @pytest.mark.asyncio
+    async def test_update_invalidates_entry(self, repository, mock_repository, product_entity):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+        mock_repository.update = AsyncMock(return_value=product_entity)
+
+        await repository.get_by_id(1)
+        await repository.update(product_entity)
+        await repository.get_by_id(1)
+
+        assert mock_repository.get_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_entry_even_on_failure(
+        self, repository, mock_repository, product_entity
+    ):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+        mock_repository.delete_by_id = AsyncMock(side_effect=Exception("DB Error"))
+
+        await repository.get_by_id(1)
+        with pytest.raises(Exception):
+            await repository.delete_by_id(1)
+
+        assert 1 not in repository.cache
+
+
+class TestCachedProductRepositoryGetBulkByIds:
+    @pytest.mark.asyncio
+    async def test_only_misses_are_fetched_and_order_is_preserved(
+        self, repository, mock_repository, product_entity_list
+    ):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity_list[1])
+        mock_repository.get_bulk_by_ids = AsyncMock(
+            return_value=[product_entity_list[2], product_entity_list[0]]
+        )
+
+        await repository.get_by_id(2)
+        result = await repository.get_bulk_by_ids([1, 2, 3, 2])
+
+        assert [product.id for product in result] == [1, 2, 3]
+        mock_repository.get_bulk_by_ids.assert_called_once_with([1, 3])
+
+    @pytest.mark.asyncio
+    async def test_full_cache_hit_skips_repository(
+        self, repository, mock_repository, product_entity_list
+    ):
+        mock_repository.get_bulk_by_ids = AsyncMock(return_value=product_entity_list)
+
+        await repository.get_bulk_by_ids([1, 2, 3])
+        result = await repository.get_bulk_by_ids([3, 1])
+
+        assert [product.id for product in result] == [3, 1]
+        mock_repository.get_bulk_by_ids.assert_called_once()
+
+
+class TestCachedProductRepositorySharedTier:
+    @pytest.mark.asyncio
+    async def test_near_cache_miss_is_served_from_shared_cache(
+        self, mock_repository, shared_cache, product_entity
+    ):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+        first_worker = _worker(mock_repository, shared_cache)
+        second_worker = _worker(mock_repository, shared_cache)
+
+        await first_worker.get_by_id(1)
+        product = await second_worker.get_by_id(1)
+
+        assert product.name == product_entity.name
+        assert product.price == product_entity.price
+        assert product.updated_at == product_entity.updated_at
+        mock_repository.get_by_id.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_checks_shared_cache_before_repository(
+        self, mock_repository, shared_cache, product_entity_list
+    ):
+        mock_repository.get_bulk_by_ids = AsyncMock(
+            side_effect=[[product_entity_list[0]], [product_entity_list[1]]]
+        )
+        await _worker(mock_repository, shared_cache).get_bulk_by_ids([1])
+
+        result = await _worker(mock_repository, shared_cache).get_bulk_by_ids([2, 1])
+
+        assert [product.id for product in result] == [2, 1]
+        assert mock_repository.get_bulk_by_ids.call_args.args == ([2],)
+
+    @pytest.mark.asyncio
+    async def test_update_evicts_shared_entry(self, mock_repository, shared_cache, product_entity):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+        mock_repository.update = AsyncMock(return_value=product_entity)
+        repository = _worker(mock_repository, shared_cache)
+
+        await repository.get_by_id(1)
+        await repository.update(product_entity)
+        await _worker(mock_repository, shared_cache).get_by_id(1)
+
+        assert mock_repository.get_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_started_before_a_write_does_not_refill_shared_cache(
+        self, mock_repository, shared_cache, product_entity
+    ):
+        stale = copy.copy(product_entity)
+        fresh = copy.copy(product_entity)
+        fresh.name = "Atualizado"
+        reader = _worker(mock_repository, shared_cache)
+        writer = _worker(mock_repository, shared_cache)
+        mock_repository.update = AsyncMock(return_value=fresh)
+
+        async def read_then_concurrent_update(product_id):
+            # O outro worker grava e invalida entre a leitura no banco e o preenchimento
+            await writer.update(fresh)
+            return stale
+
+        mock_repository.get_by_id = AsyncMock(side_effect=read_then_concurrent_update)
+        await reader.get_by_id(1)
+        mock_repository.get_by_id = AsyncMock(return_value=fresh)
+
+        product = await _worker(mock_repository, shared_cache).get_by_id(1)
+
+        assert product.name == "Atualizado"
+
+    @pytest.mark.asyncio
+    async def test_remote_change_evicts_near_cache_entry(
+        self, repository, mock_repository, product_entity
+    ):
+        mock_repository.get_by_id = AsyncMock(return_value=product_entity)
+        await repository.get_by_id(1)
+
+        repository.on_product_changed(ProductChangedEvent(1, "updated"))
+        assert 1 in repository.cache
+
+        repository.on_product_changed(ProductChangedEvent(1, "updated", origin="other-worker"))
+        assert 1 not in repository.cache
+
+
+@pytest.fixture
+def guarded_repository(mock_repository):
+    return CachedProductRepository(
+        mock_repository,
+        LRUTTLCache(max_size=10, ttl_seconds=60),
+        negative_cache=LRUTTLCache(max_size=10, ttl_seconds=5),
+        id_filter=KnownIdFilter(capacity=100),
+    )
+
+
+class TestCachedProductRepositoryUnknownIds:
+    @pytest.mark.asyncio
+    async def test_missing_product_is_negatively_cached(self, guarded_repository, mock_repository):
+        mock_repository.get_by_id = AsyncMock(return_value=None)
+
+        assert await guarded_repository.get_by_id(99) is None
+        assert await guarded_repository.get_by_id(99) is None
+
+        mock_repository.get_by_id.assert_called_once_with(99)
+
+    @pytest.mark.asyncio
+    async def test_create_clears_negative_entry(
+        self, guarded_repository, mock_repository, product_entity
+    ):
+        mock_repository.get_by_id = AsyncMock(side_effect=[None, product_entity])
+        mock_repository.create = AsyncMock(return_value=product_entity)
+
+        assert await guarded_repository.get_by_id(1) is None
+        await guarded_repository.create(product_entity)
+
+        assert (await guarded_repository.get_by_id(1)).id == 1
+
+    @pytest.mark.asyncio
+    async def test_id_filter_rejects_unknown_ids_without_query(
+        self, guarded_repository, mock_repository, product_entity_list
+    ):
+        mock_repository.get_all_ids = AsyncMock(return_value=[1, 3])
+        mock_repository.get_by_id = AsyncMock(return_value=None)
+        mock_repository.get_bulk_by_ids = AsyncMock(return_value=[product_entity_list[0]])
+        await guarded_repository.load_id_filter()
+
+        assert await guarded_repository.get_by_id(2) is None
+        result = await guarded_repository.get_bulk_by_ids([1, 2])
+
+        assert [product.id for product in result] == [1]
+        mock_repository.get_by_id.assert_not_called()
+        mock_repository.get_bulk_by_ids.assert_called_once_with([1])
+
+    @pytest.mark.asyncio
+    async def test_failed_filter_load_rejects_nothing(self, guarded_repository, mock_repository):
+        mock_repository.get_all_ids = AsyncMock(side_effect=Exception("DB Error"))
+        mock_repository.get_by_id = AsyncMock(return_value=None)
+
+        await guarded_repository.load_id_filter()
+        await guarded_repository.get_by_id(2)
+
+        assert not guarded_repository.id_filter.ready
+        mock_repository.get_by_id.assert_called_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_remote_create_is_added_to_id_filter(self, guarded_repository, mock_repository):
+        mock_repository.get_all_ids = AsyncMock(return_value=[5])
+        await guarded_repository.load_id_filter()
+
+        guarded_repository.on_product_changed(
+            ProductChangedEvent(3, "created", origin="other-worker")
+        )
+
+        assert guarded_repository.id_filter.might_exist(3)
+
+    @pytest.mark.asyncio
+    async def test_id_created_elsewhere_below_a_local_create_reaches_the_database(
+        self, guarded_repository, mock_repository, product_entity
+    ):
+        mock_repository.get_all_ids = AsyncMock(return_value=[1, 2, 3, 4, 5])
+        await guarded_repository.load_id_filter()
+        created, remote = copy.copy(product_entity), copy.copy(product_entity)
+        created.id, remote.id = 7, 6
+        mock_repository.create = AsyncMock(return_value=created)
+        await guarded_repository.create(product_entity)
+        mock_repository.get_by_id = AsyncMock(return_value=remote)
+
+        # O 6 foi criado por outro worker e a notificação não chegou
+        product = await guarded_repository.get_by_id(6)
+
+        assert product.id == 6
+        mock_repository.get_by_id.assert_called_once_with(6)
+
+    @pytest.mark.asyncio
+    async def test_deleting_the_highest_id_lets_reassigned_ids_reach_the_database(
+        self, guarded_repository, mock_repository
+    ):
+        mock_repository.get_all_ids = AsyncMock(return_value=[1, 5])
+        mock_repository.get_by_id = AsyncMock(return_value=None)
+        await guarded_repository.load_id_filter()
+
+        guarded_repository.on_product_changed(
+            ProductChangedEvent(5, "deleted", origin="other-worker")
+        )
+        await guarded_repository.get_by_id(2)
+
+        mock_repository.get_by_id.assert_called_once_with(2)
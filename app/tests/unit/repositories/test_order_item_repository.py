@@ -258,3 +258,34 @@ class TestOrderItemRepositoryCreateBulk:
             assert result[0].id == 3
             assert result[1].id == 1
             assert result[2].id == 2
+
+
+class TestOrderItemRepositoryGetTopProductIds:
+    @pytest.mark.asyncio
+    async def test_get_top_product_ids_returns_ids_in_order(self):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars().all.return_value = [7, 3, 9]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_item_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            result = await SQLOrderItemRepository().get_top_product_ids(3)
+
+        assert result == [7, 3, 9]
+
+    @pytest.mark.asyncio
+    async def test_get_top_product_ids_handles_sqlalchemy_error(self):
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error", None, None))
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_item_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            with pytest.raises(ApplicationException) as exc:
+                await SQLOrderItemRepository().get_top_product_ids(3)
+
+        assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -0,0 +1,122 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import status
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.exceptions import ApplicationException
+from app.domain.entities.order_job_entity import OrderJobEntity
+from app.domain.enums.order_job_status import OrderJobStatus
+from app.domain.enums.order_status import OrderStatus
+from app.infrastructure.persistence.repositories.order_job_repository_impl import (
+    SQLOrderJobRepository,
+)
+
+SESSION_PATH = "app.infrastructure.persistence.repositories.order_job_repository_impl.async_session"
+
+
+@pytest.fixture
+def order_job_entity():
+    return OrderJobEntity(
+        id=1,
+        order_id=1,
+        target_status=OrderStatus.PROCESSING.value,
+        status=OrderJobStatus.PROCESSING.value,
+        attempts=1,
+    )
+
+
+class TestOrderJobRepositoryClaimBatch:
+    @pytest.mark.asyncio
+    async def test_claim_batch_returns_jobs_sorted_by_id(self, order_job_entity):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars().all.return_value = [MagicMock(), MagicMock()]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+        second_job = OrderJobEntity(id=2, order_id=2, target_status=OrderStatus.PROCESSING.value)
+
+        with patch(
+            SESSION_PATH,
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderJobRepository()
+            repository.converter = MagicMock()
+            repository.converter.orm_to_entity.side_effect = [second_job, order_job_entity]
+
+            result = await repository.claim_batch(limit=10, lease_seconds=30)
+
+            assert [job.id for job in result] == [1, 2]
+            mock_session.execute.assert_called_once()
+            mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_handles_sqlalchemy_error(self):
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error", None, None))
+
+        with patch(
+            SESSION_PATH,
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderJobRepository()
+
+            with pytest.raises(ApplicationException) as exc:
+                await repository.claim_batch(limit=10, lease_seconds=30)
+
+            assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+            assert "Erro BD ao reivindicar jobs" in exc.value.message
+
+
+class TestOrderJobRepositoryComplete:
+    @pytest.mark.asyncio
+    async def test_complete_enqueues_next_job_in_same_transaction(self):
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+        next_job = OrderJobEntity(order_id=1, target_status=OrderStatus.SHIPPED.value)
+
+        with patch(
+            SESSION_PATH,
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderJobRepository()
+
+            await repository.complete(1, next_job)
+
+            mock_session.execute.assert_called_once()
+            mock_session.add.assert_called_once()
+            mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_complete_without_next_job(self):
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+
+        with patch(
+            SESSION_PATH,
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderJobRepository()
+
+            await repository.complete(1)
+
+            mock_session.add.assert_not_called()
+            mock_session.commit.assert_called_once()
+
+
+class TestOrderJobRepositoryCountByStatus:
+    @pytest.mark.asyncio
+    async def test_count_by_status_returns_mapping(self):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("Queued", 3), ("Done", 7)]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            SESSION_PATH,
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderJobRepository()
+
+            result = await repository.count_by_status()
+
+            assert result == {"Queued": 3, "Done": 7}
@@ -219,6 +219,52 @@ class TestOrderRepositoryGetAll:
             assert len(result) == 3
             assert result == order_entity_list
 
+    @pytest.mark.asyncio
+    async def test_get_all_projection_without_items_skips_items_query(self):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.mappings().all.return_value = [{"id": 1, "total_amount": Decimal("9.90")}]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            result = await repository.get_all(fields=("total_amount",), include_items=False)
+
+            mock_session.execute.assert_awaited_once()
+            stmt = mock_session.execute.await_args.args[0]
+            assert [column.name for column in stmt.selected_columns] == ["id", "total_amount"]
+            assert result[0].id == 1
+            assert result[0].total_amount == Decimal("9.90")
+            assert result[0].status is None
+            assert result[0].items == []
+
+    @pytest.mark.asyncio
+    async def test_get_all_projection_with_items_queries_items_by_order_id(self):
+        mock_session = AsyncMock()
+        orders_result = MagicMock()
+        orders_result.mappings().all.return_value = [{"id": 1}, {"id": 2}]
+        items_result = MagicMock()
+        items_result.scalars().all.return_value = [
+            MagicMock(id=10, product_id=5, order_id=2, quantity=1, price=Decimal("3.00"))
+        ]
+        mock_session.execute = AsyncMock(side_effect=[orders_result, items_result])
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            result = await repository.get_all(fields=("id",), include_items=True)
+
+            assert mock_session.execute.await_count == 2
+            assert result[0].items == []
+            assert [item.id for item in result[1].items] == [10]
+
     @pytest.mark.asyncio
     async def test_get_all_returns_empty_list(self, mock_converter):
         mock_session = AsyncMock()
@@ -327,3 +373,113 @@ class TestOrderRepositoryDeleteById:
 
             assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
             assert "Erro interno ao deletar pedido" in exc.value.message
+
+
+class TestOrderRepositoryBulkUpdateStatus:
+    @pytest.mark.asyncio
+    async def test_bulk_update_status_runs_one_update_per_group_in_one_transaction(self):
+        mock_session = AsyncMock()
+        first_result = MagicMock()
+        first_result.scalars().all.return_value = [1, 2]
+        second_result = MagicMock()
+        second_result.scalars().all.return_value = [3]
+        mock_session.execute = AsyncMock(side_effect=[first_result, second_result])
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            moved = await repository.bulk_update_status(
+                {("Pending", "Processing"): [1, 2], ("Processing", "Shipped"): [3]}
+            )
+
+            assert moved == {1, 2, 3}
+            assert mock_session.execute.call_count == 2
+            mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_status_handles_sqlalchemy_error(self):
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error", None, None))
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            with pytest.raises(ApplicationException) as exc:
+                await repository.bulk_update_status({("Pending", "Processing"): [1]})
+
+            assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+            mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_statuses_returns_mapping(self):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(1, "Pending"), (2, "Shipped")]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            result = await repository.get_statuses([1, 2, 3])
+
+            assert result == {1: "Pending", 2: "Shipped"}
+
+
+class TestOrderRepositoryCreateBulk:
+    @pytest.mark.asyncio
+    async def test_create_bulk_assigns_generated_ids_in_one_transaction(self):
+        orders = [
+            OrderCompleteEntity(
+                order_date=datetime.now(),
+                status=OrderStatus.PENDING.value,
+                total_amount=Decimal("10.00"),
+                items=[OrderItemEntity(product_id=1, quantity=1, price=Decimal("10.00"))],
+            )
+            for _ in range(2)
+        ]
+        mock_session = AsyncMock()
+        orders_result = MagicMock()
+        orders_result.scalars().all.return_value = [8, 7]
+        items_result = MagicMock()
+        items_result.scalars().all.return_value = [20, 21]
+        mock_session.execute = AsyncMock(side_effect=[orders_result, items_result])
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            result = await repository.create_bulk(orders)
+
+            assert [order.id for order in result] == [7, 8]
+            assert [order.items[0].order_id for order in result] == [7, 8]
+            assert [order.items[0].id for order in result] == [20, 21]
+            assert mock_session.execute.call_count == 2
+            mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_bulk_handles_sqlalchemy_error(self, order_complete_entity):
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error", None, None))
+
+        with patch(
+            "app.infrastructure.persistence.repositories.order_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLOrderRepository()
+
+            with pytest.raises(ApplicationException) as exc:
+                await repository.create_bulk([order_complete_entity])
+
+            assert exc.value.message == "Erro BD ao criar pedidos em lote"
+            mock_session.commit.assert_not_called()
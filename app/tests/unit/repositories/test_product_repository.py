@@ -1,3 +1,4 @@
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -32,6 +33,32 @@ class TestProductRepositoryGetAll:
             assert len(result) == 3
             assert result == product_entity_list
 
+    @pytest.mark.asyncio
+    async def test_get_all_with_fields_selects_only_requested_columns(self):
+        now = datetime.utcnow()
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.mappings().all.return_value = [{"id": 1, "updated_at": now, "name": "Produto"}]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            "app.infrastructure.persistence.repositories.product_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            repository = SQLProductRepository()
+
+            result = await repository.get_all(skip=0, limit=10, fields=("name",))
+
+            stmt = mock_session.execute.await_args.args[0]
+            assert [column.name for column in stmt.selected_columns] == [
+                "id",
+                "updated_at",
+                "name",
+            ]
+            assert result[0].name == "Produto"
+            assert result[0].updated_at == now
+            assert result[0].description is None
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "skip,limit",
@@ -144,3 +171,77 @@ class TestProductRepositoryGetAll:
 
             # Assert
             assert len(result) == 3
+
+
+class TestProductRepositoryGetAllIds:
+    @pytest.mark.asyncio
+    async def test_get_all_ids_returns_ids(self):
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars().all.return_value = [1, 2, 5]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch(
+            "app.infrastructure.persistence.repositories.product_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            result = await SQLProductRepository().get_all_ids()
+
+        assert result == [1, 2, 5]
+
+    @pytest.mark.asyncio
+    async def test_get_all_ids_handles_sqlalchemy_error(self):
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error", None, None))
+
+        with patch(
+            "app.infrastructure.persistence.repositories.product_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            with pytest.raises(ApplicationException) as exc:
+                await SQLProductRepository().get_all_ids()
+
+        assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+class TestProductRepositoryReserveStock:
+    @pytest.mark.asyncio
+    async def test_reserve_stock_returns_only_products_with_enough_stock(self):
+        mock_session = AsyncMock()
+        reserved_result = MagicMock()
+        reserved_result.mappings().one_or_none.return_value = {
+            "id": 1,
+            "name": "Produto",
+            "description": "Descrição",
+            "price": 10,
+            "quantity": 3,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+        short_result = MagicMock()
+        short_result.mappings().one_or_none.return_value = None
+        mock_session.execute = AsyncMock(side_effect=[reserved_result, short_result])
+
+        with patch(
+            "app.infrastructure.persistence.repositories.product_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            result = await SQLProductRepository().reserve_stock({1: 2, 2: 50})
+
+        assert result == {1}
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reserve_stock_handles_sqlalchemy_error(self):
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB Error", None, None))
+
+        with patch(
+            "app.infrastructure.persistence.repositories.product_repository_impl.async_session",
+            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_session)),
+        ):
+            with pytest.raises(ApplicationException) as exc:
+                await SQLProductRepository().reserve_stock({1: 2})
+
+        assert exc.value.message == "Erro BD ao reservar estoque"
+        mock_session.commit.assert_not_called()
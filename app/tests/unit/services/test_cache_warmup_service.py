@@ -0,0 +1,144 @@
+import asyncio
+import gc
+import warnings
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.services.cache_warmup_service import CacheWarmupService
+from app.core.cache.access_tracker import AccessTracker
+from app.domain.repositories.order_item_repository import OrderItemRepository
+from app.domain.repositories.product_repository import ProductRepository
+
+
+@pytest.fixture
+def mock_product_repository():
+    """Fixture para ProductRepository mockado."""
+    return MagicMock(spec=ProductRepository)
+
+
+@pytest.fixture
+def mock_order_item_repository():
+    """Fixture para OrderItemRepository mockado."""
+    return MagicMock(spec=OrderItemRepository)
+
+
+@pytest.fixture
+def access_tracker():
+    return AccessTracker()
+
+
+@pytest.fixture
+def warmup_service(mock_product_repository, mock_order_item_repository, access_tracker):
+    """Fixture para CacheWarmupService com repositórios mockados."""
+    return CacheWarmupService(
+        product_repository=mock_product_repository,
+        order_item_repository=mock_order_item_repository,
+        access_tracker=access_tracker,
+        product_limit=3,
+        batch_size=2,
+        timeout_seconds=1.0,
+    )
+
+
+class TestCacheWarmupService:
+    """Testes para CacheWarmupService."""
+
+    @pytest.mark.asyncio
+    async def test_hot_products_merge_recent_access_and_top_sellers(
+        self, warmup_service, mock_order_item_repository, access_tracker
+    ):
+        """Testa que os mais acessados vêm antes dos mais vendidos, sem repetição."""
+        access_tracker.record(5)
+        mock_order_item_repository.get_top_product_ids = AsyncMock(return_value=[1, 5, 2, 3])
+
+        assert await warmup_service.hot_product_ids() == [5, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_run_preloads_products_in_batches_and_pages(
+        self, warmup_service, mock_product_repository, mock_order_item_repository, product_entity
+    ):
+        """Testa que o warm-up carrega produtos em lotes e as páginas informadas."""
+        mock_order_item_repository.get_top_product_ids = AsyncMock(return_value=[1, 2, 3])
+        mock_product_repository.get_bulk_by_ids = AsyncMock(return_value=[product_entity])
+        page_loader = AsyncMock()
+        assert not warmup_service.is_ready()
+
+        result = await warmup_service.run([page_loader])
+
+        assert result.status == "done"
+        assert result.ready
+        assert result.products_warmed == 2
+        assert result.pages_warmed == 1
+        assert mock_product_repository.get_bulk_by_ids.call_count == 2
+        page_loader.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_is_time_bounded(
+        self, warmup_service, mock_product_repository, mock_order_item_repository
+    ):
+        """Testa que o warm-up é interrompido no timeout e a instância fica pronta."""
+        warmup_service.timeout_seconds = 0.05
+        mock_order_item_repository.get_top_product_ids = AsyncMock(return_value=[])
+
+        async def slow_page():
+            await asyncio.sleep(1)
+
+        result = await warmup_service.run([slow_page])
+
+        assert result.status == "timeout"
+        assert result.ready
+
+    @pytest.mark.asyncio
+    async def test_timeout_leaves_no_unawaited_steps(
+        self, warmup_service, mock_product_repository, mock_order_item_repository
+    ):
+        """Testa que etapas que não começaram não viram coroutines nunca aguardadas."""
+        warmup_service.timeout_seconds = 0.05
+        warmup_service.concurrency = 1
+        mock_order_item_repository.get_top_product_ids = AsyncMock(return_value=[])
+
+        async def slow_page():
+            await asyncio.sleep(1)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = await warmup_service.run([slow_page] * 5)
+            # Deixa as tasks canceladas terminarem antes de coletar as coroutines soltas
+            await asyncio.sleep(0.01)
+            gc.collect()
+
+        assert result.status == "timeout"
+        assert not [w for w in caught if "never awaited" in str(w.message)]
+
+    @pytest.mark.asyncio
+    async def test_failed_step_does_not_abort_warmup(
+        self, warmup_service, mock_product_repository, mock_order_item_repository
+    ):
+        """Testa que falhas de uma etapa não impedem as demais."""
+        mock_order_item_repository.get_top_product_ids = AsyncMock(side_effect=Exception("DB"))
+        failing_page = AsyncMock(side_effect=Exception("DB"))
+        page_loader = AsyncMock()
+
+        result = await warmup_service.run([failing_page, page_loader])
+
+        assert result.status == "done"
+        assert result.pages_warmed == 1
+
+    def test_snapshot_is_saved_and_loaded(
+        self, mock_product_repository, mock_order_item_repository, tmp_path
+    ):
+        """Testa que as frequências de acesso sobrevivem a um reinício."""
+        path = str(tmp_path / "access.json")
+        tracker = AccessTracker()
+        tracker.record(42)
+        CacheWarmupService(
+            mock_product_repository, mock_order_item_repository, tracker, snapshot_path=path
+        ).save_snapshot()
+
+        restored = AccessTracker()
+        CacheWarmupService(
+            mock_product_repository, mock_order_item_repository, restored, snapshot_path=path
+        ).load_snapshot()
+
+        assert restored.top(1) == [42]
@@ -0,0 +1,224 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.services.order_queue_service import OrderQueueService
+from app.domain.entities.order_job_entity import OrderJobEntity
+from app.domain.enums.order_job_status import OrderJobStatus
+from app.domain.enums.order_status import OrderStatus
+from app.domain.repositories.order_job_repository import OrderJobRepository
+from app.domain.repositories.order_repository import OrderRepository
+
+
+@pytest.fixture
+def mock_order_job_repository():
+    """Fixture para OrderJobRepository mockado."""
+    return MagicMock(spec=OrderJobRepository)
+
+
+@pytest.fixture
+def mock_order_repository():
+    """Fixture para OrderRepository mockado."""
+    return MagicMock(spec=OrderRepository)
+
+
+@pytest.fixture
+def order_queue_service(mock_order_job_repository, mock_order_repository):
+    """Fixture para OrderQueueService com repositórios mockados."""
+    return OrderQueueService(
+        order_job_repository=mock_order_job_repository,
+        order_repository=mock_order_repository,
+        workers=1,
+        batch_size=10,
+        poll_interval_seconds=0.01,
+        max_attempts=3,
+        retry_backoff_seconds=1.0,
+    )
+
+
+def _job(target_status: OrderStatus, attempts: int = 1) -> OrderJobEntity:
+    return OrderJobEntity(
+        id=1,
+        order_id=10,
+        target_status=target_status.value,
+        status=OrderJobStatus.PROCESSING.value,
+        attempts=attempts,
+    )
+
+
+class TestOrderQueueService:
+    """Testes para OrderQueueService."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_order_targets_processing(
+        self, order_queue_service, mock_order_job_repository
+    ):
+        """Testa que enqueue_order enfileira a transição PENDING -> PROCESSING."""
+        mock_order_job_repository.enqueue = AsyncMock(side_effect=lambda job: job)
+
+        job = await order_queue_service.enqueue_order(10)
+
+        assert job.order_id == 10
+        assert job.target_status == OrderStatus.PROCESSING.value
+
+    @pytest.mark.asyncio
+    async def test_run_once_applies_transition_and_enqueues_next_step(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que o job é concluído junto com o enfileiramento da próxima etapa."""
+        mock_order_job_repository.claim_batch = AsyncMock(
+            return_value=[_job(OrderStatus.PROCESSING)]
+        )
+        mock_order_job_repository.complete = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(return_value={10})
+
+        claimed = await order_queue_service.run_once()
+
+        assert claimed == 1
+        mock_order_repository.bulk_update_status.assert_called_once_with(
+            {(OrderStatus.PENDING.value, OrderStatus.PROCESSING.value): [10]}
+        )
+        job_id, next_job = mock_order_job_repository.complete.call_args.args
+        assert job_id == 1
+        assert next_job.target_status == OrderStatus.SHIPPED.value
+
+    @pytest.mark.asyncio
+    async def test_last_step_completes_without_next_job(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que a última etapa (SHIPPED) não gera novo job."""
+        mock_order_job_repository.claim_batch = AsyncMock(return_value=[_job(OrderStatus.SHIPPED)])
+        mock_order_job_repository.complete = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(return_value={10})
+
+        await order_queue_service.run_once()
+
+        mock_order_job_repository.complete.assert_called_once_with(1, None)
+
+    @pytest.mark.asyncio
+    async def test_already_applied_transition_is_idempotent(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que um job reexecutado após lease expirado não falha."""
+        mock_order_job_repository.claim_batch = AsyncMock(return_value=[_job(OrderStatus.SHIPPED)])
+        mock_order_job_repository.complete = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(return_value=set())
+        mock_order_repository.get_statuses = AsyncMock(return_value={10: OrderStatus.SHIPPED.value})
+
+        await order_queue_service.run_once()
+
+        mock_order_job_repository.complete.assert_called_once_with(1, None)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_order_completes_job_without_next_step(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que pedido cancelado durante o fulfilment encerra o job sem dead-letter."""
+        mock_order_job_repository.claim_batch = AsyncMock(
+            return_value=[_job(OrderStatus.PROCESSING)]
+        )
+        mock_order_job_repository.complete = AsyncMock()
+        mock_order_job_repository.dead_letter = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(return_value=set())
+        mock_order_repository.get_statuses = AsyncMock(
+            return_value={10: OrderStatus.CANCELLED.value}
+        )
+
+        await order_queue_service.run_once()
+
+        mock_order_job_repository.complete.assert_called_once_with(1, None)
+        mock_order_job_repository.dead_letter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_order_goes_to_dead_letter(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que pedido inexistente vai direto para dead-letter."""
+        mock_order_job_repository.claim_batch = AsyncMock(
+            return_value=[_job(OrderStatus.PROCESSING)]
+        )
+        mock_order_job_repository.dead_letter = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(return_value=set())
+        mock_order_repository.get_statuses = AsyncMock(return_value={})
+
+        await order_queue_service.run_once()
+
+        mock_order_job_repository.dead_letter.assert_called_once()
+        mock_order_job_repository.count_by_status = AsyncMock(return_value={"Dead": 1})
+        stats = await order_queue_service.get_stats()
+        assert stats.dead == 1
+        assert stats.dead_lettered == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_retry_with_backoff(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que falhas transitórias reagendam o job com backoff exponencial."""
+        mock_order_job_repository.claim_batch = AsyncMock(
+            return_value=[_job(OrderStatus.PROCESSING, attempts=2)]
+        )
+        mock_order_job_repository.schedule_retry = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(
+            side_effect=Exception("database locked")
+        )
+
+        before = datetime.utcnow()
+        await order_queue_service.run_once()
+
+        job_id, error, available_at = mock_order_job_repository.schedule_retry.call_args.args
+        assert job_id == 1
+        assert error == "database locked"
+        assert (available_at - before).total_seconds() >= 2.0
+
+    @pytest.mark.asyncio
+    async def test_failure_after_max_attempts_goes_to_dead_letter(
+        self, order_queue_service, mock_order_job_repository, mock_order_repository
+    ):
+        """Testa que o job vai para dead-letter ao esgotar as tentativas."""
+        mock_order_job_repository.claim_batch = AsyncMock(
+            return_value=[_job(OrderStatus.PROCESSING, attempts=3)]
+        )
+        mock_order_job_repository.dead_letter = AsyncMock()
+        mock_order_job_repository.schedule_retry = AsyncMock()
+        mock_order_repository.bulk_update_status = AsyncMock(
+            side_effect=Exception("database locked")
+        )
+
+        await order_queue_service.run_once()
+
+        mock_order_job_repository.dead_letter.assert_called_once_with(1, "database locked")
+        mock_order_job_repository.schedule_retry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_worker_pool(self, order_queue_service, mock_order_job_repository):
+        """Testa que o pool de workers inicia e finaliza corretamente."""
+        mock_order_job_repository.claim_batch = AsyncMock(return_value=[])
+
+        await order_queue_service.start()
+        assert order_queue_service.is_running()
+        await asyncio.sleep(0.05)
+
+        await order_queue_service.stop()
+        assert not order_queue_service.is_running()
+        mock_order_job_repository.claim_batch.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_workers_after_timeout(
+        self, order_queue_service, mock_order_job_repository
+    ):
+        """Testa que o desligamento não espera além do prazo por um lote travado."""
+        claimed = asyncio.Event()
+
+        async def stuck_claim(*args, **kwargs):
+            claimed.set()
+            await asyncio.sleep(60)
+
+        mock_order_job_repository.claim_batch = AsyncMock(side_effect=stuck_claim)
+        await order_queue_service.start()
+        await claimed.wait()
+
+        await asyncio.wait_for(order_queue_service.stop(timeout=0.05), 1)
+
+        assert not order_queue_service.is_running()
@@ -5,9 +5,15 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi import status
 
+from app.application.dtos.order_bulk_dto import OrderBulkInputDTO
 from app.application.dtos.order_dto import OrderInputDTO, OrderResponseDTO
 from app.application.dtos.order_item_dto import OrderItemInputDTO
+from app.application.dtos.order_status_dto import (
+    OrderStatusBatchInputDTO,
+    OrderStatusTransitionInputDTO,
+)
 from app.application.services.order_service import OrderService
+from app.core.exceptions import ApplicationException
 from app.domain.entities.order_entity import OrderCompleteEntity, OrderEntity
 from app.domain.entities.order_item_entity import OrderItemEntity
 from app.domain.entities.product_entity import ProductEntity
@@ -167,6 +173,47 @@ class TestOrderService:
         mock_order_item_repository.create_bulk.assert_called_once()
         mock_product_repository.get_bulk_by_ids.assert_called_once_with([1])
 
+    @pytest.mark.asyncio
+    async def test_create_order_returns_persisted_order_when_enqueue_fails(
+        self,
+        mock_order_repository: OrderRepository,
+        mock_order_item_repository: OrderItemRepository,
+        mock_product_repository,
+    ):
+        """Testa que falha ao enfileirar não transforma um pedido gravado em erro."""
+        queue = MagicMock()
+        queue.enqueue_order = AsyncMock(side_effect=Exception("fila indisponível"))
+        order_service = OrderService(
+            order_repository=mock_order_repository,
+            order_item_repository=mock_order_item_repository,
+            product_repository=mock_product_repository,
+            order_queue_service=queue,
+        )
+        product = ProductEntity(
+            id=1, name="Product 1", description="", price=Decimal("50.00"), quantity=10
+        )
+        mock_product_repository.get_bulk_by_ids = AsyncMock(return_value=[product])
+        mock_order_repository.create = AsyncMock(
+            return_value=OrderEntity(
+                id=7,
+                order_date=datetime.now(),
+                status=OrderStatus.PENDING.value,
+                total_amount=Decimal("50.00"),
+            )
+        )
+        mock_order_item_repository.create_bulk = AsyncMock(
+            return_value=[
+                OrderItemEntity(id=1, order_id=7, product_id=1, quantity=1, price=Decimal("50.00"))
+            ]
+        )
+
+        response = await order_service.create_order(
+            OrderInputDTO(items=[OrderItemInputDTO(product_id=1, quantity=1)])
+        )
+
+        assert response.id == 7
+        queue.enqueue_order.assert_awaited_once_with(7)
+
     @pytest.mark.asyncio
     async def test_create_order_with_empty_items_returns_422(
         self,
@@ -408,3 +455,198 @@ class TestOrderService:
         assert response.items[2].product_id == 3
         mock_order_repository.create.assert_called_once()
         mock_order_item_repository.create_bulk.assert_called_once()
+
+
+class TestOrderServiceTransitionStatuses:
+    """Testes para transições de status em lote."""
+
+    @pytest.mark.asyncio
+    async def test_transition_groups_updates_by_from_and_to_status(
+        self, order_service: OrderService, mock_order_repository
+    ):
+        """Testa que transições válidas são agrupadas por (status atual, status alvo)."""
+        mock_order_repository.get_statuses = AsyncMock(
+            return_value={1: "Pending", 2: "Pending", 3: "Processing"}
+        )
+        mock_order_repository.bulk_update_status = AsyncMock(return_value={1, 2, 3})
+        batch = OrderStatusBatchInputDTO(
+            transitions=[
+                OrderStatusTransitionInputDTO(order_id=1, status=OrderStatus.PROCESSING),
+                OrderStatusTransitionInputDTO(order_id=2, status=OrderStatus.PROCESSING),
+                OrderStatusTransitionInputDTO(order_id=3, status=OrderStatus.SHIPPED),
+            ]
+        )
+
+        response = await order_service.transition_order_statuses(batch)
+
+        assert response.applied == 3
+        assert response.rejected == 0
+        mock_order_repository.bulk_update_status.assert_called_once_with(
+            {("Pending", "Processing"): [1, 2], ("Processing", "Shipped"): [3]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_transition_rejects_invalid_and_unknown_orders(
+        self, order_service: OrderService, mock_order_repository
+    ):
+        """Testa que transições não permitidas e pedidos inexistentes não são aplicados."""
+        mock_order_repository.get_statuses = AsyncMock(return_value={1: "Shipped"})
+        mock_order_repository.bulk_update_status = AsyncMock(return_value=set())
+        batch = OrderStatusBatchInputDTO(
+            transitions=[
+                OrderStatusTransitionInputDTO(order_id=1, status=OrderStatus.PENDING),
+                OrderStatusTransitionInputDTO(order_id=99, status=OrderStatus.SHIPPED),
+            ]
+        )
+
+        response = await order_service.transition_order_statuses(batch)
+
+        assert response.applied == 0
+        assert response.rejected == 2
+        assert "não permitida" in response.results[0].reason
+        assert response.results[1].reason == "Pedido não encontrado"
+        mock_order_repository.bulk_update_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transition_reports_concurrent_changes(
+        self, order_service: OrderService, mock_order_repository
+    ):
+        """Testa que linhas alteradas concorrentemente são reportadas como não aplicadas."""
+        mock_order_repository.get_statuses = AsyncMock(return_value={1: "Pending", 2: "Pending"})
+        mock_order_repository.bulk_update_status = AsyncMock(return_value={1})
+        batch = OrderStatusBatchInputDTO(
+            transitions=[
+                OrderStatusTransitionInputDTO(order_id=1, status=OrderStatus.CANCELLED),
+                OrderStatusTransitionInputDTO(order_id=2, status=OrderStatus.CANCELLED),
+            ]
+        )
+
+        response = await order_service.transition_order_statuses(batch)
+
+        assert [result.applied for result in response.results] == [True, False]
+        assert response.results[1].reason == "Status do pedido alterado concorrentemente"
+
+    def test_batch_rejects_duplicated_order_ids(self):
+        """Testa que o mesmo pedido não pode aparecer duas vezes no lote."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            OrderStatusBatchInputDTO(
+                transitions=[
+                    OrderStatusTransitionInputDTO(order_id=1, status=OrderStatus.PROCESSING),
+                    OrderStatusTransitionInputDTO(order_id=1, status=OrderStatus.CANCELLED),
+                ]
+            )
+
+
+def _product(product_id: int, quantity: int) -> ProductEntity:
+    return ProductEntity(
+        id=product_id,
+        name=f"Produto {product_id}",
+        description="Descrição",
+        price=Decimal("10.00"),
+        quantity=quantity,
+    )
+
+
+def _bulk(*orders: list[tuple[int, int]]) -> OrderBulkInputDTO:
+    return OrderBulkInputDTO(
+        orders=[
+            OrderInputDTO(
+                items=[
+                    OrderItemInputDTO(product_id=product_id, quantity=quantity)
+                    for product_id, quantity in items
+                ]
+            )
+            for items in orders
+        ]
+    )
+
+
+async def _assign_ids(orders: list[OrderCompleteEntity]) -> list[OrderCompleteEntity]:
+    item_ids = iter(range(1, 1000))
+    for order_id, order in enumerate(orders, start=1):
+        order.id = order_id
+        for item in order.items:
+            item.id = next(item_ids)
+            item.order_id = order_id
+    return orders
+
+
+class TestOrderServiceCreateOrdersBulk:
+    """Testes para criação de pedidos em lote."""
+
+    @pytest.mark.asyncio
+    async def test_reads_products_once_and_reserves_aggregate_stock(
+        self, order_service: OrderService, mock_order_repository, mock_product_repository
+    ):
+        """Testa que produtos repetidos são lidos uma vez e o estoque é reservado somado."""
+        mock_product_repository.get_bulk_by_ids = AsyncMock(
+            return_value=[_product(1, 10), _product(2, 10)]
+        )
+        mock_product_repository.reserve_stock = AsyncMock(return_value={1, 2})
+        mock_order_repository.create_bulk = AsyncMock(side_effect=_assign_ids)
+
+        response = await order_service.create_orders_bulk(_bulk([(1, 2), (2, 1)], [(1, 3)]))
+
+        assert response.created == 2
+        assert response.failed == 0
+        mock_product_repository.get_bulk_by_ids.assert_called_once_with([1, 2])
+        mock_product_repository.reserve_stock.assert_called_once_with({1: 5, 2: 1})
+        assert response.results[0].order.total_amount == Decimal("30.00")
+        assert response.results[1].order.id == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_products_and_insufficient_stock_in_request_order(
+        self, order_service: OrderService, mock_order_repository, mock_product_repository
+    ):
+        """Testa que pedidos posteriores não consomem estoque já alocado aos anteriores."""
+        mock_product_repository.get_bulk_by_ids = AsyncMock(return_value=[_product(1, 5)])
+        mock_product_repository.reserve_stock = AsyncMock(return_value={1})
+        mock_order_repository.create_bulk = AsyncMock(side_effect=_assign_ids)
+
+        response = await order_service.create_orders_bulk(_bulk([(1, 4)], [(1, 2)], [(99, 1)]))
+
+        assert [result.created for result in response.results] == [True, False, False]
+        assert "Quantidade insuficiente" in response.results[1].reason
+        assert "não encontrado" in response.results[2].reason
+        mock_product_repository.reserve_stock.assert_called_once_with({1: 4})
+
+    @pytest.mark.asyncio
+    async def test_releases_excess_when_stock_is_lost_concurrently(
+        self, order_service: OrderService, mock_order_repository, mock_product_repository
+    ):
+        """Testa que pedidos sem reserva falham e o estoque reservado a mais é devolvido."""
+        mock_product_repository.get_bulk_by_ids = AsyncMock(
+            return_value=[_product(1, 10), _product(2, 10)]
+        )
+        mock_product_repository.reserve_stock = AsyncMock(return_value={1})
+        mock_product_repository.release_stock = AsyncMock()
+        mock_order_repository.create_bulk = AsyncMock(side_effect=_assign_ids)
+
+        response = await order_service.create_orders_bulk(_bulk([(1, 2)], [(1, 3), (2, 1)]))
+
+        assert [result.created for result in response.results] == [True, False]
+        assert "concorrentemente" in response.results[1].reason
+        mock_product_repository.release_stock.assert_called_once_with({1: 3})
+
+    @pytest.mark.asyncio
+    async def test_releases_reservation_when_insert_fails(
+        self, order_service: OrderService, mock_order_repository, mock_product_repository
+    ):
+        """Testa que a reserva é desfeita quando a gravação dos pedidos falha."""
+        mock_product_repository.get_bulk_by_ids = AsyncMock(return_value=[_product(1, 10)])
+        mock_product_repository.reserve_stock = AsyncMock(return_value={1})
+        mock_product_repository.release_stock = AsyncMock()
+        mock_order_repository.create_bulk = AsyncMock(
+            side_effect=ApplicationException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                message="Erro BD ao criar pedidos em lote",
+            )
+        )
+
+        with pytest.raises(ApplicationException) as exc:
+            await order_service.create_orders_bulk(_bulk([(1, 2)]))
+
+        assert exc.value.message == "Erro BD ao criar pedidos em lote"
+        mock_product_repository.release_stock.assert_called_once_with({1: 2})
@@ -8,6 +8,7 @@ from fastapi import status
 from app.application.dtos.product_dto import ProductResponseDTO
 from app.application.services.product_service import ProductService
 from app.core.exceptions import ApplicationException
+from app.presentation.schemas.product_schema import UpdateProductInput
 
 
 class TestProductServiceGetAllProducts:
@@ -28,7 +29,7 @@ class TestProductServiceGetAllProducts:
         assert result[0].name == product_entity_list[0].name
         assert result[1].name == product_entity_list[1].name
         assert result[2].name == product_entity_list[2].name
-        mock_repository.get_all.assert_called_once_with(skip=0, limit=10)
+        mock_repository.get_all.assert_called_once_with(skip=0, limit=10, fields=None)
 
     @pytest.mark.asyncio
     async def test_get_all_products_with_custom_pagination(self, product_entity_list):
@@ -45,7 +46,7 @@ class TestProductServiceGetAllProducts:
         # Assert
         assert len(result) == 1
         assert isinstance(result[0], ProductResponseDTO)
-        mock_repository.get_all.assert_called_once_with(skip=5, limit=20)
+        mock_repository.get_all.assert_called_once_with(skip=5, limit=20, fields=None)
 
     @pytest.mark.asyncio
     async def test_get_all_products_returns_empty_list_when_no_products(self):
@@ -61,7 +62,7 @@ class TestProductServiceGetAllProducts:
         # Assert
         assert result == []
         assert isinstance(result, list)
-        mock_repository.get_all.assert_called_once_with(skip=0, limit=10)
+        mock_repository.get_all.assert_called_once_with(skip=0, limit=10, fields=None)
 
     @pytest.mark.asyncio
     async def test_get_all_products_converts_entities_to_dtos(self, product_entity):
@@ -116,7 +117,7 @@ class TestProductServiceGetAllProducts:
         # Assert
         assert len(result) == 3
         # Verify the repository was called with default values
-        mock_repository.get_all.assert_called_once_with(skip=0, limit=10)
+        mock_repository.get_all.assert_called_once_with(skip=0, limit=10, fields=None)
 
     @pytest.mark.asyncio
     async def test_get_all_products_maintains_product_price_as_decimal(self, product_entity_list):
@@ -165,7 +166,7 @@ class TestProductServiceGetAllProducts:
         await service.get_all_products(skip=10, limit=5)
 
         # Assert
-        mock_repository.get_all.assert_called_once_with(skip=10, limit=5)
+        mock_repository.get_all.assert_called_once_with(skip=10, limit=5, fields=None)
 
     @pytest.mark.asyncio
     async def test_get_all_products_multiple_calls_independent(self, product_entity_list):
@@ -189,3 +190,84 @@ class TestProductServiceGetAllProducts:
         assert len(result2) == 1
         assert len(result3) == 0
         assert mock_repository.get_all.call_count == 3
+
+
+class TestProductServicePatchProduct:
+    @pytest.mark.asyncio
+    async def test_patch_product_bumps_updated_at(self, product_entity):
+        # Arrange
+        previous_updated_at = product_entity.updated_at
+        mock_repository = AsyncMock()
+        mock_repository.get_by_id.return_value = product_entity
+        mock_repository.update.side_effect = lambda product: product
+
+        service = ProductService(product_repository=mock_repository)
+        body = UpdateProductInput(name="Novo nome")
+
+        # Act
+        result = await service.patch_product_by_id(1, body)
+
+        # Assert
+        assert result.name == "Novo nome"
+        assert result.updated_at > previous_updated_at
+
+
+class TestProductServiceGetProductById:
+    @pytest.mark.asyncio
+    async def test_get_product_by_id_propagates_application_exception(self):
+        # Arrange
+        mock_repository = AsyncMock()
+        mock_repository.get_by_id.side_effect = ApplicationException(
+            message="Erro ao buscar produto 1", status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+        service = ProductService(product_repository=mock_repository)
+
+        # Act & Assert
+        with pytest.raises(ApplicationException) as exc_info:
+            await service.get_product_by_id(1)
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert exc_info.value.message == "Erro ao buscar produto 1"
+
+
+class TestProductServiceGetProductsByIds:
+    @pytest.mark.asyncio
+    async def test_returns_products_in_requested_order_and_missing_ids(self, product_entity_list):
+        # Arrange
+        mock_repository = AsyncMock()
+        mock_repository.get_bulk_by_ids.return_value = product_entity_list
+
+        service = ProductService(product_repository=mock_repository)
+
+        # Act
+        result = await service.get_products_by_ids([3, 99, 1, 3, 2])
+
+        # Assert
+        mock_repository.get_bulk_by_ids.assert_awaited_once_with([3, 99, 1, 2])
+        assert [product.id for product in result.products] == [3, 1, 2]
+        assert result.missing_ids == [99]
+
+    @pytest.mark.asyncio
+    async def test_rejects_more_ids_than_the_cap(self):
+        # Arrange
+        mock_repository = AsyncMock()
+        service = ProductService(product_repository=mock_repository, max_batch_ids=2)
+
+        # Act & Assert
+        with pytest.raises(ApplicationException) as exc_info:
+            await service.get_products_by_ids([1, 2, 3])
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        mock_repository.get_bulk_by_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_id_list(self):
+        # Arrange
+        service = ProductService(product_repository=AsyncMock())
+
+        # Act & Assert
+        with pytest.raises(ApplicationException) as exc_info:
+            await service.get_products_by_ids([])
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,140 @@
+"""
+Benchmark de memória: bytes por pedido com itens, entidades com __dict__ x com __slots__.
+
+As classes "antes" reproduzem as entidades originais (atributos em __dict__ por instância);
+as "depois" são as entidades de `app.domain.entities`. A memória é medida com tracemalloc,
+construindo N pedidos completos como o repositório faz ao carregar uma listagem.
+
+Uso:
+    python -m benchmarks.memory_benchmark [--orders 10000] [--items 5]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app.domain.entities.order_entity import OrderCompleteEntity
+from app.domain.entities.order_item_entity import OrderItemEntity
+from app.domain.entities.product_entity import ProductEntity
+
+
+class _DictOrderItemEntity:
+    def __init__(self, id=None, product_id=None, order_id=None, quantity=None, price=None):
+        self.id = id or None
+        self.product_id = product_id or None
+        self.order_id = order_id or None
+        self.quantity = quantity
+        self.price = price
+
+
+class _DictOrderEntity:
+    def __init__(self, id=None, order_date=None, status=None, total_amount=None):
+        self.id = id or None
+        self.order_date = order_date
+        self.status = status
+        self.total_amount = total_amount
+
+
+class _DictOrderCompleteEntity(_DictOrderEntity):
+    def __init__(self, id=None, order_date=None, status=None, total_amount=None, items=None):
+        super().__init__(id, order_date, status, total_amount)
+        self.items = items or []
+
+
+class _DictProductEntity:
+    def __init__(
+        self, name, description, price, quantity, id=None, created_at=None, updated_at=None
+    ):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.price = price
+        self.quantity = quantity
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+def _build_orders(order_cls, item_cls, orders: int, items: int) -> list:
+    base = datetime(2025, 1, 1)
+    return [
+        order_cls(
+            id=order_id,
+            order_date=base + timedelta(seconds=order_id),
+            status="Pending",
+            total_amount=float(order_id),
+            items=[
+                item_cls(
+                    id=order_id * items + n,
+                    product_id=n + 1,
+                    order_id=order_id,
+                    quantity=n + 1,
+                    price=float(n) + 0.99,
+                )
+                for n in range(items)
+            ],
+        )
+        for order_id in range(1, orders + 1)
+    ]
+
+
+def _build_products(product_cls, count: int) -> list:
+    now = datetime(2025, 1, 1)
+    return [
+        product_cls(
+            id=i,
+            name=f"Produto {i}",
+            description="Descrição",
+            price=Decimal("9.99"),
+            quantity=i,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _measure(build, count: int) -> float:
+    """Bytes alocados por unidade, mantendo os objetos vivos durante a medição"""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--items", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = {
+        f"pedido com {args.items} itens": (
+            args.orders,
+            lambda: _build_orders(
+                _DictOrderCompleteEntity, _DictOrderItemEntity, args.orders, args.items
+            ),
+            lambda: _build_orders(OrderCompleteEntity, OrderItemEntity, args.orders, args.items),
+        ),
+        "produto": (
+            args.orders,
+            lambda: _build_products(_DictProductEntity, args.orders),
+            lambda: _build_products(ProductEntity, args.orders),
+        ),
+    }
+    print(f"{'objeto':<20} {'__dict__':>12} {'__slots__':>12} {'redução':>8}")
+    for name, (count, before, after) in cases.items():
+        bytes_before = _measure(before, count)
+        bytes_after = _measure(after, count)
+        print(
+            f"{name:<20} {bytes_before:>10.0f} B {bytes_after:>10.0f} B "
+            f"{1 - bytes_after / bytes_before:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark de serialização da listagem de produtos.
+
+Para páginas de tamanhos diferentes, compara JSONResponse (json.dumps) x ORJSONResponse em:
+
+- render: só a codificação do conteúdo já preparado pelo response_model;
+- endpoint: a rota completa (validação do response_model + codificação), chamada via ASGI.
+
+E o caminho validado (entidade -> DTO -> ProductOutput com from_attributes) x a
+serialização direta das entidades (`app.presentation.serializers`).
+
+Uso:
+    python -m benchmarks.serialization_benchmark [--rounds 200]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.application.dtos.product_dto import ProductResponseDTO
+from app.application.services.product_service import ProductService
+from app.domain.entities.product_entity import ProductEntity
+from app.presentation.responses import ORJSONResponse
+from app.presentation.schemas.product_schema import ProductOutput
+from app.presentation.serializers import dump_products_json
+
+PAGE_SIZES = (10, 100, 1000)
+
+
+def _entities(count: int) -> list[ProductEntity]:
+    now = datetime.utcnow()
+    return [
+        ProductEntity(
+            id=i,
+            name=f"Produto {i}",
+            description=f"Descrição do produto {i}",
+            price=Decimal(f"{i}.99"),
+            quantity=i % 50,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _products(count: int) -> list[ProductResponseDTO]:
+    service = ProductService(product_repository=None)
+    return [service._to_response_dto(entity) for entity in _entities(count)]
+
+
+def _build_app(response_class: type[JSONResponse], products: list[ProductResponseDTO]) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+
+    @app.get("/products", response_model=list[ProductOutput])
+    async def list_products():
+        return products
+
+    return app
+
+
+def _time_per_call(fn, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds
+
+
+async def _time_endpoint(app: FastAPI, rounds: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/products")
+        started = time.perf_counter()
+        for _ in range(rounds):
+            await client.get("/products")
+        return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(list[ProductOutput])
+    print(f"{'itens':>6} {'etapa':<9} {'json.dumps':>12} {'orjson':>12} {'ganho':>7}")
+    for size in PAGE_SIZES:
+        products = _products(size)
+        content = adapter.dump_python(
+            adapter.validate_python(products, from_attributes=True), mode="json"
+        )
+        assert JSONResponse(content).body == ORJSONResponse(content).body
+
+        rounds = max(args.rounds * 10 // size, 5)
+        results = {
+            "render": [
+                _time_per_call(lambda: response_class(content), rounds)
+                for response_class in (JSONResponse, ORJSONResponse)
+            ],
+            "endpoint": [
+                asyncio.run(_time_endpoint(_build_app(response_class, products), rounds))
+                for response_class in (JSONResponse, ORJSONResponse)
+            ],
+        }
+        for stage, (baseline, optimized) in results.items():
+            print(
+                f"{size:>6} {stage:<9} {baseline * 1e6:>10.1f}us {optimized * 1e6:>10.1f}us "
+                f"{baseline / optimized:>6.2f}x"
+            )
+
+    print(f"\n{'itens':>6} {'validado':>12} {'direto':>12} {'ganho':>7}")
+    service = ProductService(product_repository=None)
+    for size in PAGE_SIZES:
+        entities = _entities(size)
+
+        def validated():
+            dtos = [service._to_response_dto(entity) for entity in entities]
+            return adapter.dump_json(adapter.validate_python(dtos, from_attributes=True))
+
+        assert validated() == dump_products_json(entities)
+        rounds = max(args.rounds * 10 // size, 5)
+        baseline = _time_per_call(validated, rounds)
+        optimized = _time_per_call(lambda: dump_products_json(entities), rounds)
+        print(
+            f"{size:>6} {baseline * 1e6:>10.1f}us {optimized * 1e6:>10.1f}us "
+            f"{baseline / optimized:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()